@@ -5,49 +5,77 @@ import copy
 from data.trainer_teams import OLGA_TEAM
 from utils.SpriteManager import SpriteManager
 from utils.ProfileManager import ProfileManager
+from utils.Timeline import Timeline
+from utils.AnimationClock import AnimationClock
+from utils.GameClock import GameClock
+from utils.FrameRecorder import FrameRecorder
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.BattleHistory import BattleHistory
+from utils.FrameProfiler import FrameProfiler
+from utils.Log import Log
+from utils.Metrics import Metrics
+
+try:
+    from utils.ParticleSystem import ParticleSystem
+except ImportError:  # NumPy absent : pas de neige
+    ParticleSystem = None
+
+class OlgaArena(Scene):
+    TRAINER_SPRITE = "src/assets/olga.png"
+    BACKGROUND = "src/assets/ice2_background.jpg"
+    MUSIC = "src/assets/sounds/111_battlezik.wav"
+    ATTACK_SOUNDS = [
+        "src/assets/sounds/008-0_ice_punch.wav",
+        "src/assets/sounds/055-0_water_gun.wav",
+        "src/assets/sounds/072-0_mega_drain.wav"
+    ]
+
+    @staticmethod
+    def load_jobs(screen, player_team):
+        """Ressources de l'arène pour l'écran de chargement (sprites de toute l'équipe inclus)"""
+        owner = OlgaArena.__name__
+        sprite_manager = SpriteManager(owner)
+        jobs = [
+            AssetManager.image_job(OlgaArena.TRAINER_SPRITE, (300, 450), alpha=True, owner=owner),
+            AssetManager.image_job(OlgaArena.BACKGROUND, screen.get_size(), owner=owner),
+            AssetManager.sound_job(OlgaArena.MUSIC, owner)
+        ]
+        jobs += [AssetManager.sound_job(path, owner) for path in OlgaArena.ATTACK_SOUNDS]
+        jobs += [sprite_manager.sprite_job(pokemon["name"], animated=True, is_back=True) for pokemon in player_team]
+        jobs += [sprite_manager.sprite_job(pokemon["name"], animated=True) for pokemon in OLGA_TEAM]
+        return jobs
 
-class OlgaArena:
     def __init__(self, screen, player_team):
         # Initialisation de base
-        self.screen = screen
+        super().__init__(screen)
         self.current_width = screen.get_width()
         self.current_height = screen.get_height()
         
-        # Équipes
-        self.player_team = player_team
-        self.opponent_team = copy.deepcopy(OLGA_TEAM)
-        
-        # Debug: vérifier les PV
-        for pokemon in self.opponent_team:
-            print(f"PV de {pokemon['name']}: {pokemon['current_hp']}/{pokemon['max_hp']}")
-        
-        # États du combat
-        self.current_pokemon = 0
-        self.opponent_pokemon = 0
-        self.battle_state = "INTRO"
-        self.battle_menu_state = "MAIN"
-        self.selected_option = 0
-        self.selected_move = 0
-        
         # Menu de combat (en bas de l'écran)
         self.menu_options = ["ATTAQUE", "POKEMON", "SAC", "FUITE"]
         self.menu_rect = pygame.Rect(0, self.current_height - 150, self.current_width, 150)  # Ajout ici !
         
-        # Sprite Manager
-        self.sprite_manager = SpriteManager()
+        # Mise en page relative à la taille logique de l'écran
+        self.menu_column_width = min(400, self.current_width // 2 - 50)
+        self.menu_row_height = 50
+        self.hp_bar_width = 300
+        self.player_bar_pos = (50, int(self.current_height * 0.4))
+        self.opponent_bar_pos = (int(self.current_width * 0.29), int(self.current_height * 0.2))
         
-        # État de l'intro
-        self.intro_state = "TRAINER_APPEAR"
-        self.intro_timer = pygame.time.get_ticks()
+        # Sprite Manager (sprites animés libérés avec la scène)
+        self.sprite_manager = SpriteManager(self.asset_owner)
+        
+        # Durée de chaque étape de l'intro
         self.intro_duration = 2000
         
         # Charger le sprite d'Olga
         try:
-            self.trainer_sprite = pygame.image.load("src/assets/olga.png").convert_alpha()
-            self.trainer_sprite = pygame.transform.scale(self.trainer_sprite, (300, 450))
-            print("Sprite d'Olga chargé avec succès")
+            self.trainer_sprite = AssetManager.image(OlgaArena.TRAINER_SPRITE, (300, 450), alpha=True,
+                                                     owner=self.asset_owner)
+            Log.debug("ressources", "Sprite d'Olga chargé")
         except Exception as e:
-            print(f"Erreur lors du chargement du sprite d'Olga: {e}")
+            Log.error("ressources", "Erreur lors du chargement du sprite d'Olga: {}", e)
             self.trainer_sprite = None
         
         # Position d'Olga
@@ -58,16 +86,11 @@ class OlgaArena:
         self.opponent_pokemon_pos = (3*self.current_width//4, 200)
         
         # Initialiser le son
-        self.battle_music = pygame.mixer.Sound("src/assets/sounds/111_battlezik.wav")
+        self.battle_music = AssetManager.sound(OlgaArena.MUSIC, self.asset_owner)
         self.battle_music_channel = None
         
-        # Message de fuite
-        self.escape_message = None
-        self.message_timer = 0
-        self.message_duration = 2000
-        
-        # Charger les sprites des Pokémon
-        self.load_pokemon_sprites()  # Maintenant ça devrait marcher !
+        # Enregistrement du combat (activé par --record-battles ou F9)
+        self.recorder = None
         
         # Couleurs
         self.WHITE = (255, 255, 255)
@@ -77,51 +100,99 @@ class OlgaArena:
         self.ICE_BLUE = (150, 200, 255)
         
         # Police
+        font_path = "src/assets/fonts/pokemon.ttf"
+        self.font = AssetManager.font(font_path, 36, self.asset_owner)
+        self.olga_font = AssetManager.font(font_path, 48, self.asset_owner)
+        self.hp_font = AssetManager.font(font_path, 42, self.asset_owner)  # Police plus grande pour les PV
+        
+        # Durée d'affichage des messages (1.5 secondes)
+        self.message_duration = 1500
+        
+        # Animation d'attaque
+        self.attack_animation_duration = 1000  # 1 seconde pour l'animation complète
+        self.animation_speed = 1.0  # Accélère (>1) ou ralentit (<1) les animations
+        
+        # Ajouter les sons d'attaque (sans fire blast)
+        self.attack_sounds = [AssetManager.sound(path, self.asset_owner) for path in OlgaArena.ATTACK_SOUNDS]
+        
+        # Charger le fond d'arène glaciaire
         try:
-            font_path = "src/assets/fonts/pokemon.ttf"
-            self.font = pygame.font.Font(font_path, 36)
-            self.olga_font = pygame.font.Font(font_path, 48)
-            self.hp_font = pygame.font.Font(font_path, 42)  # Police plus grande pour les PV
-        except:
-            self.font = pygame.font.Font(None, 36)
-            self.olga_font = pygame.font.Font(None, 48)
-            self.hp_font = pygame.font.Font(None, 42)
-        
-        # Animation des sprites
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.animation_delay = 200  # Délai entre les frames en millisecondes
-        
-        # Ajouter des variables pour gérer les messages de tour
+            self.arena_background = AssetManager.image(OlgaArena.BACKGROUND,
+                                                       (self.current_width, self.current_height),
+                                                       owner=self.asset_owner)
+            Log.debug("ressources", "Fond d'arène glaciaire chargé")
+        except Exception as e:
+            Log.error("ressources", "Erreur lors du chargement du fond d'arène: {}", e)
+            self.arena_background = None
+        
+        # Neige qui tombe sur l'arène
+        self.snow = None
+        if ParticleSystem:
+            self.snow = ParticleSystem(4000, [(255, 255, 255), (220, 235, 255)], sizes=(1, 2, 3),
+                                       alpha_levels=2, gravity=(0, 15))
+        
+        self.set_team(player_team)
+    
+    def set_team(self, player_team):
+        """Prépare un nouveau combat (l'instance et ses ressources sont réutilisées d'un combat à l'autre)"""
+        # Équipes
+        self.player_team = copy.deepcopy(player_team)  # Les PV perdus ne modifient pas le profil en cache
+        self.opponent_team = copy.deepcopy(OLGA_TEAM)
+        
+        # Debug: vérifier les PV
+        for pokemon in self.opponent_team:
+            Log.debug("combat", "PV de {}: {}/{}", pokemon['name'], pokemon['current_hp'], pokemon['max_hp'])
+        
+        # États du combat
+        self.current_pokemon = 0
+        self.opponent_pokemon = 0
+        self.battle_state = "INTRO"
+        self.battle_menu_state = "MAIN"
+        self.selected_option = 0
+        self.selected_move = 0
+        self.battle_result = None
+        self.battle_log = BattleHistory.start("Olga", self.player_team, self.opponent_team)
+        Metrics.count("battles.started")
+        
+        # État de l'intro
+        self.intro_state = "TRAINER_APPEAR"
+        self.intro_timer = GameClock.ticks()
+        
+        # Messages de fuite et de tour
+        self.escape_message = None
         self.battle_message = None
-        self.message_timer = pygame.time.get_ticks()
-        self.message_duration = 1500  # Durée d'affichage des messages (1.5 secondes)
+        self.message_timer = GameClock.ticks()
         self.waiting_for_opponent = False  # Pour gérer le tour de l'adversaire
         
-        # Ajouter des variables pour l'animation d'attaque
+        # Animation d'attaque
         self.attacking = False
-        self.attack_animation_start = 0
-        self.attack_animation_duration = 1000  # 1 seconde pour l'animation complète
+        self.attack_timeline = None
         self.attacker_original_pos = None
         self.attack_target_pos = None
         self.current_attacker_pos = None
         self.is_player_attacking = False
         
-        # Ajouter les sons d'attaque (sans fire blast)
-        self.attack_sounds = [
-            pygame.mixer.Sound("src/assets/sounds/008-0_ice_punch.wav"),
-            pygame.mixer.Sound("src/assets/sounds/055-0_water_gun.wav"),
-            pygame.mixer.Sound("src/assets/sounds/072-0_mega_drain.wav")
-        ]
-        
-        # Charger le fond d'arène glaciaire
-        try:
-            self.arena_background = pygame.image.load("src/assets/ice2_background.jpg").convert()
-            self.arena_background = pygame.transform.scale(self.arena_background, (self.current_width, self.current_height))
-            print("Fond d'arène glaciaire chargé avec succès")
-        except Exception as e:
-            print(f"Erreur lors du chargement du fond d'arène: {e}")
-            self.arena_background = None
+        # Charger les sprites des Pokémon
+        self.load_pokemon_sprites()
+        
+        if self.snow:
+            # Pré-remplir l'écran pour ne pas commencer avec un ciel vide
+            self.snow.clear()
+            self.snow.emit(1500, self.current_width//2, self.current_height//2,
+                           spread=(self.current_width//2, self.current_height//2),
+                           velocity=((-20, 20), (40, 90)), life=(2.0, 8.0))
+    
+    def update_snow(self, dt):
+        """Anime la neige (dt en millisecondes)"""
+        seconds = min(0.1, dt / 1000)
+        # Les flocons naissent au-dessus de l'écran et vivent le temps de le traverser
+        self.snow.emit_rate(250, seconds, self.current_width//2, -10, spread=(self.current_width//2, 0),
+                            velocity=((-20, 20), (40, 90)), life=(8.0, 14.0))
+        self.snow.update(seconds)
+    
+    def draw_snow(self):
+        if self.snow:
+            self.snow.draw(self.screen)
     
     def load_pokemon_sprites(self):
         """Charge les sprites des Pokémon actuels"""
@@ -134,152 +205,76 @@ class OlgaArena:
             animated=True,
             is_back=True  # Remis à True pour avoir le Pokémon de dos
         )
-        print(f"Sprite joueur chargé: {self.player_sprite}")  # Debug
+        Log.debug("sprites", "Sprite joueur chargé: {}", player_pokemon["name"])
         
         self.opponent_sprite = self.sprite_manager.get_sprite(
             opponent_pokemon["name"],
             animated=True,
             is_back=False
         )
-        print(f"Sprite adversaire chargé: {self.opponent_sprite}")  # Debug
+        Log.debug("sprites", "Sprite adversaire chargé: {}", opponent_pokemon["name"])
     
     def draw_battle(self):
         """Affiche l'écran de combat"""
         # Afficher le fond
-        if self.arena_background:
-            self.screen.blit(self.arena_background, (0, 0))
-        else:
-            self.screen.fill(self.ICE_BLUE)  # Fallback au cas où l'image ne charge pas
+        with FrameProfiler.span("fond"):
+            if self.arena_background:
+                self.screen.blit(self.arena_background, (0, 0))
+            else:
+                self.screen.fill(self.ICE_BLUE)  # Fallback au cas où l'image ne charge pas
+        with FrameProfiler.span("neige"):
+            self.draw_snow()
         
         # Supprimer le rectangle de terrain car on a maintenant un beau fond
-        # pygame.draw.rect(self.screen, (180, 210, 235), (0, self.current_height//2 - 100, self.current_width, 200))
-        
-        # Animer les sprites
-        current_time = pygame.time.get_ticks()
-        if current_time - self.animation_timer > self.animation_delay:
-            self.animation_frame = (self.animation_frame + 1) % 2
-            self.animation_timer = current_time
-        
-        if self.attacking:
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.attack_animation_start
-            progress = min(1.0, elapsed / self.attack_animation_duration)
-            
-            if progress < 0.25:  # Aller vers la cible
-                t = progress * 4
-                x = self.attacker_original_pos[0] + (self.attack_target_pos[0] - self.attacker_original_pos[0]) * t
-                y = self.attacker_original_pos[1] + (self.attack_target_pos[1] - self.attacker_original_pos[1]) * t
-                self.current_attacker_pos = (x, y)
-            elif progress < 0.5:  # Rester sur place pour "frapper"
-                self.current_attacker_pos = self.attack_target_pos
-                # Jouer un son d'attaque aléatoire au moment de l'impact
-                if progress < 0.38:  # Pour ne jouer le son qu'une fois
-                    random.choice(self.attack_sounds).play()
-            elif progress < 0.75:  # Retourner à la position initiale
-                t = (progress - 0.5) * 4
-                x = self.attack_target_pos[0] + (self.attacker_original_pos[0] - self.attack_target_pos[0]) * t
-                y = self.attack_target_pos[1] + (self.attacker_original_pos[1] - self.attack_target_pos[1]) * t
-                self.current_attacker_pos = (x, y)
-            else:  # Animation terminée
-                self.current_attacker_pos = self.attacker_original_pos
-                self.attacking = False
-                
-                # Appliquer les dégâts après l'animation
-                if self.is_player_attacking:
-                    # Dégâts du joueur
-                    player_pokemon = self.player_team[self.current_pokemon]
-                    opponent_pokemon = self.opponent_team[self.opponent_pokemon]
-                    damage = self.calculate_damage(self.current_move, player_pokemon, opponent_pokemon)
-                    opponent_pokemon["current_hp"] = max(0, opponent_pokemon["current_hp"] - damage)
-                    
-                    # Vérifier si le Pokémon adverse est K.O.
-                    if opponent_pokemon["current_hp"] <= 0:
-                        self.battle_message = f"{opponent_pokemon['name']} est K.O. !"
-                        if self.opponent_pokemon + 1 < len(self.opponent_team):
-                            self.opponent_pokemon += 1
-                            self.load_pokemon_sprites()
-                        else:
-                            self.show_battle_end("VICTORY")
-                            return
-                    
-                    # Passer au tour d'Olga
-                    self.waiting_for_opponent = True
-                    self.message_timer = pygame.time.get_ticks()
-                    self.battle_message = "Au tour d'Olga !"
-                else:
-                    # Dégâts d'Olga
-                    opponent_pokemon = self.opponent_team[self.opponent_pokemon]
-                    player_pokemon = self.player_team[self.current_pokemon]
-                    damage = self.calculate_damage(self.current_move, opponent_pokemon, player_pokemon)
-                    player_pokemon["current_hp"] = max(0, player_pokemon["current_hp"] - damage)
-                    
-                    # Vérifier si notre Pokémon est K.O.
-                    if player_pokemon["current_hp"] <= 0:
-                        self.battle_message = f"{player_pokemon['name']} est K.O. !"
-                        # Chercher le prochain Pokémon non K.O.
-                        next_pokemon_found = False
-                        for i in range(self.current_pokemon + 1, len(self.player_team)):
-                            if self.player_team[i]["current_hp"] > 0:
-                                self.current_pokemon = i
-                                next_pokemon_found = True
-                                self.battle_message = f"À toi, {self.player_team[i]['name']} !"
-                                self.load_pokemon_sprites()
-                                break
-                        
-                        if not next_pokemon_found:
-                            self.show_battle_end("DEFEAT")
-                            return
-                    
-                    # Retour au menu principal
-                    self.battle_menu_state = "MAIN"
-                    self.selected_move = 0
+        # self.screen.draw_rect((180, 210, 235), (0, self.current_height//2 - 100, self.current_width, 200))
+        
+        current_time = GameClock.ticks()
         
         # Dessiner les sprites à leur position actuelle
-        if self.attacking:
-            if self.is_player_attacking:
-                # Si c'est le joueur qui attaque
-                self.draw_pokemon_sprite(self.opponent_sprite, self.opponent_pokemon_pos, False)
-                self.draw_pokemon_sprite(self.player_sprite, self.current_attacker_pos, True)
+        with FrameProfiler.span("sprites"):
+            if self.attacking:
+                if self.is_player_attacking:
+                    # Si c'est le joueur qui attaque
+                    self.draw_pokemon_sprite(self.opponent_sprite, self.opponent_pokemon_pos, False)
+                    self.draw_pokemon_sprite(self.player_sprite, self.current_attacker_pos, True)
+                else:
+                    # Si c'est Olga qui attaque
+                    self.draw_pokemon_sprite(self.player_sprite, self.player_pokemon_pos, True)
+                    self.draw_pokemon_sprite(self.opponent_sprite, self.current_attacker_pos, False)
             else:
-                # Si c'est Olga qui attaque
+                # Position normale
                 self.draw_pokemon_sprite(self.player_sprite, self.player_pokemon_pos, True)
-                self.draw_pokemon_sprite(self.opponent_sprite, self.current_attacker_pos, False)
-        else:
-            # Position normale
-            self.draw_pokemon_sprite(self.player_sprite, self.player_pokemon_pos, True)
-            self.draw_pokemon_sprite(self.opponent_sprite, self.opponent_pokemon_pos, False)
+                self.draw_pokemon_sprite(self.opponent_sprite, self.opponent_pokemon_pos, False)
         
         # Menu de combat et barres de vie
-        self.draw_battle_menu()
-        self.draw_health_bars()
+        with FrameProfiler.span("menu de combat"):
+            self.draw_battle_menu()
+        with FrameProfiler.span("barres de vie"):
+            self.draw_health_bars()
         
         # Afficher le message de fuite s'il existe
         if self.escape_message and current_time - self.message_timer < self.message_duration:
-            # Créer une surface semi-transparente pour le fond du message
-            message_surface = pygame.Surface((self.current_width, 100))
-            message_surface.set_alpha(200)
-            message_surface.fill((0, 0, 0))  # Fond noir
-            self.screen.blit(message_surface, (0, self.current_height//2 - 50))
-            
-            # Afficher le message
-            text = self.font.render(self.escape_message, True, (255, 255, 255))  # Texte blanc
-            text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2))
-            self.screen.blit(text, text_rect)
+            with FrameProfiler.span("messages"):
+                # Fond noir semi-transparent pour le message
+                self.screen.fill_alpha((0, 0, 0, 200), (0, self.current_height//2 - 50, self.current_width, 100))
+                
+                # Afficher le message
+                text = self.screen.text(self.font, self.escape_message, (255, 255, 255))  # Texte blanc
+                text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2))
+                self.screen.blit(text, text_rect)
         elif self.escape_message:
             self.escape_message = None  # Effacer le message après la durée
         
         # Afficher le message de combat
         if self.battle_message and current_time - self.message_timer < self.message_duration:
-            # Fond semi-transparent pour le message
-            message_surface = pygame.Surface((self.current_width, 100))
-            message_surface.set_alpha(200)
-            message_surface.fill((0, 0, 0))
-            self.screen.blit(message_surface, (0, self.current_height//2 - 50))
-            
-            # Afficher le message
-            text = self.font.render(self.battle_message, True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2))
-            self.screen.blit(text, text_rect)
+            with FrameProfiler.span("messages"):
+                # Fond semi-transparent pour le message
+                self.screen.fill_alpha((0, 0, 0, 200), (0, self.current_height//2 - 50, self.current_width, 100))
+                
+                # Afficher le message
+                text = self.screen.text(self.font, self.battle_message, (255, 255, 255))
+                text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2))
+                self.screen.blit(text, text_rect)
         elif self.waiting_for_opponent and current_time - self.message_timer > self.message_duration:
             # Exécuter le tour de l'adversaire après l'affichage du message
             self.opponent_turn()
@@ -287,56 +282,147 @@ class OlgaArena:
             self.battle_menu_state = "MAIN"
             self.selected_move = 0
     
+    def start_attack_animation(self, attacker_pos, target_pos):
+        """Lance l'animation d'attaque : élan, impact puis retour"""
+        self.attacking = True
+        self.attacker_original_pos = attacker_pos
+        self.attack_target_pos = target_pos
+        self.current_attacker_pos = attacker_pos
+        
+        # Durées reprises de l'ancienne animation (1 seconde, retour terminé à 75 %)
+        phase = self.attack_animation_duration / 4
+        self.attack_timeline = Timeline(time_scale=self.animation_speed)
+        self.attack_timeline.tween(phase, attacker_pos, target_pos, self.set_attacker_pos, "ease_in_quad")
+        self.attack_timeline.call(self.play_attack_sound)  # Impact : le son n'est joué qu'une fois
+        self.attack_timeline.wait(phase)
+        self.attack_timeline.tween(phase, target_pos, attacker_pos, self.set_attacker_pos, "ease_out_quad")
+        self.attack_timeline.call(self.finish_attack)
+    
+    def set_attacker_pos(self, pos):
+        self.current_attacker_pos = pos
+    
+    def play_attack_sound(self):
+        random.choice(self.attack_sounds).play()
+    
+    def update(self, dt):
+        """Fait avancer les animations de `dt` millisecondes (horloge de la boucle)"""
+        timeline = self.attack_timeline
+        if timeline and timeline.update(dt) and self.attack_timeline is timeline:
+            self.attack_timeline = None
+        if self.snow:
+            self.update_snow(dt)
+    
+    def finish_attack(self):
+        """Fin de l'animation d'attaque : applique les dégâts"""
+        self.current_attacker_pos = self.attacker_original_pos
+        self.attacking = False
+        
+        if self.is_player_attacking:
+            # Dégâts du joueur
+            player_pokemon = self.player_team[self.current_pokemon]
+            opponent_pokemon = self.opponent_team[self.opponent_pokemon]
+            damage = self.calculate_damage(self.current_move, player_pokemon, opponent_pokemon)
+            opponent_pokemon["current_hp"] = max(0, opponent_pokemon["current_hp"] - damage)
+            if self.battle_log:
+                self.battle_log.attack("player", player_pokemon["name"], self.current_move["name"],
+                                       damage, opponent_pokemon["current_hp"] <= 0)
+            
+            # Vérifier si le Pokémon adverse est K.O.
+            if opponent_pokemon["current_hp"] <= 0:
+                self.battle_message = f"{opponent_pokemon['name']} est K.O. !"
+                if self.opponent_pokemon + 1 < len(self.opponent_team):
+                    self.opponent_pokemon += 1
+                    self.load_pokemon_sprites()
+                else:
+                    self.show_battle_end("VICTORY")
+                    return
+            
+            # Passer au tour d'Olga
+            self.waiting_for_opponent = True
+            self.message_timer = GameClock.ticks()
+            self.battle_message = "Au tour d'Olga !"
+        else:
+            # Dégâts d'Olga
+            opponent_pokemon = self.opponent_team[self.opponent_pokemon]
+            player_pokemon = self.player_team[self.current_pokemon]
+            damage = self.calculate_damage(self.current_move, opponent_pokemon, player_pokemon)
+            player_pokemon["current_hp"] = max(0, player_pokemon["current_hp"] - damage)
+            if self.battle_log:
+                self.battle_log.attack("opponent", opponent_pokemon["name"], self.current_move["name"],
+                                       damage, player_pokemon["current_hp"] <= 0)
+            
+            # Vérifier si notre Pokémon est K.O.
+            if player_pokemon["current_hp"] <= 0:
+                self.battle_message = f"{player_pokemon['name']} est K.O. !"
+                # Chercher le prochain Pokémon non K.O.
+                next_pokemon_found = False
+                for i in range(self.current_pokemon + 1, len(self.player_team)):
+                    if self.player_team[i]["current_hp"] > 0:
+                        self.current_pokemon = i
+                        next_pokemon_found = True
+                        self.battle_message = f"À toi, {self.player_team[i]['name']} !"
+                        self.load_pokemon_sprites()
+                        break
+                
+                if not next_pokemon_found:
+                    self.show_battle_end("DEFEAT")
+                    return
+            
+            # Retour au menu principal
+            self.battle_menu_state = "MAIN"
+            self.selected_move = 0
+
     def draw_battle_menu(self):
         """Affiche le menu de combat"""
         # Fond blanc semi-transparent
-        menu_surface = pygame.Surface((self.menu_rect.width, self.menu_rect.height))
-        menu_surface.set_alpha(200)  # 0 = transparent, 255 = opaque
-        menu_surface.fill(self.WHITE)
-        self.screen.blit(menu_surface, self.menu_rect)
+        self.screen.fill_alpha((*self.WHITE, 200), self.menu_rect)  # 0 = transparent, 255 = opaque
         
         # Bordure noire
-        pygame.draw.rect(self.screen, self.BLACK, self.menu_rect, 2)
+        self.screen.draw_rect(self.BLACK, self.menu_rect, 2)
         
         if self.battle_menu_state == "MAIN":
             # Afficher les 4 options principales
             for i, option in enumerate(self.menu_options):
                 color = self.BLUE if i == self.selected_option else self.BLACK
-                text = self.font.render(option, True, color)
-                x = 50 + (i % 2) * 400
-                y = self.current_height - 130 + (i // 2) * 50  # Ajusté pour le nouveau menu
-                self.screen.blit(text, (x, y))
+                text = self.screen.text(self.font, option, color)
+                self.screen.blit(text, self.menu_item_rect(i).topleft)
         
         elif self.battle_menu_state == "MOVES":
             # Afficher les attaques
             moves = self.player_team[self.current_pokemon]["moves"]
             for i, move in enumerate(moves):
                 color = self.BLUE if i == self.selected_move else self.BLACK
-                text = self.font.render(move["name"], True, color)
-                x = 50 + (i % 2) * 400
-                y = 475 + (i // 2) * 50
-                self.screen.blit(text, (x, y))
+                text = self.screen.text(self.font, move["name"], color)
+                self.screen.blit(text, self.menu_item_rect(i).topleft)
+    
+    def menu_item_rect(self, index):
+        """Case de la grille 2x2 du menu de combat (options ou attaques)"""
+        x = 50 + (index % 2) * self.menu_column_width
+        y = self.menu_rect.y + 20 + (index // 2) * self.menu_row_height
+        return pygame.Rect(x, y, self.menu_column_width - 20, self.menu_row_height)
     
     def draw_health_bars(self):
         """Dessine les barres de vie des Pokémon"""
         player_pokemon = self.player_team[self.current_pokemon]
         opponent_pokemon = self.opponent_team[self.opponent_pokemon]
         
+        bar_width = self.hp_bar_width
+        
         # Dessiner la barre de vie du joueur
-        bar_y = 400
+        bar_x, bar_y = self.player_bar_pos
         text_y = bar_y - 30  # Décalé un peu plus haut pour la police plus grande
         
-        pygame.draw.rect(self.screen, self.WHITE, (50, bar_y, 300, 20), border_radius=5)
-        pygame.draw.rect(self.screen, self.RED, (50, bar_y, 300 * player_pokemon.get("current_hp", 100) / player_pokemon.get("max_hp", 100), 20), border_radius=5)
-        pygame.draw.rect(self.screen, self.BLACK, (50, bar_y, 300, 20), 2)
+        self.screen.draw_rect(self.WHITE, (bar_x, bar_y, bar_width, 20), border_radius=5)
+        self.screen.draw_rect(self.RED, (bar_x, bar_y, bar_width * player_pokemon.get("current_hp", 100) / player_pokemon.get("max_hp", 100), 20), border_radius=5)
+        self.screen.draw_rect(self.BLACK, (bar_x, bar_y, bar_width, 20), 2)
         
         # Dessiner la barre de vie d'Olga
-        opponent_bar_y = 200
+        opponent_bar_x, opponent_bar_y = self.opponent_bar_pos
         opponent_text_y = opponent_bar_y - 30  # Décalé un peu plus haut
         
-        pygame.draw.rect(self.screen, self.WHITE, (550, opponent_bar_y, 300, 20), border_radius=5)
-        pygame.draw.rect(self.screen, self.RED, (550, opponent_bar_y, 300 * opponent_pokemon.get("current_hp", 100) / opponent_pokemon.get("max_hp", 100), 20), border_radius=5)
-        pygame.draw.rect(self.screen, self.BLACK, (550, opponent_bar_y, 300, 20), 2)
+        self.screen.draw_rect(self.WHITE, (opponent_bar_x, opponent_bar_y, bar_width, 20), border_radius=5)
+        self.screen.draw_rect(self.RED, (opponent_bar_x, opponent_bar_y, bar_width * opponent_pokemon.get("current_hp", 100) / opponent_pokemon.get("max_hp", 100), 20), border_radius=5)
+        self.screen.draw_rect(self.BLACK, (opponent_bar_x, opponent_bar_y, bar_width, 20), 2)
         
         # Texte des barres de vie avec traits épais
         # Dessiner le texte plusieurs fois avec un léger décalage pour l'épaissir
@@ -345,14 +431,14 @@ class OlgaArena:
         
         # Joueur
         for dx, dy in [(0,0), (1,0), (0,1), (1,1)]:  # 4 positions pour épaissir
-            text = self.hp_font.render(player_text, True, (0, 0, 0))
-            rect = text.get_rect(midleft=(50 + dx, text_y + dy))
+            text = self.screen.text(self.hp_font, player_text, (0, 0, 0))
+            rect = text.get_rect(midleft=(bar_x + dx, text_y + dy))
             self.screen.blit(text, rect)
         
         # Adversaire
         for dx, dy in [(0,0), (1,0), (0,1), (1,1)]:  # 4 positions pour épaissir
-            text = self.hp_font.render(opponent_text, True, (0, 0, 0))
-            rect = text.get_rect(midright=(850 + dx, opponent_text_y + dy))
+            text = self.screen.text(self.hp_font, opponent_text, (0, 0, 0))
+            rect = text.get_rect(midright=(opponent_bar_x + bar_width + dx, opponent_text_y + dy))
             self.screen.blit(text, rect)
     
     def handle_battle_input(self, event):
@@ -374,18 +460,9 @@ class OlgaArena:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Clic gauche
                         mouse_pos = event.pos
-                        # Vérifier sur quel bouton on a cliqué
-                        button_width = (800 // 2 - 30) // 2
-                        button_height = 150
-                        
+                        # Vérifier sur quel bouton on a cliqué (même grille que l'affichage)
                         for i in range(4):
-                            row = i // 2
-                            col = i % 2
-                            x = col * (button_width + 20) + 20
-                            y = 475 + row * (button_height + 20)
-                            
-                            button_rect = pygame.Rect(x, y, button_width, button_height)
-                            if button_rect.collidepoint(mouse_pos):
+                            if self.menu_item_rect(i).collidepoint(mouse_pos):
                                 self.selected_option = i
                                 self.handle_menu_selection()
             
@@ -412,7 +489,7 @@ class OlgaArena:
             self.battle_message = None  # Effacer tout message de combat en cours
             self.waiting_for_opponent = False  # Ne pas déclencher le tour de l'adversaire
             self.escape_message = "Impossible de fuir un combat de dresseur !"
-            self.message_timer = pygame.time.get_ticks()
+            self.message_timer = GameClock.ticks()
             self.battle_menu_state = "MAIN"
     
     def handle_move_selection(self, key):
@@ -434,19 +511,17 @@ class OlgaArena:
         move = player_pokemon["moves"][self.selected_move]
         
         # Démarrer l'animation d'attaque
-        self.attacking = True
-        self.attack_animation_start = pygame.time.get_ticks()
         self.is_player_attacking = True
-        self.attacker_original_pos = self.player_pokemon_pos
-        self.attack_target_pos = self.opponent_pokemon_pos
-        self.current_attacker_pos = self.player_pokemon_pos
+        self.start_attack_animation(self.player_pokemon_pos, self.opponent_pokemon_pos)
         
         # Message d'attaque
         self.battle_message = f"{player_pokemon['name']} utilise {move['name']} !"
-        self.message_timer = pygame.time.get_ticks()
+        self.message_timer = GameClock.ticks()
         
         # Stocker le move pour l'utiliser après l'animation
         self.current_move = move
+        if self.battle_log:
+            self.battle_log.next_turn()
 
     def opponent_turn(self):
         """Gère le tour d'Olga"""
@@ -454,36 +529,33 @@ class OlgaArena:
         player_pokemon = self.player_team[self.current_pokemon]
         
         # Choisir une attaque aléatoire
-        move = random.choice(opponent_pokemon["moves"])
+        move = GameClock.rng.choice(opponent_pokemon["moves"])
         
         # Démarrer l'animation d'attaque
-        self.attacking = True
-        self.attack_animation_start = pygame.time.get_ticks()
         self.is_player_attacking = False
-        self.attacker_original_pos = self.opponent_pokemon_pos
-        self.attack_target_pos = self.player_pokemon_pos
-        self.current_attacker_pos = self.opponent_pokemon_pos
+        self.start_attack_animation(self.opponent_pokemon_pos, self.player_pokemon_pos)
         
         # Message d'attaque
         self.battle_message = f"{opponent_pokemon['name']} utilise {move['name']} !"
-        self.message_timer = pygame.time.get_ticks()
+        self.message_timer = GameClock.ticks()
         
         # Stocker le move pour l'utiliser après l'animation
         self.current_move = move
 
     def calculate_damage(self, move, attacker, defender):
         """Calcule les dégâts selon la formule officielle Pokémon"""
+        Metrics.count("battle.damage_calcs")
         try:
             # Vérifier que toutes les stats nécessaires sont présentes
             required_stats = ["level", "attack", "defense", "special_attack", "special_defense", "types"]
             for stat in required_stats:
                 if stat not in attacker or stat not in defender:
-                    print(f"Erreur: stat {stat} manquante")
+                    Log.error("combat", "Stat {} manquante", stat)
                     return 0
 
             # Vérifier les données du move
             if "category" not in move or "power" not in move or "type" not in move:
-                print(f"Erreur: données d'attaque manquantes pour {move['name']}")
+                Log.error("combat", "Données d'attaque manquantes pour {}", move['name'])
                 return 0
 
             # Si c'est une attaque de statut (power = 0)
@@ -509,31 +581,27 @@ class OlgaArena:
             type_multiplier = self.calculate_type_effectiveness(move["type"], defender["types"])
             
             # Coup critique (6.25% de chance)
-            is_crit = random.random() < 0.0625
+            is_crit = GameClock.rng.random() < 0.0625
             crit_multiplier = 2 if is_crit else 1
             if is_crit:
-                print("Coup critique !")
+                Log.debug("combat", "Coup critique !")
             
             # Random factor (85-100%)
-            random_factor = random.randint(85, 100) / 100
+            random_factor = GameClock.rng.randint(85, 100) / 100
             
             # Formule complète
             damage = (((2 * level / 5 + 2) * power * attack / defense) / 50 + 2) * \
                      stab * type_multiplier * crit_multiplier * random_factor
             
-            # Afficher les détails du calcul en debug
-            print(f"Dégâts calculés pour {move['name']}:")
-            print(f"Base: {(((2 * level / 5 + 2) * power * attack / defense) / 50 + 2)}")
-            print(f"STAB: {stab}")
-            print(f"Type: {type_multiplier}")
-            print(f"Crit: {crit_multiplier}")
-            print(f"Random: {random_factor}")
-            print(f"Total: {int(damage)}")
+            # Détails du calcul (formatés seulement si le journal de combat est affiché)
+            Log.debug("combat", "Dégâts de {}: base {:.1f}, STAB {}, type {}, crit {}, aléa {}, total {}",
+                      move['name'], ((2 * level / 5 + 2) * power * attack / defense) / 50 + 2,
+                      stab, type_multiplier, crit_multiplier, random_factor, int(damage))
             
             return int(damage)
             
         except Exception as e:
-            print(f"Erreur dans le calcul des dégâts: {e}")
+            Log.error("combat", "Erreur dans le calcul des dégâts: {}", e)
             return 0
 
     def calculate_type_effectiveness(self, move_type, defender_types):
@@ -567,7 +635,7 @@ class OlgaArena:
 
     def draw_intro(self):
         """Affiche l'introduction du combat"""
-        current_time = pygame.time.get_ticks()
+        current_time = GameClock.ticks()
         
         if self.intro_state == "TRAINER_APPEAR":
             # Utiliser le fond glacé au lieu du fond bleu
@@ -575,20 +643,18 @@ class OlgaArena:
                 self.screen.blit(self.arena_background, (0, 0))
             else:
                 self.screen.fill((100, 150, 200))
+            self.draw_snow()
             
             # Effet de flash glacé
             if (current_time // 200) % 2:
-                flash_surface = pygame.Surface((self.current_width, self.current_height//4))
-                flash_surface.fill((200, 220, 255))
-                flash_surface.set_alpha(100)
-                self.screen.blit(flash_surface, (0, 0))
+                self.screen.fill_alpha((200, 220, 255, 100), (0, 0, self.current_width, self.current_height//4))
             
             # Afficher Olga avec un effet d'apparition progressive
             if self.trainer_sprite:
                 alpha = min(255, (current_time - self.intro_timer) // 3)
-                sprite_copy = self.trainer_sprite.copy()
-                sprite_copy.set_alpha(alpha)
-                self.screen.blit(sprite_copy, self.trainer_pos)
+                self.trainer_sprite.set_alpha(alpha)
+                self.screen.blit(self.trainer_sprite, self.trainer_pos)
+                self.trainer_sprite.set_alpha(None)
             
             if current_time - self.intro_timer > self.intro_duration:
                 self.intro_state = "TRAINER_SPEAK"
@@ -600,6 +666,7 @@ class OlgaArena:
                 self.screen.blit(self.arena_background, (0, 0))
             else:
                 self.screen.fill((100, 150, 200))
+            self.draw_snow()
             
             # Afficher Olga
             if self.trainer_sprite:
@@ -613,8 +680,8 @@ class OlgaArena:
             ]
             
             for i, message in enumerate(messages):
-                text = self.olga_font.render(message, True, (220, 220, 255))
-                shadow = self.olga_font.render(message, True, (0, 0, 100))
+                text = self.screen.text(self.olga_font, message, (220, 220, 255))
+                shadow = self.screen.text(self.olga_font, message, (0, 0, 100))
                 pos_y = 50 + i * 60
                 
                 # Effet d'ombre
@@ -631,7 +698,7 @@ class OlgaArena:
             self.screen.fill(self.ICE_BLUE)
             
             # Message de début de combat
-            start_text = self.font.render("Que le combat commence !", True, self.BLACK)
+            start_text = self.screen.text(self.font, "Que le combat commence !", self.BLACK)
             start_rect = start_text.get_rect(center=(self.current_width//2, self.current_height//2))
             self.screen.blit(start_text, start_rect)
             
@@ -642,6 +709,9 @@ class OlgaArena:
         """Affiche l'écran de fin de combat"""
         self.battle_state = "END"
         self.battle_result = result
+        if self.battle_log and self.battle_log.finish(result):
+            BattleHistory.record(self.battle_log)
+            Metrics.count(f"battles.{result.lower()}")
         
         # Sauvegarder la victoire si applicable
         if result == "VICTORY":
@@ -654,59 +724,82 @@ class OlgaArena:
         
         # Message de fin
         message = "Victoire !" if self.battle_result == "VICTORY" else "Défaite..."
-        text = self.font.render(message, True, self.BLACK)
+        text = self.screen.text(self.font, message, self.BLACK)
         text_rect = text.get_rect(center=(self.current_width//2, self.current_height//2 - 50))
         self.screen.blit(text, text_rect)
         
         # Bouton retour
-        return_text = self.font.render("Appuyez sur ENTRÉE pour continuer", True, self.BLACK)
+        return_text = self.screen.text(self.font, "Appuyez sur ENTRÉE pour continuer", self.BLACK)
         return_rect = return_text.get_rect(center=(self.current_width//2, self.current_height//2 + 50))
         self.screen.blit(return_text, return_rect)
 
     def draw_pokemon_sprite(self, sprite, position, is_player):
         """Dessine un sprite de Pokémon à la position donnée"""
         if sprite and isinstance(sprite, list) and len(sprite) > 0:
-            frame = sprite[self.animation_frame % len(sprite)]
+            # Frame déduite de l'horloge d'animation partagée (durées du GIF respectées)
+            frame = sprite.frame_at(AnimationClock.now()) if hasattr(sprite, "frame_at") else sprite[0]
             sprite_rect = frame.get_rect()
             sprite_rect.center = position
             self.screen.blit(frame, sprite_rect)
 
-    def run(self):
+    def toggle_recording(self):
+        """Démarre ou arrête l'enregistrement du combat"""
+        if self.recorder:
+            path = self.recorder.stop()
+            Log.info("enregistrement", "Enregistrement terminé ({} frames, {} abandonnées): {}",
+                     self.recorder.captured, self.recorder.dropped, path)
+            self.recorder = None
+        else:
+            self.recorder = FrameRecorder(self.screen.get_size(), "olga")
+            self.recorder.start()
+    
+    def on_enter(self):
         # Démarrer la musique en boucle
         self.battle_music_channel = self.battle_music.play(-1)  # -1 pour jouer en boucle
-        
-        running = True
-        result = None
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    # Arrêter la musique avant de quitter
-                    if self.battle_music_channel:
-                        self.battle_music_channel.stop()
-                    return "QUIT" if event.type == pygame.QUIT else "BACK"
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        if self.battle_state == "INTRO" and self.intro_state == "BATTLE_START":
-                            self.battle_state = "BATTLE"
-                        elif self.battle_state == "END":
-                            result = self.battle_result
-                            running = False
-                
-                # Si on est en combat, gérer les inputs du combat
-                if self.battle_state == "BATTLE":
-                    self.handle_battle_input(event)
-            
-            # Gérer les différents états
-            if self.battle_state == "INTRO":
-                self.draw_intro()
-            elif self.battle_state == "BATTLE":
-                self.draw_battle()
-            elif self.battle_state == "END":
-                self.draw_battle_end()
-            
-            pygame.display.flip()
-        
-        # Arrêter la musique avant de retourner au menu
+        if FrameRecorder.enabled():
+            self.toggle_recording()
+    
+    def on_exit(self):
+        # Arrêter la musique (et l'enregistrement) avant de retourner au menu
         if self.battle_music_channel:
             self.battle_music_channel.stop()
-        return result 
\ No newline at end of file
+        if self.recorder:
+            self.toggle_recording()
+        # Combat quitté en cours de route : gardé comme abandon s'il avait commencé
+        if self.battle_log and self.battle_log.attacks and self.battle_log.finish("ABANDON"):
+            BattleHistory.record(self.battle_log)
+            Metrics.count("battles.abandon")
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and not (self.battle_state == "BATTLE" and self.battle_menu_state == "MOVES"):
+                self.manager.pop("BACK")
+                return
+            if event.key == pygame.K_F9:
+                self.toggle_recording()
+            elif event.key == pygame.K_SPACE and self.attack_timeline:
+                # Passer l'animation en cours
+                timeline = self.attack_timeline
+                timeline.skip()
+                if self.attack_timeline is timeline:
+                    self.attack_timeline = None
+            elif event.key == pygame.K_RETURN:
+                if self.battle_state == "INTRO" and self.intro_state == "BATTLE_START":
+                    self.battle_state = "BATTLE"
+                elif self.battle_state == "END":
+                    self.manager.pop(self.battle_result)
+                    return
+        
+        # Si on est en combat, gérer les inputs du combat
+        if self.battle_state == "BATTLE":
+            self.handle_battle_input(event)
+    
+    def draw(self):
+        # Gérer les différents états
+        if self.battle_state == "INTRO":
+            self.draw_intro()
+        elif self.battle_state == "BATTLE":
+            self.draw_battle()
+        elif self.battle_state == "END":
+            self.draw_battle_end()
+
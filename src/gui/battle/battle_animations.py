@@ -1,7 +1,13 @@
 import pygame
 import math
+from utils.Timeline import Timeline
 
 class BattleAnimations:
+    # Durées en millisecondes (anciennement 30 et 15 frames à 60 FPS)
+    ATTACK_DURATION = 500
+    DAMAGE_DURATION = 250
+    FRAME_MS = 1000 / 60  # Pour garder la vitesse des effets calibrés à la frame
+    
     def __init__(self, screen):
         self.screen = screen
         self.current_width = screen.get_width()
@@ -9,8 +15,11 @@ class BattleAnimations:
         
         # États d'animation
         self.current_animation = None
+        self.timeline = None
+        self.progress = 0.0
         self.animation_frame = 0
         self.animation_done = True
+        self.time_scale = 1.0
         
     def animate_attack(self, attacker_pos, defender_pos, move_type):
         """Animation de base pour une attaque"""
@@ -18,24 +27,48 @@ class BattleAnimations:
             "type": "attack",
             "start_pos": attacker_pos,
             "end_pos": defender_pos,
-            "move_type": move_type,
-            "frame": 0
+            "move_type": move_type
         }
-        self.animation_done = False
+        self._start_timeline(self.ATTACK_DURATION)
     
     def animate_damage(self, pokemon_pos):
         """Animation quand un Pokémon prend des dégâts"""
         self.current_animation = {
             "type": "damage",
-            "pos": pokemon_pos,
-            "frame": 0
+            "pos": pokemon_pos
         }
+        self._start_timeline(self.DAMAGE_DURATION)
+    
+    def _start_timeline(self, duration):
+        self.progress = 0.0
         self.animation_done = False
+        self.timeline = Timeline(time_scale=self.time_scale)
+        self.timeline.tween(duration, 0.0, 1.0, self._set_progress)
+        self.timeline.call(self._finish)
+    
+    def _set_progress(self, progress):
+        self.progress = progress
+    
+    def _finish(self):
+        self.current_animation = None
+        self.animation_done = True
+    
+    def skip(self):
+        """Termine immédiatement l'animation en cours"""
+        if self.timeline:
+            self.timeline.skip()
     
-    def update(self):
-        """Met à jour l'animation en cours"""
+    def update(self, dt):
+        """Met à jour l'animation en cours (dt en millisecondes)"""
         if not self.current_animation:
             return True
+        
+        self.timeline.update(dt)
+        if not self.current_animation:
+            return True
+        
+        # Temps écoulé exprimé en "frames" à 60 FPS pour les effets visuels
+        self.animation_frame = self.timeline.time / self.FRAME_MS
             
         if self.current_animation["type"] == "attack":
             return self._update_attack_animation()
@@ -44,59 +77,46 @@ class BattleAnimations:
     
     def _update_attack_animation(self):
         """Met à jour l'animation d'attaque"""
-        if self.current_animation["frame"] >= 30:  # Animation de 30 frames
-            self.current_animation = None
-            self.animation_done = True
-            return True
-            
-        frame = self.current_animation["frame"]
+        progress = self.progress
         start = self.current_animation["start_pos"]
         end = self.current_animation["end_pos"]
         move_type = self.current_animation["move_type"]
         
-        # Phase d'animation (avance, frappe, recule)
-        if frame < 10:  # Avance
-            progress = frame / 10
-            current_x = start[0] + (end[0] - start[0]) * progress * 0.5
-            current_y = start[1] + (end[1] - start[1]) * progress * 0.5
+        # Phase d'animation (avance, frappe, recule) : un tiers du temps chacune
+        if progress < 1/3:  # Avance
+            t = progress * 3
+            current_x = start[0] + (end[0] - start[0]) * t * 0.5
+            current_y = start[1] + (end[1] - start[1]) * t * 0.5
             
             # Dessiner l'effet d'attaque selon le type
             self._draw_attack_effect(move_type, (current_x, current_y))
             
-        elif frame < 20:  # Impact
+        elif progress < 2/3:  # Impact
             # Effet de tremblement sur le Pokémon cible
-            shake_x = end[0] + math.sin(frame * 0.8) * 10
-            shake_y = end[1] + math.cos(frame * 0.8) * 10
+            shake_x = end[0] + math.sin(self.animation_frame * 0.8) * 10
+            shake_y = end[1] + math.cos(self.animation_frame * 0.8) * 10
             
             # Dessiner l'effet d'impact
             self._draw_impact_effect((shake_x, shake_y))
             
         else:  # Recule
-            progress = (frame - 20) / 10
-            current_x = end[0] + (start[0] - end[0]) * progress * 0.5
-            current_y = end[1] + (start[1] - end[1]) * progress * 0.5
+            t = (progress - 2/3) * 3
+            current_x = end[0] + (start[0] - end[0]) * t * 0.5
+            current_y = end[1] + (start[1] - end[1]) * t * 0.5
         
-        self.current_animation["frame"] += 1
         return False
     
     def _update_damage_animation(self):
         """Met à jour l'animation de dégâts"""
-        if self.current_animation["frame"] >= 15:  # Animation de 15 frames
-            self.current_animation = None
-            self.animation_done = True
-            return True
-            
         pos = self.current_animation["pos"]
-        frame = self.current_animation["frame"]
         
-        # Faire clignoter le Pokémon en rouge
-        if frame % 2 == 0:
+        # Faire clignoter le Pokémon en rouge (une "frame" sur deux)
+        if int(self.animation_frame) % 2 == 0:
             flash_surface = pygame.Surface((100, 100))  # Ajuster selon la taille du Pokémon
             flash_surface.fill((255, 0, 0))
             flash_surface.set_alpha(128)
             self.screen.blit(flash_surface, pos)
         
-        self.current_animation["frame"] += 1
         return False
     
     def _draw_attack_effect(self, move_type, pos):
@@ -115,7 +135,7 @@ class BattleAnimations:
             angle = self.animation_frame * 0.2 + i * (2 * math.pi / 5)
             x = pos[0] + math.cos(angle) * 20
             y = pos[1] + math.sin(angle) * 20
-            pygame.draw.circle(self.screen, (255, 100, 0), (int(x), int(y)), 10)
+            self.screen.draw_circle((255, 100, 0), (int(x), int(y)), 10)
     
     def _draw_water_effect(self, pos):
         """Dessine un effet d'eau"""
@@ -123,7 +143,7 @@ class BattleAnimations:
             angle = self.animation_frame * 0.1 + i * (2 * math.pi / 8)
             x = pos[0] + math.cos(angle) * 25
             y = pos[1] + math.sin(angle) * 15
-            pygame.draw.ellipse(self.screen, (0, 100, 255), (x-5, y-5, 10, 10))
+            self.screen.draw_circle((0, 100, 255), (int(x), int(y)), 5)
     
     def _draw_electric_effect(self, pos):
         """Dessine un effet électrique"""
@@ -133,9 +153,10 @@ class BattleAnimations:
             x = pos[0] + math.cos(angle) * 30 * (1 + math.sin(self.animation_frame * 0.2))
             y = pos[1] + math.sin(angle) * 30
             points.append((int(x), int(y)))
-        pygame.draw.lines(self.screen, (255, 255, 0), True, points, 3)
+        for start, end in zip(points, points[1:] + points[:1]):
+            self.screen.draw_line((255, 255, 0), start, end, 3)
     
     def _draw_impact_effect(self, pos):
         """Dessine l'effet d'impact"""
         size = 20 + math.sin(self.animation_frame * 0.5) * 10
-        pygame.draw.circle(self.screen, (255, 255, 255), (int(pos[0]), int(pos[1])), int(size)) 
\ No newline at end of file
+        self.screen.draw_circle((255, 255, 255), (int(pos[0]), int(pos[1])), int(size)) 
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pygame
 import os
+from utils.AssetManager import AssetManager
+from utils.Log import Log
 
 class BattleSounds:
     def __init__(self):
@@ -9,6 +11,7 @@ class BattleSounds:
     def load_sounds(self):
         """Charge tous les sons du combat"""
         sound_dir = os.path.join("src", "assets", "sounds")
+        AssetManager.ensure_mixer()
         try:
             self.sounds = {
                 "hit": pygame.mixer.Sound(os.path.join(sound_dir, "hit.wav")),
@@ -18,4 +21,4 @@ class BattleSounds:
                 "defeat": pygame.mixer.Sound(os.path.join(sound_dir, "defeat.wav"))
             }
         except Exception as e:
-            print(f"Erreur lors du chargement des sons: {e}") 
\ No newline at end of file
+            Log.error("ressources", "Erreur lors du chargement des sons: {}", e) 
\ No newline at end of file
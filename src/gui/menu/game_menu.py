@@ -1,13 +1,13 @@
 import pygame
 import math
 import os
-from gui.menu.pokemon_selection import PokemonSelection
-from gui.menu.team_order import TeamOrderMenu
-from gui.menu.league_selection import LeagueSelection
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.Log import Log
 
-class GameMenu:
+class GameMenu(Scene):
     def __init__(self, screen, sprite_manager, profile=None):
-        self.screen = screen
+        super().__init__(screen)
         self.sprite_manager = sprite_manager
         self.profile = profile
         
@@ -21,11 +21,11 @@ class GameMenu:
         try:
             # Charger et redimensionner l'image de fond
             background_path = os.path.join(self.assets_path, "pokemon_backgroundfinale.jpg")
-            self.background = pygame.image.load(background_path).convert_alpha()
-            self.background = pygame.transform.scale(self.background, (self.current_width, self.current_height))
+            self.background = AssetManager.image(background_path, (self.current_width, self.current_height),
+                                                 owner=self.asset_owner)
             
         except Exception as e:
-            print(f"Erreur lors du chargement de l'image de fond: {e}")
+            Log.error("ressources", "Erreur lors du chargement de l'image de fond: {}", e)
             self.background = pygame.Surface((self.current_width, self.current_height))
             self.background.fill((0, 0, 0))
         
@@ -36,8 +36,8 @@ class GameMenu:
         self.POKEMON_BLUE = (0, 144, 255)        # Bleu de base
         self.POKEMON_BLUE_LIGHT = (0, 90, 255)   # Bleu plus foncé pour la sélection
         
-        # Même police
-        self.font = pygame.font.Font(None, 96)
+        # Même police (réduite si la hauteur logique est plus petite que la mise en page d'origine)
+        self.font = AssetManager.font(None, int(96 * min(1.0, self.current_height / 1010)), self.asset_owner)
         
         # Animation
         self.float_offset = 0
@@ -66,17 +66,17 @@ class GameMenu:
         for i, option in enumerate(self.options):
             # Texte en bleu Pokémon
             color = self.POKEMON_BLUE_LIGHT if i == self.selected else self.POKEMON_BLUE
-            text = self.font.render(option, True, color)
-            text_rect = text.get_rect(center=(self.current_width//2, 300 + i * 120))
+            text = self.screen.text(self.font, option, color)
+            text_rect = text.get_rect(center=self.option_rect(i).center)
             
             # Rectangle jaune Pokémon
             box_rect = text_rect.inflate(60, 40)
             if i == self.selected:
                 box_rect = text_rect.inflate(80, 50)
-                pygame.draw.rect(self.screen, self.POKEMON_YELLOW, box_rect, border_radius=15)
-                pygame.draw.rect(self.screen, self.POKEMON_BLUE_LIGHT, box_rect, 3, border_radius=15)
+                self.screen.draw_rect(self.POKEMON_YELLOW, box_rect, border_radius=15)
+                self.screen.draw_rect(self.POKEMON_BLUE_LIGHT, box_rect, 3, border_radius=15)
             else:
-                pygame.draw.rect(self.screen, self.POKEMON_YELLOW, box_rect, border_radius=10)
+                self.screen.draw_rect(self.POKEMON_YELLOW, box_rect, border_radius=10)
             
             # Afficher le texte
             self.screen.blit(text, text_rect)
@@ -88,100 +88,69 @@ class GameMenu:
         else:
             # Activer l'option "Mode Combat"
             pass
-        
-        pygame.display.flip() 
 
-    def handle_pokemon_selection(self):
-        """Gère la sélection et l'ordre des Pokémon"""
-        pokemon_selection = PokemonSelection(self.screen)
-        pokemon_names = pokemon_selection.run()
+    def option_rect(self, index):
+        """Rectangle du texte d'une option (la boîte cliquable est ce rectangle agrandi)"""
+        start_y = int(self.current_height * 0.3)
+        step = min(120, (self.current_height * 0.92 - start_y) / max(1, len(self.options) - 1))
+        return self.screen.text(self.font, self.options[index], (0,0,0)).get_rect(
+            center=(self.current_width//2, int(start_y + index * step)))
+
+    def choose(self, index):
+        """Action d'une option du menu"""
+        option = self.options[index]
+        if option == "Pokémon":
+            self.open_pokemon_selection()
+        elif option == "Mode Combat":
+            self.open_battle_menu()
+        elif option == "Retour":
+            self.manager.pop("BACK")
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Clic gauche
+                mouse_pos = event.pos
+                for i, option in enumerate(self.options):
+                    text_rect = self.option_rect(i)
+                    box_rect = text_rect.inflate(60, 40)
+                    if box_rect.collidepoint(mouse_pos):
+                        self.choose(i)
+                        break
         
-        if pokemon_names and pokemon_names != "BACK":
-            team_order = TeamOrderMenu(self.screen, pokemon_names)
-            order_result = team_order.run()
-            if order_result == "BACK":  # Changé de ORDER_CONFIRMED à BACK
-                self.selected_team = team_order.team  # Sauvegarder l'équipe ordonnée
-        return None
+        # Survol de la souris
+        elif event.type == pygame.MOUSEMOTION:
+            mouse_pos = event.pos
+            for i, option in enumerate(self.options):
+                text_rect = self.option_rect(i)
+                box_rect = text_rect.inflate(60, 40)
+                if box_rect.collidepoint(mouse_pos):
+                    self.selected = i
+                    break
+        
+        # Contrôle clavier
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop("BACK")
+            elif event.key == pygame.K_UP:
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key == pygame.K_DOWN:
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key == pygame.K_RETURN:
+                self.choose(self.selected)
 
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "QUIT"
-                    
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
-                        mouse_pos = pygame.mouse.get_pos()
-                        for i, option in enumerate(self.options):
-                            text_rect = self.font.render(option, True, (0,0,0)).get_rect(center=(self.current_width//2, 300 + i * 120))
-                            box_rect = text_rect.inflate(60, 40)
-                            if box_rect.collidepoint(mouse_pos):
-                                if option == "Pokémon":
-                                    self.handle_pokemon_selection()
-                                elif option == "Mode Combat":
-                                    # Ouvrir directement la sélection de la ligue
-                                    league_screen = LeagueSelection(self.screen)
-                                    league_result = league_screen.run()
-                                    if league_result == "BACK":
-                                        continue  # Retour au menu de jeu
-                                    elif isinstance(league_result, dict):
-                                        return league_result  # Retourner le résultat au main.py
-                                elif option == "Retour":
-                                    return "BACK"
-                
-                # Survol de la souris
-                elif event.type == pygame.MOUSEMOTION:
-                    mouse_pos = pygame.mouse.get_pos()
-                    for i, option in enumerate(self.options):
-                        text_rect = self.font.render(option, True, (0,0,0)).get_rect(center=(self.current_width//2, 300 + i * 120))
-                        box_rect = text_rect.inflate(60, 40)
-                        if box_rect.collidepoint(mouse_pos):
-                            self.selected = i
-                            break
-                
-                # Contrôle clavier
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "BACK"
-                    elif event.key == pygame.K_UP:
-                        self.selected = (self.selected - 1) % len(self.options)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected = (self.selected + 1) % len(self.options)
-                    elif event.key == pygame.K_RETURN:
-                        if self.selected == 0:  # Pokémon
-                            return self.handle_pokemon_selection()
-                        elif self.selected == 1:  # Pokédex
-                            return "POKEDEX"
-                        elif self.selected == 2:  # Sac
-                            return "BAG"
-                        elif self.selected == 3:  # Mode Combat
-                            return self.open_battle_menu()
-                        elif self.selected == 4:  # Options
-                            return "OPTIONS"
-                        elif self.selected == 5:  # Retour
-                            return "BACK"
-            
-            self.draw()
+    def reset(self):
+        self.selected = 0
+
+    def on_resume(self, result):
+        if isinstance(result, list):
+            # Équipe ordonnée renvoyée par la sélection des Pokémon
+            self.selected_team = result
 
     def open_battle_menu(self):
         """Ouvre le menu de la ligue"""
         from gui.menu.league_selection import LeagueSelection
-        league_menu = LeagueSelection(self.screen)
-        return league_menu.run()
+        self.manager.push(self.manager.scene("league_selection", lambda: LeagueSelection(self.screen)))
 
     def open_pokemon_selection(self):
         from gui.menu.pokemon_selection import PokemonSelection
-        pokemon_selection = PokemonSelection(self.screen)
-        result = pokemon_selection.run()
-        
-        if result == "ORDER_CONFIRMED":
-            # Stocker l'équipe ordonnée et continuer dans le menu de jeu
-            self.selected_team = pokemon_selection.get_ordered_team()
-            return None  # Reste dans le menu de jeu
-        elif result == "BACK":
-            return None  # Reste dans le menu de jeu
-        elif result == "QUIT":
-            return "QUIT"
-        
-        return None 
\ No newline at end of file
+        self.manager.push(PokemonSelection.loading_screen(self.manager, self.screen))
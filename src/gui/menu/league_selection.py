@@ -2,13 +2,14 @@ import pygame
 import math
 import os
 from utils.ProfileManager import ProfileManager
-from gui.battle.battle_scene import BattleScene
 from utils.SpriteManager import SpriteManager
-from gui.battle.arena_scenes.olga_arena import OlgaArena
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.Log import Log
 
-class LeagueSelection:
+class LeagueSelection(Scene):
     def __init__(self, screen):
-        self.screen = screen
+        super().__init__(screen)
         self.current_width = screen.get_width()
         self.current_height = screen.get_height()
         
@@ -23,13 +24,9 @@ class LeagueSelection:
         self.GRAY = (128, 128, 128)
         
         # Police
-        try:
-            font_path = os.path.join("src", "assets", "fonts", "pokemon.ttf")
-            self.title_font = pygame.font.Font(font_path, 40)
-            self.font = pygame.font.Font(font_path, 25)
-        except:
-            self.title_font = pygame.font.Font(None, 40)
-            self.font = pygame.font.Font(None, 25)
+        font_path = os.path.join("src", "assets", "fonts", "pokemon.ttf")
+        self.title_font = AssetManager.font(font_path, 40, self.asset_owner)
+        self.font = AssetManager.font(font_path, 25, self.asset_owner)
         
         # Animation
         self.float_offset = 0
@@ -70,6 +67,7 @@ class LeagueSelection:
         ]
         
         self.selected = 0
+        self.trainer_rects = []
         
         # Charger le profil pour voir les dresseurs battus
         self.profile = ProfileManager.load_profile()
@@ -85,7 +83,7 @@ class LeagueSelection:
         self.RED = (255, 0, 0)
         self.LOCKED_COLOR = (100, 100, 100)  # Gris plus foncé pour l'état verrouillé
         
-        self.sprite_manager = SpriteManager()
+        self.sprite_manager = SpriteManager(self.asset_owner)
 
     def load_trainer_sprite(self, trainer_name):
         # Mapping des noms de fichiers
@@ -101,10 +99,9 @@ class LeagueSelection:
             # Utiliser os.path.join pour créer le chemin
             filename = sprite_files[trainer_name]
             sprite_path = os.path.join(self.assets_path, filename)
-            sprite = pygame.image.load(sprite_path).convert_alpha()
-            return pygame.transform.scale(sprite, (150, 200))
+            return AssetManager.image(sprite_path, (150, 200), alpha=True, owner=self.asset_owner)
         except Exception as e:
-            print(f"Erreur lors du chargement du sprite de {trainer_name}: {e}")
+            Log.error("sprites", "Erreur lors du chargement du sprite de {}: {}", trainer_name, e)
             return None
 
     def load_trainer_pokemon(self, trainer_name):
@@ -131,7 +128,7 @@ class LeagueSelection:
         offset_y = math.sin(self.float_offset) * 10
         
         # Titre
-        title = self.title_font.render("Ligue Pokémon", True, self.POKEMON_BLUE)
+        title = self.screen.text(self.title_font, "Ligue Pokémon", self.POKEMON_BLUE)
         title_rect = title.get_rect(center=(self.current_width//2, 50))
         self.screen.blit(title, title_rect)
         
@@ -148,7 +145,7 @@ class LeagueSelection:
         for i in range(len(positions) - 1):
             start_pos = positions[i]
             end_pos = positions[i + 1]
-            pygame.draw.line(self.screen, self.POKEMON_BLUE,
+            self.screen.draw_line(self.POKEMON_BLUE,
                            (start_pos["x"] + 250, start_pos["y"] + 70),
                            (end_pos["x"] + 50, end_pos["y"] + 30),
                            2)
@@ -177,25 +174,26 @@ class LeagueSelection:
             # Dessiner le cadre et le texte
             if blue_locked:
                 # Effet de désactivation
-                pygame.draw.rect(self.screen, (50, 50, 50), click_rect, border_radius=10)
+                self.screen.draw_rect((50, 50, 50), click_rect, border_radius=10)
             elif i == self.selected:
-                pygame.draw.rect(self.screen, (0, 50, 100), click_rect, border_radius=10)
-                pygame.draw.rect(self.screen, self.POKEMON_BLUE, click_rect, 3, border_radius=10)
+                self.screen.draw_rect((0, 50, 100), click_rect, border_radius=10)
+                self.screen.draw_rect(self.POKEMON_BLUE, click_rect, 3, border_radius=10)
             
             # Sprite et texte
             if trainer["sprite"]:
                 sprite_rect = trainer["sprite"].get_rect(midleft=(x_pos, y_pos + 60))
-                sprite = trainer["sprite"].copy()
+                sprite = trainer["sprite"]
                 if blue_locked:
-                    # Assombrir le sprite si verrouillé
-                    dark = pygame.Surface(sprite.get_size()).convert_alpha()
-                    dark.fill((0, 0, 0, 128))
-                    sprite.blit(dark, (0, 0))
+                    # Sprite assombri si verrouillé (calculé une seule fois)
+                    if "locked_sprite" not in trainer:
+                        trainer["locked_sprite"] = sprite.copy()
+                        trainer["locked_sprite"].fill((128, 128, 128), special_flags=pygame.BLEND_RGB_MULT)
+                    sprite = trainer["locked_sprite"]
                 self.screen.blit(sprite, sprite_rect)
             
             # Nom et description
-            name = self.font.render(f"{trainer['name']} - {trainer['title']}", True, color)
-            desc = self.font.render(trainer['description'], True, color)
+            name = self.screen.text(self.font, f"{trainer['name']} - {trainer['title']}", color)
+            desc = self.screen.text(self.font, trainer['description'], color)
             
             # Ajuster la position du texte
             text_x = x_pos + 170  # Un peu plus à droite du sprite
@@ -204,8 +202,8 @@ class LeagueSelection:
             
             # Vérifier si le texte dépasse
             if name_rect.right > click_rect.right - 10:
-                name = self.font.render(f"{trainer['name']}", True, color)  # Afficher juste le nom si trop long
-                title = self.font.render(trainer['title'], True, color)
+                name = self.screen.text(self.font, f"{trainer['name']}", color)  # Afficher juste le nom si trop long
+                title = self.screen.text(self.font, trainer['title'], color)
                 self.screen.blit(name, (text_x, y_pos + 10))
                 self.screen.blit(title, (text_x, y_pos + 35))
                 self.screen.blit(desc, (text_x, y_pos + 80))
@@ -217,73 +215,90 @@ class LeagueSelection:
             if self.profile:
                 if blue_locked:
                     # Cadenas pour Blue si verrouillé
-                    lock = self.font.render(self.LOCK_ICON, True, self.RED)
+                    lock = self.screen.text(self.font, self.LOCK_ICON, self.RED)
                     self.screen.blit(lock, (text_x - 30, y_pos))
                 elif self.profile["defeated_trainers"][trainer["name"]]:
                     # Coche verte pour les dresseurs battus
-                    check = self.font.render(self.CHECK_ICON, True, self.GREEN)
+                    check = self.screen.text(self.font, self.CHECK_ICON, self.GREEN)
                     self.screen.blit(check, (text_x - 30, y_pos))
             
             # Message pour Blue
             if i == self.selected and blue_locked:
-                msg_text = self.font.render(self.BLUE_LOCKED_MSG, True, self.RED)
+                msg_text = self.screen.text(self.font, self.BLUE_LOCKED_MSG, self.RED)
                 msg_rect = msg_text.get_rect(center=(self.current_width//2, self.current_height - 50))
                 # Fond semi-transparent pour le message
-                msg_bg = pygame.Surface((msg_rect.width + 20, msg_rect.height + 10))
-                msg_bg.fill(self.BLACK)
-                msg_bg.set_alpha(200)
-                self.screen.blit(msg_bg, (msg_rect.x - 10, msg_rect.y - 5))
+                self.screen.fill_alpha((*self.BLACK, 200), msg_rect.inflate(20, 10))
                 self.screen.blit(msg_text, msg_rect)
             
             # Griser les dresseurs non disponibles
             if trainer["name"] == "Blue" and not ProfileManager.can_challenge_blue():
                 color = self.GRAY  # Griser Blue si pas encore disponible
 
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "QUIT"
-                
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
-                        mouse_pos = pygame.mouse.get_pos()
-                        # Vérifier si on clique sur un dresseur
-                        for i, rect in enumerate(self.trainer_rects):
-                            if rect.collidepoint(mouse_pos):
-                                self.selected = i
-                                trainer = self.trainers[i]
-                                
-                                if trainer["name"] == "Olga":
-                                    profile = ProfileManager.load_profile()
-                                    if profile and "current_team" in profile and profile["current_team"]:  # Vérifier que l'équipe n'est pas vide
-                                        print(f"Équipe chargée : {profile['current_team']}")
-                                        arena = OlgaArena(self.screen, profile["current_team"])
-                                        result = arena.run()
-                                        return "BACK"
-                                    else:
-                                        print("Erreur : Vous devez d'abord sélectionner une équipe !")
-                                        return "POKEMON_SELECTION"  # Rediriger vers la sélection des Pokémon
-                
-                elif event.type == pygame.MOUSEMOTION:
-                    # Surbrillance au survol
-                    mouse_pos = pygame.mouse.get_pos()
-                    for i, rect in enumerate(self.trainer_rects):
-                        if rect.collidepoint(mouse_pos):
-                            self.selected = i
-                            break
-                
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "BACK"
-                    elif event.key == pygame.K_UP:
-                        self.selected = (self.selected - 1) % len(self.trainers)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected = (self.selected + 1) % len(self.trainers)
+    def reset(self):
+        self.selected = 0
+
+    def on_enter(self):
+        # Le profil a pu changer depuis la dernière visite (nouvelle équipe, victoire)
+        self.profile = ProfileManager.load_profile()
+
+    def on_resume(self, result):
+        # Retour d'un combat : rafraîchir les dresseurs battus
+        self.profile = ProfileManager.load_profile()
+
+    def start_battle(self, trainer):
+        """Lance le combat contre le dresseur choisi (arène empilée au-dessus de la ligue)"""
+        if trainer["name"] != "Olga":
+            return
+        profile = ProfileManager.load_profile()
+        if profile and "current_team" in profile and profile["current_team"]:  # Vérifier que l'équipe n'est pas vide
+            Log.debug("menu", "Équipe chargée : {}", profile['current_team'])
+            team = profile["current_team"]
+            from gui.battle.arena_scenes.olga_arena import OlgaArena  # Code de l'arène chargé au premier combat
+            from gui.menu.loading_screen import LoadingScreen
+            
+            def build():
+                arena = self.manager.scene("olga_arena", lambda: OlgaArena(self.screen, team))
+                arena.set_team(team)
+                return arena
             
-            self.draw()
-            pygame.display.flip() 
+            # Ressources lues sur des threads pendant l'écran de chargement, puis l'arène le remplace
+            self.manager.push(LoadingScreen(self.screen, OlgaArena.load_jobs(self.screen, team), build,
+                                            "Arène d'Olga"))
+        else:
+            Log.warning("menu", "Aucune équipe sélectionnée")
+            # Rediriger vers la sélection des Pokémon
+            from gui.menu.pokemon_selection import PokemonSelection
+            self.manager.show_message("Sélectionnez d'abord votre équipe !")
+            self.manager.replace(PokemonSelection.loading_screen(self.manager, self.screen))
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Clic gauche
+                mouse_pos = event.pos
+                # Vérifier si on clique sur un dresseur
+                for i, rect in enumerate(self.trainer_rects):
+                    if rect.collidepoint(mouse_pos):
+                        self.selected = i
+                        self.start_battle(self.trainers[i])
+                        break
+        
+        elif event.type == pygame.MOUSEMOTION:
+            # Surbrillance au survol
+            mouse_pos = event.pos
+            for i, rect in enumerate(self.trainer_rects):
+                if rect.collidepoint(mouse_pos):
+                    self.selected = i
+                    break
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop("BACK")
+            elif event.key == pygame.K_UP:
+                self.selected = (self.selected - 1) % len(self.trainers)
+            elif event.key == pygame.K_DOWN:
+                self.selected = (self.selected + 1) % len(self.trainers)
+            elif event.key == pygame.K_RETURN:
+                self.start_battle(self.trainers[self.selected])
 
     def handle_pokemon_selection(self):
         """Gère la sélection des Pokémon"""
@@ -0,0 +1,113 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.Log import Log
+
+
+class LoadingScreen(Scene):
+    """Écran de chargement : exécute des LoadJob sur des threads puis remplace par la scène cible
+
+    Les `load()` tournent en parallèle pendant que l'écran continue d'être animé ;
+    les `finalize()` (convert, mise en cache) passent sur le thread principal,
+    limités à FINALIZE_BUDGET_MS par frame. `build()` construit la scène cible
+    une fois tout terminé (ses ressources sont alors déjà dans l'AssetManager).
+    """
+    WORKERS = 4
+    FINALIZE_BUDGET_MS = 4
+    interactive = False
+
+    def __init__(self, screen, jobs, build, title="Chargement"):
+        super().__init__(screen)
+        self.jobs = [job for job in jobs if job]  # None : ressource déjà en cache
+        self.build = build
+        self.title = title
+        self.total_weight = sum(job.weight for job in self.jobs) or 1
+        self.done_weight = 0
+        self.pending = []
+        self.current = self.jobs[0].name if self.jobs else ""
+        self.executor = None
+        self.elapsed = 0
+
+        # Couleurs
+        self.WHITE = (255, 255, 255)
+        self.BLACK = (0, 0, 0)
+        self.POKEMON_BLUE = (0, 144, 255)
+        self.POKEMON_YELLOW = (255, 236, 0)
+        self.GRAY = (60, 60, 60)
+
+        # Police
+        self.font = AssetManager.font(None, 48)
+        self.small_font = AssetManager.font(None, 28)
+
+    @property
+    def progress(self):
+        return self.done_weight / self.total_weight
+
+    def on_enter(self):
+        if self.jobs:
+            self.executor = ThreadPoolExecutor(LoadingScreen.WORKERS, thread_name_prefix="load")
+            self.pending = [(job, self.executor.submit(job.load)) for job in self.jobs]
+
+    def on_exit(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def update(self, dt):
+        self.elapsed += dt
+        deadline = time.perf_counter() + LoadingScreen.FINALIZE_BUDGET_MS / 1000
+        for entry in list(self.pending):
+            job, future = entry
+            if not future.done():
+                continue
+            self.pending.remove(entry)
+            try:
+                job.complete(future.result())
+            except Exception as e:
+                # La scène cible rechargera la ressource elle-même
+                job.error = e
+                Log.error("chargement", "Erreur lors du chargement de {}: {}", job.name, e)
+            self.done_weight += job.weight
+            self.current = job.name
+            if time.perf_counter() > deadline:
+                break
+
+        if not self.pending:
+            self.manager.replace(self.build())
+
+    def draw(self):
+        self.screen.fill(self.BLACK)
+        center_x = self.screen.get_width() // 2
+        center_y = self.screen.get_height() // 2
+
+        # Titre
+        title = self.screen.text(self.font, self.title, self.POKEMON_BLUE)
+        self.screen.blit(title, title.get_rect(center=(center_x, center_y - 80)))
+
+        # Barre de progression
+        bar = pygame.Rect(0, 0, min(600, self.screen.get_width() - 100), 30)
+        bar.center = (center_x, center_y)
+        self.screen.draw_rect(self.GRAY, bar, border_radius=10)
+        if self.done_weight:
+            filled = bar.copy()
+            filled.width = max(20, int(bar.width * self.progress))
+            self.screen.draw_rect(self.POKEMON_YELLOW, filled, border_radius=10)
+        self.screen.draw_rect(self.WHITE, bar, 2, border_radius=10)
+
+        # Pourcentage et ressource en cours
+        label = f"{int(self.progress * 100)} %  {self.current}"
+        text = self.screen.text(self.small_font, label, self.WHITE)
+        self.screen.blit(text, text.get_rect(center=(center_x, center_y + 50)))
+
+        # Indicateur animé (tourne tant que le thread principal n'est pas bloqué)
+        angle = self.elapsed / 150
+        for i in range(8):
+            a = angle + i * math.pi / 4
+            x = center_x + int(math.cos(a) * 25)
+            y = center_y + 120 + int(math.sin(a) * 25)
+            shade = 80 + 175 * i // 7
+            self.screen.draw_circle((shade, shade, shade), (x, y), 5)
@@ -4,51 +4,60 @@ import math
 import random
 import os
 
-class MainMenu:
-    def __init__(self):
-        # Position de fenêtre avant d'initialiser pygame
-        os.environ['SDL_VIDEO_WINDOW_POS'] = '5,38'
-        
-        pygame.init()
-        
-        # Récupérer la taille de l'écran
-        info = pygame.display.Info()
-        screen_width = info.current_w
-        screen_height = info.current_h
-        
-        # Marges comme dans test_black_screen
-        margin_sides = 5
-        margin_top = 30
-        margin_bottom = 60
-        
-        # Calculer les dimensions de la fenêtre
-        window_width = screen_width - (margin_sides * 2)
-        window_height = screen_height - (margin_top + margin_bottom)
-        
-        # Créer la fenêtre
-        self.screen = pygame.display.set_mode((window_width, window_height))
-        pygame.display.set_caption("Pokémon Game")
+try:
+    from utils.ParticleSystem import ParticleSystem
+except ImportError:  # NumPy absent : pas de particules
+    ParticleSystem = None
+from utils.Display import Display
+from utils.SceneManager import Scene
+from utils.ProfileManager import ProfileManager
+from utils.AssetManager import AssetManager
+from utils.Log import Log
+
+class MainMenu(Scene):
+    BACKGROUND = "src/assets/pokemon_backgroundfinale.jpg"
+    POKEMON_3D = "src/assets/pokemon3D2.png"
+
+    @staticmethod
+    def load_jobs(screen):
+        """Images de l'écran titre, pour l'écran de chargement du démarrage"""
+        return [
+            AssetManager.image_job(MainMenu.BACKGROUND),
+            AssetManager.image_job(MainMenu.BACKGROUND, screen.get_size()),
+            AssetManager.image_job(MainMenu.POKEMON_3D, (800, 400), alpha=True)
+        ]
+
+    def __init__(self, screen=None):
+        if screen is None:
+            # Lancé sans écran de chargement : créer la fenêtre
+            # (résolution logique fixe selon le preset de qualité)
+            Display.init()
+            screen = Display.create_window()
+        super().__init__(screen)
+        window_width, window_height = self.screen.get_size()
         
         # Garder les dimensions pour le reste du code
         self.current_width = window_width
         self.current_height = window_height
         
         try:
-            # Charger et redimensionner l'image de fond
-            self.background = pygame.image.load("src/assets/pokemon_backgroundfinale.jpg").convert_alpha()
-            self.background = pygame.transform.scale(self.background, (window_width, window_height))
+            # Charger et redimensionner l'image de fond (original gardé pour les redimensionnements)
+            self.background_source = AssetManager.image(MainMenu.BACKGROUND)
+            self.background = AssetManager.image(MainMenu.BACKGROUND, (window_width, window_height))
             
             # Charger le Pokémon 3D
-            self.pokemon_3d = pygame.image.load("src/assets/pokemon3D2.png").convert_alpha()
-            self.pokemon_3d = pygame.transform.scale(self.pokemon_3d, (800, 400))
+            self.pokemon_3d = AssetManager.image(MainMenu.POKEMON_3D, (800, 400), alpha=True)
             self.pokemon_pos = [window_width//2 - 400, -20]
+            self.pokemon_size = (800, 400)
             self.pokemon_float = 0
             self.pokemon_float_speed = 0.05
             
         except Exception as e:
-            print(f"Erreur lors du chargement de l'image de fond: {e}")
-            self.background = pygame.Surface((window_width, window_height))
-            self.background.fill((0, 0, 0))
+            Log.error("ressources", "Erreur lors du chargement de l'image de fond: {}", e)
+            self.background_source = pygame.Surface((window_width, window_height))
+            self.background_source.fill((0, 0, 0))
+            self.background = self.background_source
+            self.pokemon_3d = None
         
         # Couleurs
         self.WHITE = (255, 255, 255)
@@ -66,8 +75,12 @@ class MainMenu:
         ]
         self.selected = 0
         
-        # Police
-        self.font = pygame.font.Font(None, 96)
+        # Saisie du nom du dresseur (Nouvelle Partie)
+        self.entering_name = False
+        self.input_text = ""
+        
+        # Police (réduite si la hauteur logique est plus petite que la mise en page d'origine)
+        self.font = AssetManager.font(None, int(96 * min(1.0, window_height / 1010)))
         
         # Effets visuels
         self.glow_color = (0, 255, 255)  # Cyan pour l'effet cyberpunk
@@ -88,7 +101,6 @@ class MainMenu:
         # Effets d'animation avancés
         self.pokemon_rotation = 0  # Rotation du Pokémon
         self.pokemon_scale = 1.0   # Pour l'effet de "respiration"
-        self.particle_list = []    # Particules autour du Pokémon
         self.glow_radius = 50      # Halo lumineux
         
         # Couleurs pour les effets
@@ -99,38 +111,49 @@ class MainMenu:
             (0, 255, 128)   # Vert néon
         ]
         
+        # Particules lumineuses autour du Pokémon (None si NumPy n'est pas installé)
+        self.particles = None
+        if ParticleSystem:
+            self.particles = ParticleSystem(1500, self.PARTICLE_COLORS, sizes=(2, 4, 6),
+                                            glow=True, blend=pygame.BLEND_ADD)
+        
     def draw_cyberpunk_box(self, surface, rect, color, glow=False):
         """Dessine une boîte style cyberpunk"""
         # Contour principal
-        pygame.draw.rect(surface, color, rect, border_radius=10)
+        surface.draw_rect(color, rect, border_radius=10)
         
         # Effet de coin cyberpunk
         corner_size = 20
         line_color = (0, 255, 255) if glow else (100, 100, 100)
         
         # Coins supérieurs
-        pygame.draw.line(surface, line_color, (rect.left, rect.top + corner_size),
+        surface.draw_line(line_color, (rect.left, rect.top + corner_size),
                         (rect.left, rect.top), 3)
-        pygame.draw.line(surface, line_color, (rect.left, rect.top),
+        surface.draw_line(line_color, (rect.left, rect.top),
                         (rect.left + corner_size, rect.top), 3)
         
-        pygame.draw.line(surface, line_color, (rect.right - corner_size, rect.top),
+        surface.draw_line(line_color, (rect.right - corner_size, rect.top),
                         (rect.right, rect.top), 3)
-        pygame.draw.line(surface, line_color, (rect.right, rect.top),
+        surface.draw_line(line_color, (rect.right, rect.top),
                         (rect.right, rect.top + corner_size), 3)
 
-    def create_particle(self):
-        """Crée une particule d'effet"""
-        return {
-            'pos': [self.pokemon_pos[0] + self.pokemon_size[0]//2,
-                    self.pokemon_pos[1] + self.pokemon_size[1]//2],
-            'vel': [random.uniform(-2, 2), random.uniform(-2, 2)],
-            'timer': random.uniform(0, 100),
-            'color': random.choice(self.PARTICLE_COLORS),
-            'size': random.randint(2, 6)
-        }
+    def update(self, dt):
+        """Émet et anime les particules autour du Pokémon 3D"""
+        if not (self.particles and self.pokemon_3d):
+            return
+        dt = min(0.1, dt / 1000)
+        center_x = self.pokemon_pos[0] + self.pokemon_size[0]//2
+        center_y = self.pokemon_pos[1] + self.pokemon_size[1]//2
+        self.particles.emit_rate(300, dt, center_x, center_y,
+                                 spread=(self.pokemon_size[0]//3, self.pokemon_size[1]//3),
+                                 velocity=((-60, 60), (-80, 20)), life=(1.0, 3.0))
+        self.particles.update(dt)
 
     def draw(self):
+        if self.entering_name:
+            self.draw_name_entry()
+            return
+        
         # Remplir l'écran en noir d'abord pour éviter les bordures blanches
         self.screen.fill(self.BLACK)
         
@@ -144,158 +167,159 @@ class MainMenu:
                 offset_y = math.sin(self.pokemon_float) * 20
                 pokemon_y = self.pokemon_pos[1] + offset_y
                 self.screen.blit(self.pokemon_3d, (self.pokemon_pos[0], pokemon_y))
+                
+                # Halo de particules
+                if self.particles:
+                    self.particles.draw(self.screen)
         
         # Dessiner les options du menu
         for i, option in enumerate(self.options):
             # Texte en bleu Pokémon
             color = self.POKEMON_BLUE_LIGHT if i == self.selected else self.POKEMON_BLUE
-            text = self.font.render(option, True, color)
-            text_rect = text.get_rect(center=(self.current_width//2, 500 + i * 120))
+            text = self.screen.text(self.font, option, color)
+            text_rect = text.get_rect(center=self.option_rect(i).center)
             
             # Rectangle jaune Pokémon
             box_rect = text_rect.inflate(60, 40)
             if i == self.selected:
                 box_rect = text_rect.inflate(80, 50)
-                pygame.draw.rect(self.screen, self.POKEMON_YELLOW, box_rect, border_radius=15)
-                pygame.draw.rect(self.screen, self.POKEMON_BLUE_LIGHT, box_rect, 3, border_radius=15)
+                self.screen.draw_rect(self.POKEMON_YELLOW, box_rect, border_radius=15)
+                self.screen.draw_rect(self.POKEMON_BLUE_LIGHT, box_rect, 3, border_radius=15)
             else:
-                pygame.draw.rect(self.screen, self.POKEMON_YELLOW, box_rect, border_radius=10)
+                self.screen.draw_rect(self.POKEMON_YELLOW, box_rect, border_radius=10)
             
             # Afficher le texte
             self.screen.blit(text, text_rect)
+    
+    def on_resize(self):
+        """Adapte le fond à la nouvelle taille d'écran (mode natif)"""
+        size = self.screen.get_size()
+        if size != (self.current_width, self.current_height):
+            self.current_width, self.current_height = size
+            self.background = AssetManager.image(MainMenu.BACKGROUND, size)
+            if self.pokemon_3d:
+                self.pokemon_pos[0] = self.current_width//2 - self.pokemon_size[0]//2
+    
+    def option_rect(self, index):
+        """Rectangle du texte d'une option (la boîte cliquable est ce rectangle agrandi)"""
+        start_y = int(self.current_height * 0.5)
+        step = min(120, (self.current_height * 0.92 - start_y) / max(1, len(self.options) - 1))
+        text_rect = self.screen.text(self.font, self.options[index], (0,0,0)).get_rect(
+            center=(self.current_width//2, int(start_y + index * step)))
+        return text_rect
+
+    def choose(self, index):
+        """Action d'une option du menu"""
+        option = self.options[index]
+        if option == "Nouvelle Partie":
+            self.entering_name = True
+            self.input_text = ""
+        elif option == "Charger Partie":
+            if ProfileManager.profile_count() > 1:
+                # Plusieurs dresseurs (stockage SQLite) : choisir dans le classement
+                from gui.menu.profile_selection import ProfileSelection
+                self.manager.push(self.manager.scene("profile_selection", lambda: ProfileSelection(self.screen)))
+                return
+            profile = ProfileManager.load_profile()
+            if profile:
+                self.open_game_menu(profile)
+            else:
+                self.manager.show_message("Aucune sauvegarde trouvée !")
+        elif option == "Quitter":
+            self.manager.quit()
+    
+    def on_resume(self, result):
+        if isinstance(result, dict):
+            # Dresseur choisi dans ProfileSelection
+            self.open_game_menu(result)
+    
+    def open_game_menu(self, profile):
+        from gui.menu.game_menu import GameMenu
+        from utils.SpriteManager import SpriteManager
+        game_menu = self.manager.scene("game_menu", lambda: GameMenu(self.screen, SpriteManager(), profile))
+        game_menu.profile = profile
+        self.manager.push(game_menu)
+    
+    def handle_event(self, event):
+        if self.entering_name:
+            self.handle_name_event(event)
+            
+        # Ajouter la gestion de la souris
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Clic gauche
+                mouse_pos = event.pos
+                for i, option in enumerate(self.options):
+                    text_rect = self.option_rect(i)
+                    box_rect = text_rect.inflate(60, 40)
+                    if box_rect.collidepoint(mouse_pos):
+                        self.choose(i)
+                        break
         
-        pygame.display.flip()
-        
-    def toggle_fullscreen(self):
-        self.is_fullscreen = not self.is_fullscreen
-        if self.is_fullscreen:
-            # Passer en plein écran
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-            # Obtenir les dimensions réelles de l'écran
-            info = pygame.display.Info()
-            self.current_width = info.current_w
-            self.current_height = info.current_h
-            # Redimensionner le fond pour couvrir tout l'écran
-            self.background = pygame.transform.scale(self.background, (self.current_width, self.current_height))
-        else:
-            # Revenir en mode fenêtré
-            self.screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
-            self.current_width = window_width
-            self.current_height = window_height
-            self.background = pygame.transform.scale(self.background, (window_width, window_height))
-        
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "QUIT"
-                    
-                # Gérer le redimensionnement
-                elif event.type == pygame.VIDEORESIZE:
-                    # S'assurer que la fenêtre ne soit pas plus petite que le minimum
-                    width = max(self.min_width, event.w)
-                    height = max(self.min_height, event.h)
-                    self.current_width = width
-                    self.current_height = height
-                    self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
-                    # Redimensionner le background
-                    self.background = pygame.transform.scale(self.background, (width, height))
-                    
-                # Ajouter la gestion de la souris
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
-                        mouse_pos = pygame.mouse.get_pos()
-                        for i, option in enumerate(self.options):
-                            text_rect = self.font.render(option, True, (0,0,0)).get_rect(center=(self.current_width//2, 500 + i * 120))
-                            box_rect = text_rect.inflate(60, 40)
-                            if box_rect.collidepoint(mouse_pos):
-                                if i == 0:
-                                    return "NEW_GAME"
-                                elif i == 1:
-                                    return "LOAD_GAME"
-                                elif i == 2:
-                                    return "OPTIONS"
-                                elif i == 3:
-                                    return "QUIT"
-                
-                # Ajouter le survol de la souris
-                elif event.type == pygame.MOUSEMOTION:
-                    mouse_pos = pygame.mouse.get_pos()
-                    for i, option in enumerate(self.options):
-                        text_rect = self.font.render(option, True, (0,0,0)).get_rect(center=(self.current_width//2, 500 + i * 120))
-                        box_rect = text_rect.inflate(60, 40)
-                        if box_rect.collidepoint(mouse_pos):
-                            self.selected = i
-                            break
-                    
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F11:  # F11 pour basculer plein écran
-                        self.toggle_fullscreen()
-                    elif event.key == pygame.K_UP:
-                        self.selected = (self.selected - 1) % len(self.options)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected = (self.selected + 1) % len(self.options)
-                    elif event.key == pygame.K_RETURN:
-                        if self.selected == 0:
-                            return "NEW_GAME"
-                        elif self.selected == 1:
-                            return "LOAD_GAME"
-                        elif self.selected == 2:
-                            return "OPTIONS"
-                        elif self.selected == 3:
-                            return "QUIT"
+        # Ajouter le survol de la souris
+        elif event.type == pygame.MOUSEMOTION:
+            mouse_pos = event.pos
+            for i, option in enumerate(self.options):
+                text_rect = self.option_rect(i)
+                box_rect = text_rect.inflate(60, 40)
+                if box_rect.collidepoint(mouse_pos):
+                    self.selected = i
+                    break
             
-            self.draw() 
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key == pygame.K_DOWN:
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key == pygame.K_RETURN:
+                self.choose(self.selected)
+
+    def handle_name_event(self, event):
+        """Saisie du nom du dresseur"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN and self.input_text:
+                if not ProfileManager.create_new_profile(self.input_text):
+                    # Ne jamais écraser la partie d'un autre joueur : on reste sur la saisie
+                    self.manager.show_message(f"{self.input_text} existe déjà : choisissez un autre nom")
+                    return
+                self.entering_name = False
+                self.open_game_menu(ProfileManager.load_profile())
+            elif event.key == pygame.K_ESCAPE:
+                self.entering_name = False
+            elif event.key == pygame.K_BACKSPACE:
+                self.input_text = self.input_text[:-1]
+            elif event.unicode and event.unicode.isprintable():
+                self.input_text += event.unicode
 
-    def ask_trainer_name(self):
-        """Demande et retourne le nom du dresseur"""
-        input_text = ""
-        input_active = True
+    def draw_name_entry(self):
+        """Écran de saisie du nom, dans le même style que le menu"""
+        # Garder le même fond et style
+        self.screen.blit(self.background, (0, 0))
         
-        while input_active:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN and input_text:
-                        return input_text
-                    elif event.key == pygame.K_ESCAPE:
-                        return None
-                    elif event.key == pygame.K_BACKSPACE:
-                        input_text = input_text[:-1]
-                    else:
-                        input_text += event.unicode
-            
-            # Garder le même fond et style
-            self.screen.blit(self.background, (0, 0))
-            
-            # Animation du Pokémon 3D
+        # Animation du Pokémon 3D
+        if self.pokemon_3d:
             self.pokemon_float += self.pokemon_float_speed
             offset_y = math.sin(self.pokemon_float) * 20
             pokemon_y = self.pokemon_pos[1] + offset_y
             self.screen.blit(self.pokemon_3d, (self.pokemon_pos[0], pokemon_y))
-            
-            # Titre avec le même style
-            title = self.font.render("Entrez votre nom :", True, self.POKEMON_BLUE)
-            title_rect = title.get_rect(center=(self.current_width//2, 500))
-            
-            # Rectangle jaune autour du titre
-            box_rect = title_rect.inflate(60, 40)
-            pygame.draw.rect(self.screen, self.POKEMON_YELLOW, box_rect, border_radius=15)
-            
-            # Afficher le titre
-            self.screen.blit(title, title_rect)
-            
-            # Zone de saisie avec le même style
-            input_surface = self.font.render(input_text + "▌", True, self.POKEMON_BLUE)
-            input_rect = input_surface.get_rect(center=(self.current_width//2, 600))
-            
-            # Rectangle jaune autour de la saisie
-            input_box_rect = input_rect.inflate(60, 40)
-            pygame.draw.rect(self.screen, self.POKEMON_YELLOW, input_box_rect, border_radius=15)
-            
-            # Afficher la saisie
-            self.screen.blit(input_surface, input_rect)
-            
-            pygame.display.flip() 
\ No newline at end of file
+        
+        # Titre avec le même style
+        title = self.screen.text(self.font, "Entrez votre nom :", self.POKEMON_BLUE)
+        title_rect = title.get_rect(center=(self.current_width//2, int(self.current_height * 0.5)))
+        
+        # Rectangle jaune autour du titre
+        box_rect = title_rect.inflate(60, 40)
+        self.screen.draw_rect(self.POKEMON_YELLOW, box_rect, border_radius=15)
+        
+        # Afficher le titre
+        self.screen.blit(title, title_rect)
+        
+        # Zone de saisie avec le même style
+        input_surface = self.screen.text(self.font, self.input_text + "▌", self.POKEMON_BLUE)
+        input_rect = input_surface.get_rect(center=(self.current_width//2, int(self.current_height * 0.5) + 100))
+        
+        # Rectangle jaune autour de la saisie
+        input_box_rect = input_rect.inflate(60, 40)
+        self.screen.draw_rect(self.POKEMON_YELLOW, input_box_rect, border_radius=15)
+        
+        # Afficher la saisie
+        self.screen.blit(input_surface, input_rect)
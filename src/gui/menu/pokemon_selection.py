@@ -4,15 +4,39 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 import pygame
 from data.pokemon_data import SPECIES_DATA, POKEMON_NAMES_FR, TYPE_NAMES_FR
 from utils.SpriteManager import SpriteManager
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.FrameProfiler import FrameProfiler
+from utils.Log import Log
+
+class PokemonSelection(Scene):
+    BACKGROUND = os.path.join("src", "assets", "pokemon_backgroundfinale.jpg")
+
+    @staticmethod
+    def load_jobs(screen):
+        """Fond et sprites statiques de tous les Pokémon, pour l'écran de chargement"""
+        owner = PokemonSelection.__name__
+        sprite_manager = SpriteManager(owner)
+        jobs = [AssetManager.image_job(PokemonSelection.BACKGROUND, screen.get_size(), owner=owner)]
+        for name in SPECIES_DATA:
+            jobs.append(sprite_manager.sprite_job(POKEMON_NAMES_FR.get(name.lower(), name)))
+        return jobs
+
+    @staticmethod
+    def loading_screen(manager, screen):
+        """Écran de chargement qui construit (ou réutilise) la sélection une fois les sprites lus"""
+        from gui.menu.loading_screen import LoadingScreen
+        return LoadingScreen(screen, PokemonSelection.load_jobs(screen),
+                             lambda: manager.scene("pokemon_selection", lambda: PokemonSelection(screen)),
+                             "Pokémon")
 
-class PokemonSelection:
     def __init__(self, screen):
-        self.screen = screen
+        super().__init__(screen)
         self.current_width = screen.get_width()
         self.current_height = screen.get_height()
         
         # Initialiser le gestionnaire de sprites
-        self.sprite_manager = SpriteManager()
+        self.sprite_manager = SpriteManager(self.asset_owner)
         
         # Chemin de base pour les assets
         self.assets_path = os.path.join("src", "assets")
@@ -25,12 +49,8 @@ class PokemonSelection:
         self.POKEMON_BLUE_LIGHT = (0, 90, 255)
         
         # Police
-        try:
-            font_path = os.path.join("src", "assets", "fonts", "pokemon.ttf")
-            self.font = pygame.font.Font(font_path, 36)
-        except Exception as e:
-            print(f"Erreur lors du chargement de la police: {e}")
-            self.font = pygame.font.Font(None, 36)
+        font_path = os.path.join("src", "assets", "fonts", "pokemon.ttf")
+        self.font = AssetManager.font(font_path, 36, self.asset_owner)
         
         # Charger les données des Pokémon
         self.available_pokemon = []
@@ -39,17 +59,19 @@ class PokemonSelection:
         
         # Fond
         try:
-            background_path = os.path.join(self.assets_path, "pokemon_backgroundfinale.jpg")
-            self.background = pygame.image.load(background_path).convert_alpha()
-            self.background = pygame.transform.scale(self.background, (self.current_width, self.current_height))
+            self.background = AssetManager.image(PokemonSelection.BACKGROUND, (self.current_width, self.current_height),
+                                                 owner=self.asset_owner)
         except Exception as e:
-            print(f"Erreur lors du chargement de l'image de fond: {e}")
+            Log.error("ressources", "Erreur lors du chargement de l'image de fond: {}", e)
             self.background = None
         
         # Ajout des variables pour le défilement
         self.scroll_y = 0
         self.scroll_speed = 30
-        self.max_scroll = 0  # Sera calculé en fonction du nombre de Pokémon
+        
+        # Scroll maximum selon le nombre de lignes (4 Pokémon par ligne)
+        rows = (len(self.available_pokemon) + 3) // 4
+        self.max_scroll = -(rows * 200 - (self.current_height - 200))  # Espace pour le bouton
         
         # Bouton de confirmation
         self.confirm_button = pygame.Rect(
@@ -60,13 +82,8 @@ class PokemonSelection:
         )
         
         # Police plus adaptée pour les stats
-        try:
-            self.title_font = pygame.font.Font(font_path, 40)
-            self.stats_font = pygame.font.Font(font_path, 25)
-        except Exception as e:
-            print(f"Erreur lors du chargement de la police: {e}")
-            self.title_font = pygame.font.Font(None, 40)
-            self.stats_font = pygame.font.Font(None, 25)
+        self.title_font = AssetManager.font(font_path, 40, self.asset_owner)
+        self.stats_font = AssetManager.font(font_path, 25, self.asset_owner)
 
     def load_pokemon_data(self):
         """Charge les données et sprites des Pokémon"""
@@ -90,10 +107,10 @@ class PokemonSelection:
                     }
                     self.available_pokemon.append(pokemon)
                 else:
-                    print(f"Sprite non trouvé pour {name}")
+                    Log.warning("sprites", "Sprite non trouvé pour {}", name)
                     
             except Exception as e:
-                print(f"Erreur lors du chargement de {name}: {e}")
+                Log.error("sprites", "Erreur lors du chargement de {}: {}", name, e)
 
     def get_pokemon_id(self, name):
         """Retourne l'ID du Pokémon pour l'API"""
@@ -109,26 +126,23 @@ class PokemonSelection:
         return pokemon_ids.get(name, 1)
 
     def get_pokemon_data(self, pokemon_name_fr):
-        print(f"\nDEBUG: Recherche données pour {pokemon_name_fr}")
-        print(f"SPECIES_DATA keys: {list(SPECIES_DATA.keys())}")
-        print(f"POKEMON_NAMES_FR: {POKEMON_NAMES_FR}")
+        Log.debug("menu", "Recherche données pour {}", pokemon_name_fr)
         
         pokemon_name_en = None
         for en_name, fr_name in POKEMON_NAMES_FR.items():
-            print(f"Comparaison: {fr_name.lower()} == {pokemon_name_fr.lower()}")
             if fr_name.lower() == pokemon_name_fr.lower():
                 pokemon_name_en = en_name
-                print(f"Match trouvé! {pokemon_name_fr} -> {pokemon_name_en}")
+                Log.debug("menu", "Nom trouvé : {} -> {}", pokemon_name_fr, pokemon_name_en)
                 break
         
         if pokemon_name_en:
-            print(f"Recherche dans SPECIES_DATA avec clé: {pokemon_name_en.lower()}")
             if pokemon_name_en.lower() in SPECIES_DATA:
                 data = SPECIES_DATA[pokemon_name_en.lower()].copy()
-                print(f"Données trouvées: {data}")
+                Log.debug("menu", "Données trouvées: {}", data)
                 return data
         
-        print(f"❌ Aucune donnée trouvée pour {pokemon_name_fr}")
+        Log.warning("menu", "Aucune donnée trouvée pour {} (noms connus : {})",
+                    pokemon_name_fr, list(POKEMON_NAMES_FR.values()))
         return None
 
     def draw(self):
@@ -136,12 +150,12 @@ class PokemonSelection:
         self.screen.fill(self.BLACK)
         
         # Titre
-        title = self.font.render("Sélectionnez 6 Pokémon", True, self.POKEMON_BLUE)
+        title = self.screen.text(self.font, "Sélectionnez 6 Pokémon", self.POKEMON_BLUE)
         title_rect = title.get_rect(center=(self.current_width//2, 50))
         self.screen.blit(title, title_rect)
         
         # Nombre de Pokémon sélectionnés
-        selected_text = self.font.render(f"Sélectionnés: {len(self.selected_pokemon)}/6", True, self.WHITE)
+        selected_text = self.screen.text(self.font, f"Sélectionnés: {len(self.selected_pokemon)}/6", self.WHITE)
         self.screen.blit(selected_text, (20, 20))
         
         # Afficher les Pokémon disponibles avec défilement
@@ -153,106 +167,112 @@ class PokemonSelection:
             if y + 180 > 0 and y < self.current_height - 100:
                 # Cadre gris ou bleu clair si sélectionné
                 frame_rect = pygame.Rect(x, y, (self.current_width // 4) - 60, 180)
-                if pokemon in self.selected_pokemon:
-                    pygame.draw.rect(self.screen, (50, 100, 150), frame_rect, border_radius=10)  # Bleu foncé
-                    pygame.draw.rect(self.screen, self.POKEMON_BLUE, frame_rect, 3, border_radius=10)
-                else:
-                    pygame.draw.rect(self.screen, (100, 100, 100), frame_rect, border_radius=10)  # Gris foncé
+                with FrameProfiler.span("cadres"):
+                    if pokemon in self.selected_pokemon:
+                        self.screen.draw_rect((50, 100, 150), frame_rect, border_radius=10)  # Bleu foncé
+                        self.screen.draw_rect(self.POKEMON_BLUE, frame_rect, 3, border_radius=10)
+                    else:
+                        self.screen.draw_rect((100, 100, 100), frame_rect, border_radius=10)  # Gris foncé
                 
                 # Sprite
                 if pokemon['sprite']:
-                    sprite_rect = pokemon['sprite'].get_rect(center=(x + frame_rect.width//4, y + 60))
-                    self.screen.blit(pokemon['sprite'], sprite_rect)
+                    with FrameProfiler.span("sprites"):
+                        sprite_rect = pokemon['sprite'].get_rect(center=(x + frame_rect.width//4, y + 60))
+                        self.screen.blit(pokemon['sprite'], sprite_rect)
                 
-                # Stats complètes avec alignement
-                name = self.title_font.render(pokemon['name'], True, self.WHITE)
+                with FrameProfiler.span("textes"):
+                    # Stats complètes avec alignement
+                    name = self.screen.text(self.title_font, pokemon['name'], self.WHITE)
                 
-                # Stats alignées
-                types_formatted = ' / '.join(TYPE_NAMES_FR[t] for t in pokemon['data']['types'])
-                left_column = [
-                    f"Type: {types_formatted}",  # Première lettre en majuscule seulement
-                    f"HP: {pokemon['data']['max_hp']}",
-                    f"ATK: {pokemon['data']['attack']}",
-                    f"DEF: {pokemon['data']['defense']}"
-                ]
+                    # Stats alignées
+                    types_formatted = ' / '.join(TYPE_NAMES_FR[t] for t in pokemon['data']['types'])
+                    left_column = [
+                        f"Type: {types_formatted}",  # Première lettre en majuscule seulement
+                        f"HP: {pokemon['data']['max_hp']}",
+                        f"ATK: {pokemon['data']['attack']}",
+                        f"DEF: {pokemon['data']['defense']}"
+                    ]
                 
-                right_column = [
-                    f"Sp.ATK: {pokemon['data']['special_attack']}",
-                    f"Sp.DEF: {pokemon['data']['special_defense']}",
-                    f"SPD: {pokemon['data']['speed']}"
-                ]
+                    right_column = [
+                        f"Sp.ATK: {pokemon['data']['special_attack']}",
+                        f"Sp.DEF: {pokemon['data']['special_defense']}",
+                        f"SPD: {pokemon['data']['speed']}"
+                    ]
                 
-                # Position de départ pour les stats
-                left_x = x + 10
-                right_x = x + frame_rect.width//2 + 10
-                stats_y = y + 80  # Commencer sous le sprite
+                    # Position de départ pour les stats
+                    left_x = x + 10
+                    right_x = x + frame_rect.width//2 + 10
+                    stats_y = y + 80  # Commencer sous le sprite
                 
-                # Afficher le nom centré en haut
-                name_rect = name.get_rect(centerx=x + frame_rect.width//2, y=y + 10)
-                self.screen.blit(name, name_rect)
+                    # Afficher le nom centré en haut
+                    name_rect = name.get_rect(centerx=x + frame_rect.width//2, y=y + 10)
+                    self.screen.blit(name, name_rect)
                 
-                # Afficher les colonnes de stats
-                for i, text in enumerate(left_column):
-                    stat = self.stats_font.render(text, True, self.WHITE)
-                    self.screen.blit(stat, (left_x, stats_y + i * 25))
+                    # Afficher les colonnes de stats
+                    for i, text in enumerate(left_column):
+                        stat = self.screen.text(self.stats_font, text, self.WHITE)
+                        self.screen.blit(stat, (left_x, stats_y + i * 25))
                 
-                for i, text in enumerate(right_column):
-                    stat = self.stats_font.render(text, True, self.WHITE)
-                    self.screen.blit(stat, (right_x, stats_y + i * 25))
+                    for i, text in enumerate(right_column):
+                        stat = self.screen.text(self.stats_font, text, self.WHITE)
+                        self.screen.blit(stat, (right_x, stats_y + i * 25))
         
         # Bouton de confirmation (visible seulement si 6 Pokémon sont sélectionnés)
         if len(self.selected_pokemon) == 6:
-            pygame.draw.rect(self.screen, self.POKEMON_BLUE, self.confirm_button, border_radius=10)
-            confirm_text = self.font.render("Confirmer l'équipe", True, self.WHITE)
+            self.screen.draw_rect(self.POKEMON_BLUE, self.confirm_button, border_radius=10)
+            confirm_text = self.screen.text(self.font, "Confirmer l'équipe", self.WHITE)
             text_rect = confirm_text.get_rect(center=self.confirm_button.center)
             self.screen.blit(confirm_text, text_rect)
 
-    def run(self):
-        # Calculer le scroll maximum
-        rows = (len(self.available_pokemon) + 3) // 4  # Nombre de lignes
-        self.max_scroll = -(rows * 200 - (self.current_height - 200))  # Espace pour le bouton
-        
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "QUIT"
-                    
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
-                        mouse_pos = pygame.mouse.get_pos()
-                        
-                        # Vérifier le clic sur le bouton de confirmation
-                        if len(self.selected_pokemon) == 6 and self.confirm_button.collidepoint(mouse_pos):
-                            from gui.menu.team_order import TeamOrderMenu
-                            # Passer uniquement les noms des Pokémon
-                            pokemon_names = [pokemon["name"] for pokemon in self.selected_pokemon]
-                            order_menu = TeamOrderMenu(self.screen, pokemon_names)
-                            return order_menu.run()
-                        
-                        # Sélection/Désélection des Pokémon
-                        for i, pokemon in enumerate(self.available_pokemon):
-                            x = (i % 4) * (self.current_width // 4) + 50
-                            y = (i // 4) * 200 + 100 + self.scroll_y
-                            rect = pygame.Rect(x, y, (self.current_width // 4) - 60, 180)
-                            
-                            if rect.collidepoint(mouse_pos):
-                                if pokemon not in self.selected_pokemon and len(self.selected_pokemon) < 6:
-                                    self.selected_pokemon.append(pokemon)
-                                elif pokemon in self.selected_pokemon:
-                                    self.selected_pokemon.remove(pokemon)
-                    
-                    elif event.button == 4:  # Molette vers le haut
-                        self.scroll_y = min(0, self.scroll_y + self.scroll_speed)
-                    elif event.button == 5:  # Molette vers le bas
-                        self.scroll_y = max(self.max_scroll, self.scroll_y - self.scroll_speed)
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Clic gauche
+                mouse_pos = event.pos
                 
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "BACK"
+                # Vérifier le clic sur le bouton de confirmation
+                if len(self.selected_pokemon) == 6 and self.confirm_button.collidepoint(mouse_pos):
+                    self.open_team_order()
+                    return
+                
+                # Sélection/Désélection des Pokémon
+                for i, pokemon in enumerate(self.available_pokemon):
+                    x = (i % 4) * (self.current_width // 4) + 50
+                    y = (i // 4) * 200 + 100 + self.scroll_y
+                    rect = pygame.Rect(x, y, (self.current_width // 4) - 60, 180)
+                    
+                    if rect.collidepoint(mouse_pos):
+                        if pokemon not in self.selected_pokemon and len(self.selected_pokemon) < 6:
+                            self.selected_pokemon.append(pokemon)
+                        elif pokemon in self.selected_pokemon:
+                            self.selected_pokemon.remove(pokemon)
             
-            self.draw()
-            pygame.display.flip() 
+            elif event.button == 4:  # Molette vers le haut
+                self.scroll_y = min(0, self.scroll_y + self.scroll_speed)
+            elif event.button == 5:  # Molette vers le bas
+                self.scroll_y = max(self.max_scroll, self.scroll_y - self.scroll_speed)
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop("BACK")
+
+    def reset(self):
+        """Nouvelle sélection : sprites et polices restent chargés"""
+        self.selected_pokemon = []
+        self.scroll_y = 0
+
+    def open_team_order(self):
+        """Passe à l'ordre de l'équipe (instance réutilisée, seule l'équipe change)"""
+        from gui.menu.team_order import TeamOrderMenu
+        # Passer uniquement les noms des Pokémon
+        pokemon_names = [pokemon["name"] for pokemon in self.selected_pokemon]
+        order_menu = self.manager.scene("team_order", lambda: TeamOrderMenu(self.screen, pokemon_names))
+        order_menu.set_team(pokemon_names)
+        self.manager.push(order_menu)
+
+    def on_resume(self, result):
+        if isinstance(result, list):
+            # Ordre confirmé et sauvegardé : retour au menu de jeu avec l'équipe
+            self.manager.pop(result)
 
     def get_ordered_team(self):
         return self.selected_pokemon 
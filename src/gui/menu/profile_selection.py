@@ -0,0 +1,137 @@
+import pygame
+from utils.ProfileManager import ProfileManager
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+
+
+class ProfileSelection(Scene):
+    """Choix du dresseur parmi les profils sauvegardés, sous forme de classement paginé
+
+    Chaque page est une requête indexée de PAGE_SIZE lignes (voir
+    SqliteProfileStore.leaderboard) : l'écran reste fluide avec des milliers de
+    profils. TAB change le tri (badges / score), GAUCHE/DROITE change de page.
+    """
+    PAGE_SIZE = 10
+    SORTS = ("badges", "score")
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        self.current_width = screen.get_width()
+        self.current_height = screen.get_height()
+
+        # Couleurs
+        self.WHITE = (255, 255, 255)
+        self.BLACK = (0, 0, 0)
+        self.POKEMON_YELLOW = (255, 236, 0)
+        self.POKEMON_BLUE = (0, 144, 255)
+        self.GRAY = (60, 60, 60)
+
+        # Police
+        font_path = "src/assets/fonts/pokemon.ttf"
+        self.title_font = AssetManager.font(font_path, 48, self.asset_owner)
+        self.font = AssetManager.font(font_path, 32, self.asset_owner)
+
+        self.row_height = 50
+        self.list_top = 160
+        self.reset()
+
+    def reset(self):
+        self.sort = ProfileSelection.SORTS[0]
+        self.cursors = []   # Dernière ligne de chaque page précédente
+        self.selected = 0
+        self.rows = []
+
+    def on_enter(self):
+        # Les scores ont pu changer depuis la dernière visite
+        self.load_page(self.cursors[-1] if self.cursors else None)
+
+    def load_page(self, after):
+        self.rows = ProfileManager.leaderboard(self.sort, ProfileSelection.PAGE_SIZE, after)
+        self.selected = min(self.selected, max(0, len(self.rows) - 1))
+
+    def next_page(self):
+        if len(self.rows) < ProfileSelection.PAGE_SIZE:
+            return
+        self.cursors.append(self.rows[-1])
+        previous = self.rows
+        self.load_page(self.rows[-1])
+        if not self.rows:
+            # Dernière page atteinte
+            self.cursors.pop()
+            self.rows = previous
+
+    def previous_page(self):
+        if self.cursors:
+            self.cursors.pop()
+            self.load_page(self.cursors[-1] if self.cursors else None)
+
+    def toggle_sort(self):
+        index = ProfileSelection.SORTS.index(self.sort)
+        self.sort = ProfileSelection.SORTS[(index + 1) % len(ProfileSelection.SORTS)]
+        self.cursors = []
+        self.selected = 0
+        self.load_page(None)
+
+    def row_rect(self, index):
+        return pygame.Rect(self.current_width//2 - 400, self.list_top + index * self.row_height, 800, self.row_height - 8)
+
+    def choose(self, index):
+        if index < len(self.rows):
+            profile = ProfileManager.switch_profile(self.rows[index][0])
+            if profile:
+                self.manager.pop(profile)
+
+    def draw(self):
+        self.screen.fill(self.BLACK)
+
+        # Titre et tri
+        title = self.screen.text(self.title_font, "Choisissez votre dresseur", self.POKEMON_BLUE)
+        self.screen.blit(title, title.get_rect(center=(self.current_width//2, 60)))
+        page = len(self.cursors) + 1
+        info = self.screen.text(self.font, f"Classement par {self.sort} - page {page}", self.WHITE)
+        self.screen.blit(info, info.get_rect(center=(self.current_width//2, 115)))
+
+        # Lignes du classement
+        first_rank = len(self.cursors) * ProfileSelection.PAGE_SIZE + 1
+        for i, (name, badges, score, _) in enumerate(self.rows):
+            rect = self.row_rect(i)
+            selected = i == self.selected
+            self.screen.draw_rect(self.POKEMON_YELLOW if selected else self.GRAY, rect, border_radius=10)
+            color = self.BLACK if selected else self.WHITE
+            rank = self.screen.text(self.font, f"{first_rank + i}.", color)
+            self.screen.blit(rank, (rect.x + 20, rect.y + 8))
+            label = self.screen.text(self.font, name, color)
+            self.screen.blit(label, (rect.x + 100, rect.y + 8))
+            stats = self.screen.text(self.font, f"{badges} badges   {score} pts", color)
+            self.screen.blit(stats, stats.get_rect(right=rect.right - 20, y=rect.y + 8))
+
+        # Aide
+        help_text = self.screen.text(self.font, "TAB : tri   GAUCHE/DROITE : page   ENTRÉE : jouer", self.GRAY)
+        self.screen.blit(help_text, help_text.get_rect(center=(self.current_width//2, self.current_height - 40)))
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop("BACK")
+            elif event.key == pygame.K_UP:
+                self.selected = max(0, self.selected - 1)
+            elif event.key == pygame.K_DOWN:
+                self.selected = min(len(self.rows) - 1, self.selected + 1)
+            elif event.key in (pygame.K_RIGHT, pygame.K_PAGEDOWN):
+                self.next_page()
+            elif event.key in (pygame.K_LEFT, pygame.K_PAGEUP):
+                self.previous_page()
+            elif event.key == pygame.K_TAB:
+                self.toggle_sort()
+            elif event.key == pygame.K_RETURN:
+                self.choose(self.selected)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for i in range(len(self.rows)):
+                if self.row_rect(i).collidepoint(event.pos):
+                    self.choose(i)
+                    break
+        elif event.type == pygame.MOUSEMOTION:
+            for i in range(len(self.rows)):
+                if self.row_rect(i).collidepoint(event.pos):
+                    self.selected = i
+                    break
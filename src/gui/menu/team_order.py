@@ -2,10 +2,13 @@ import pygame
 import os
 from utils.SpriteManager import SpriteManager
 from utils.ProfileManager import ProfileManager
+from utils.SceneManager import Scene
+from utils.AssetManager import AssetManager
+from utils.Log import Log
 
-class TeamOrderMenu:
+class TeamOrderMenu(Scene):
     def __init__(self, screen, selected_pokemon):
-        self.screen = screen
+        super().__init__(screen)
         self.current_width = screen.get_width()
         self.current_height = screen.get_height()
         
@@ -16,18 +19,27 @@ class TeamOrderMenu:
         self.GRAY = (100, 100, 100)
         
         # Police
-        try:
-            self.title_font = pygame.font.Font("src/assets/fonts/pokemon.ttf", 40)
-            self.font = pygame.font.Font("src/assets/fonts/pokemon.ttf", 25)
-        except:
-            self.title_font = pygame.font.Font(None, 40)
-            self.font = pygame.font.Font(None, 25)
+        self.title_font = AssetManager.font("src/assets/fonts/pokemon.ttf", 40, self.asset_owner)
+        self.font = AssetManager.font("src/assets/fonts/pokemon.ttf", 25, self.asset_owner)
         
         # Initialiser le sprite manager
-        self.sprite_manager = SpriteManager()
+        self.sprite_manager = SpriteManager(self.asset_owner)
         
         # Pokémon sélectionnés
         self.team = []
+        self.set_team(selected_pokemon)
+        
+        # Bouton de confirmation
+        self.confirm_button = pygame.Rect(
+            self.current_width//2 - 100,
+            self.current_height - 60,
+            200,
+            50
+        )
+        
+    def set_team(self, selected_pokemon):
+        """Remplace l'équipe à ordonner (l'instance est réutilisée d'une sélection à l'autre)"""
+        self.team = []
         for pokemon_name in selected_pokemon:  # selected_pokemon est déjà une liste de noms
             sprite = self.sprite_manager.get_sprite(
                 pokemon_name,  # On utilise directement le nom
@@ -42,28 +54,17 @@ class TeamOrderMenu:
         self.dragging = False
         self.drag_pokemon = None
         self.drag_pos = None
-        
-        # Bouton de confirmation
-        self.confirm_button = pygame.Rect(
-            self.current_width//2 - 100,
-            self.current_height - 60,
-            200,
-            50
-        )
-        
-        # On n'a plus besoin de recharger les sprites car ils sont déjà là !
-        # Supprimer tout le code de chargement des sprites ici
 
     def draw(self):
         self.screen.fill(self.BLACK)
         
         # Titre
-        title = self.title_font.render("Organisez votre équipe", True, self.POKEMON_BLUE)
+        title = self.screen.text(self.title_font, "Organisez votre équipe", self.POKEMON_BLUE)
         title_rect = title.get_rect(center=(self.current_width//2, 50))
         self.screen.blit(title, title_rect)
         
         # Instructions
-        instructions = self.font.render("Glissez-déposez les Pokémon pour changer leur ordre", True, self.WHITE)
+        instructions = self.screen.text(self.font, "Glissez-déposez les Pokémon pour changer leur ordre", self.WHITE)
         inst_rect = instructions.get_rect(center=(self.current_width//2, 100))
         self.screen.blit(instructions, inst_rect)
         
@@ -74,10 +75,10 @@ class TeamOrderMenu:
             
             # Cadre
             frame_rect = pygame.Rect(x - 50, y - 80, 100, 160)
-            pygame.draw.rect(self.screen, self.GRAY, frame_rect, border_radius=10)
+            self.screen.draw_rect(self.GRAY, frame_rect, border_radius=10)
             
             # Numéro de position
-            pos_text = self.font.render(f"#{i+1}", True, self.WHITE)
+            pos_text = self.screen.text(self.font, f"#{i+1}", self.WHITE)
             pos_rect = pos_text.get_rect(center=(x, y - 60))
             self.screen.blit(pos_text, pos_rect)
             
@@ -88,7 +89,7 @@ class TeamOrderMenu:
                 sprite_rect = pokemon['sprite'].get_rect(center=(x, y))
                 self.screen.blit(pokemon['sprite'], sprite_rect)
                 # Nom
-                name = self.font.render(pokemon['name'], True, self.WHITE)
+                name = self.screen.text(self.font, pokemon['name'], self.WHITE)
                 name_rect = name.get_rect(center=(x, y + 50))
                 self.screen.blit(name, name_rect)
         
@@ -98,8 +99,8 @@ class TeamOrderMenu:
             self.screen.blit(self.drag_pokemon['sprite'], sprite_rect)
         
         # Bouton de confirmation
-        pygame.draw.rect(self.screen, self.POKEMON_BLUE, self.confirm_button, border_radius=10)
-        confirm_text = self.font.render("Confirmer l'ordre", True, self.WHITE)
+        self.screen.draw_rect(self.POKEMON_BLUE, self.confirm_button, border_radius=10)
+        confirm_text = self.screen.text(self.font, "Confirmer l'ordre", self.WHITE)
         text_rect = confirm_text.get_rect(center=self.confirm_button.center)
         self.screen.blit(confirm_text, text_rect)
 
@@ -139,12 +140,11 @@ class TeamOrderMenu:
         profile = ProfileManager.load_profile()
         if profile:
             complete_team = []
-            print("Sauvegarde de l'équipe :")
             for pokemon in self.team:
                 # Convertir le nom en version anglaise pour la recherche
                 english_name = name_conversion.get(pokemon["name"], pokemon["name"].lower())
                 pokemon_data = SPECIES_DATA.get(english_name, {})
-                print(f"Pokemon: {pokemon['name']} ({english_name}), Data: {pokemon_data}")
+                Log.debug("sauvegarde", "Pokémon {} ({}) : {}", pokemon['name'], english_name, pokemon_data)
                 
                 if pokemon_data:
                     team_pokemon = {
@@ -175,7 +175,7 @@ class TeamOrderMenu:
                     
                     complete_team.append(team_pokemon)
             
-            print(f"Équipe complète à sauvegarder : {complete_team}")
+            Log.debug("sauvegarde", "Équipe complète à sauvegarder : {}", complete_team)
             profile["current_team"] = complete_team
             ProfileManager.save_profile(profile)
     
@@ -186,60 +186,53 @@ class TeamOrderMenu:
         moves = pokemon_data.get("moves", [])
         return [{"name": move, "pp": 30, "max_pp": 30} for move in moves]
 
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "QUIT"
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Clic gauche
+                mouse_pos = event.pos
                 
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Clic gauche
-                        mouse_pos = pygame.mouse.get_pos()
-                        
-                        # Si on clique sur le bouton de confirmation
-                        if self.confirm_button.collidepoint(mouse_pos):
-                            self.save_team()  # Utiliser la nouvelle méthode
-                            return "BACK"
-                        
-                        # Vérifier si on clique sur un Pokémon
-                        for i in range(len(self.team)):
-                            x = (self.current_width // 6) * i + 100
-                            y = self.current_height // 2
-                            rect = pygame.Rect(x - 50, y - 80, 100, 160)
-                            
-                            if rect.collidepoint(mouse_pos):
-                                self.dragging = True
-                                self.selected_index = i
-                                self.drag_pokemon = self.team[i]
-                                self.drag_pos = mouse_pos
+                # Si on clique sur le bouton de confirmation
+                if self.confirm_button.collidepoint(mouse_pos):
+                    self.save_team()  # Utiliser la nouvelle méthode
+                    self.manager.pop(list(self.team))
+                    return
                 
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if event.button == 1 and self.dragging:
-                        mouse_pos = pygame.mouse.get_pos()
-                        
-                        # Vérifier sur quel emplacement on relâche
-                        for i in range(6):
-                            x = (self.current_width // 6) * i + 100
-                            y = self.current_height // 2
-                            rect = pygame.Rect(x - 50, y - 80, 100, 160)
-                            
-                            if rect.collidepoint(mouse_pos):
-                                # Échanger les positions
-                                self.team[self.selected_index], self.team[i] = self.team[i], self.team[self.selected_index]
-                                break
-                        
-                        self.dragging = False
-                        self.selected_index = None
-                        self.drag_pokemon = None
+                # Vérifier si on clique sur un Pokémon
+                for i in range(len(self.team)):
+                    x = (self.current_width // 6) * i + 100
+                    y = self.current_height // 2
+                    rect = pygame.Rect(x - 50, y - 80, 100, 160)
+                    
+                    if rect.collidepoint(mouse_pos):
+                        self.dragging = True
+                        self.selected_index = i
+                        self.drag_pokemon = self.team[i]
+                        self.drag_pos = mouse_pos
+        
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1 and self.dragging:
+                mouse_pos = event.pos
                 
-                elif event.type == pygame.MOUSEMOTION:
-                    if self.dragging:
-                        self.drag_pos = event.pos
+                # Vérifier sur quel emplacement on relâche
+                for i in range(6):
+                    x = (self.current_width // 6) * i + 100
+                    y = self.current_height // 2
+                    rect = pygame.Rect(x - 50, y - 80, 100, 160)
+                    
+                    if rect.collidepoint(mouse_pos):
+                        # Échanger les positions
+                        self.team[self.selected_index], self.team[i] = self.team[i], self.team[self.selected_index]
+                        break
                 
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "BACK"
-            
-            self.draw()
-            pygame.display.flip() 
\ No newline at end of file
+                self.dragging = False
+                self.selected_index = None
+                self.drag_pokemon = None
+        
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                self.drag_pos = event.pos
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                # Retour à la sélection, qui garde les Pokémon choisis
+                self.manager.pop("BACK")
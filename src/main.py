@@ -1,108 +1,147 @@
+from utils.StartupTimeline import StartupTimeline  # En premier : origine des mesures de démarrage
+import sys
+from utils.StartupProfiler import StartupProfiler
+StartupProfiler.start_from_argv(sys.argv)  # Avant les autres imports : ils font partie du démarrage
+import argparse
+import os
 from gui.menu.main_menu import MainMenu
-from gui.menu.game_menu import GameMenu
+from gui.menu.loading_screen import LoadingScreen
+from utils.Display import Display
+from utils.SceneManager import SceneManager
+from utils.FrameRecorder import FrameRecorder
 from utils.ProfileManager import ProfileManager
-from gui.menu.league_selection import LeagueSelection
-from gui.menu.pokemon_selection import PokemonSelection
-from gui.menu.team_order import TeamOrderMenu
-from gui.battle.battle_scene import BattleScene
-from utils.SpriteManager import SpriteManager
+from utils.LatencyTracer import LatencyTracer
+from utils.FrameProfiler import FrameProfiler
+from utils.Log import Log
+from utils.Metrics import Metrics
+from utils.AssetManager import AssetManager
+from utils.GameClock import GameClock
+from utils.InputRecorder import InputRecorder
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pokémon Game")
+    parser.add_argument("--quality", choices=list(Display.QUALITY_PRESETS), default=Display.quality,
+                        help="résolution logique du rendu (native = taille du bureau, sans mise à l'échelle)")
+    parser.add_argument("--fullscreen", action="store_true", help="démarrer en plein écran")
+    parser.add_argument("--renderer", choices=Display.BACKENDS, default=Display.backend,
+                        help="rendu logiciel ou textures SDL2 (accélérées si possible)")
+    parser.add_argument("--render-driver", help="forcer un driver SDL pour le backend texture (ex: software)")
+    parser.add_argument("--record-battles", metavar="DOSSIER",
+                        help="enregistrer chaque combat dans ce dossier (F9 pour basculer en combat)")
+    parser.add_argument("--record-format", choices=["gif", "png"], default=FrameRecorder.FORMAT,
+                        help="GIF animé ou séquence PNG")
+    parser.add_argument("--profiles", choices=ProfileManager.BACKENDS, default=ProfileManager.BACKEND,
+                        help="stockage des profils : un fichier JSON ou une base SQLite multi-dresseurs")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="afficher les étapes du démarrage jusqu'à l'écran titre interactif")
+    parser.add_argument("--startup-budget", type=int, default=StartupTimeline.BUDGET_MS, metavar="MS",
+                        help="budget de démarrage comparé dans le rapport")
+    parser.add_argument("--import-time", action="store_true",
+                        help="relancer le jeu sous -X importtime et résumer les imports les plus lents")
+    parser.add_argument("--trace-latency", action="store_true",
+                        help="mesurer la latence entrée -> affichage par scène (F10 : relevé en direct)")
+    parser.add_argument("--profile", action="store_true",
+                        help="mesurer les phases de chaque frame et les zones des scènes (F8 : graphe)")
+    parser.add_argument("--profile-trace", metavar="FICHIER",
+                        help="écrire une trace Chrome (chrome://tracing, Perfetto) à la sortie du jeu")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="écrire régulièrement les mesures du jeu dans ce fichier JSON (F7 : page à l'écran)")
+    parser.add_argument("--metrics-interval", type=float, default=Metrics.INTERVAL, metavar="SECONDES",
+                        help="intervalle entre deux instantanés des mesures")
+    parser.add_argument("--memory-budget", action="append", default=[], metavar="[TYPE=]MO",
+                        help="budget mémoire des ressources, total ou par type (image, sprite, sound), répétable")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="afficher la mémoire des ressources par type et par scène à la sortie du jeu")
+    parser.add_argument("--record-input", metavar="FICHIER",
+                        help="enregistrer les entrées de la session pour la rejouer (utils/replay_session.py)")
+    parser.add_argument("--seed", type=int, help="graine du hasard du jeu (combats reproductibles)")
+    parser.add_argument("--log-level", choices=list(Log.NAMES.values()), default=Log.NAMES[Log.LEVEL],
+                        help="niveau minimal des messages affichés dans la console")
+    parser.add_argument("--log", action="append", default=[], metavar="CATÉGORIE=NIVEAU",
+                        help="niveau pour une catégorie (ex: combat=debug), répétable")
+    parser.add_argument("--crash-log", default=Log.CRASH_FILE, metavar="FICHIER",
+                        help="fichier où écrire les derniers messages si le jeu plante")
+    parser.add_argument("--profile-startup", metavar="DOSSIER",
+                        help="profiler (cProfile) le démarrage et les constructeurs de scènes : "
+                             "rapports triés et piles repliées pour flamegraph dans ce dossier")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="quitter dès que l'écran titre est affiché (mesures)")
+    args = parser.parse_args(argv)
+    try:
+        args.log = {category: Log.level_from_name(level)
+                    for category, _, level in (entry.partition("=") for entry in args.log)}
+        args.memory_budget = {kind or "total": float(mb) * AssetManager.MB
+                              for kind, _, mb in (entry.rpartition("=") for entry in args.memory_budget)}
+    except ValueError as e:
+        parser.error(str(e))
+    return args
 
 def main():
-    # Initialiser le gestionnaire de sprites au démarrage
-    sprite_manager = SpriteManager()
+    args = parse_args()
+    if args.import_time:
+        forwarded = [arg for arg in sys.argv[1:] if arg != "--import-time"]
+        print(StartupTimeline.import_time_report(os.path.abspath(__file__), forwarded))
+        return
+    StartupTimeline.mark("imports")
+    Log.configure(Log.level_from_name(args.log_level), args.log)
+    Log.install_crash_dump(args.crash_log)
+    StartupTimeline.BUDGET_MS = args.startup_budget
+    Display.quality = args.quality
+    Display.backend = args.renderer
+    Display.render_driver = args.render_driver
+    FrameRecorder.OUTPUT_DIR = args.record_battles
+    FrameRecorder.FORMAT = args.record_format
+    ProfileManager.BACKEND = args.profiles
+    AssetManager.BUDGETS.update(args.memory_budget)
+    Metrics.FILE = args.metrics
+    Metrics.INTERVAL = args.metrics_interval
+    if args.trace_latency:
+        LatencyTracer.enable()
+    if args.profile or args.profile_trace:
+        FrameProfiler.enable(args.profile_trace)
     
-    menu = MainMenu()
-    running = True
-    current_profile = None
-    current_menu = "MAIN"
-    game_menu = None  # Pour garder une référence au menu de jeu
-    selected_team = None  # Pour stocker l'équipe sélectionnée
+    # Une seule boucle pilote la pile de scènes (menus, ligue, arène)
+    Display.init()
+    StartupTimeline.mark("sdl_init")
+    manager = SceneManager(Display.create_window())
+    StartupTimeline.mark("window")
+    if args.fullscreen:
+        manager.toggle_fullscreen()
     
-    while running:
-        if current_menu == "MAIN":
-            choice = menu.run()
-            
-            if choice == "NEW_GAME":
-                trainer_name = menu.ask_trainer_name()
-                if trainer_name:
-                    ProfileManager.create_new_profile(trainer_name)
-                    game_menu = GameMenu(menu.screen, sprite_manager)
-                    current_menu = "GAME"  # Passer au menu de jeu
-                    
-            elif choice == "LOAD_GAME":
-                current_profile = ProfileManager.load_profile()
-                if current_profile:
-                    game_menu = GameMenu(menu.screen, sprite_manager, current_profile)
-                    current_menu = "GAME"  # Passer au menu de jeu
-                else:
-                    menu.show_message("Aucune sauvegarde trouvée !")
-            
-            elif choice == "QUIT":
-                running = False
-        
-        elif current_menu == "GAME":
-            game_choice = game_menu.run()
-            
-            if game_choice == "BACK":
-                current_menu = "MAIN"
-            elif game_choice == "QUIT":
-                running = False
-            elif game_choice == "POKEMON_SELECTION":
-                # Sélection des Pokémon
-                pokemon_selection = PokemonSelection(menu.screen)
-                pokemon_names = pokemon_selection.run()
-                
-                if pokemon_names and pokemon_names != "BACK":
-                    # Ordre de l'équipe
-                    team_order = TeamOrderMenu(menu.screen, pokemon_names)
-                    order_result = team_order.run()
-                    
-                    if order_result == "BACK":
-                        selected_team = team_order.team  # Sauvegarder l'équipe ordonnée
-                        current_menu = "GAME"
-            
-            elif game_choice == "START_BATTLE":
-                # Afficher d'abord la sélection des dresseurs
-                league_screen = LeagueSelection(menu.screen)
-                league_result = league_screen.run()
-                
-                if league_result == "BACK":
-                    current_menu = "GAME"
-                elif isinstance(league_result, dict):
-                    # Un dresseur a été sélectionné
-                    battle_scene = BattleScene(
-                        screen=menu.screen,
-                        player_team=[pokemon["name"] for pokemon in selected_team],
-                        opponent=league_result["trainer"]
-                    )
-                    battle_result = battle_scene.run()
-                    if battle_result == "BACK":
-                        current_menu = "GAME"
-
-        elif current_menu == "LEAGUE":
-            result = league_screen.run()
-            if isinstance(result, dict) and result["action"] == "POKEMON_SELECTION":
-                # Aller à la sélection des Pokémon
-                pokemon_selection = PokemonSelection(menu.screen)
-                selected_pokemon = pokemon_selection.run()
-                
-                if selected_pokemon and selected_pokemon != "BACK":
-                    # Aller à l'ordre de l'équipe
-                    team_order = TeamOrderMenu(menu.screen, selected_pokemon)
-                    order_result = team_order.run()
-                    
-                    if order_result == "ORDER_CONFIRMED":
-                        # Lancer le combat
-                        battle_scene = BattleScene(
-                            screen=menu.screen,
-                            player_team=selected_pokemon,
-                            opponent=result["opponent"]
-                        )
-                        current_menu = battle_scene.run()
-                    else:
-                        current_menu = "LEAGUE"
-                else:
-                    current_menu = "LEAGUE"
+    def title_screen():
+        menu = MainMenu(manager.screen)
+        StartupTimeline.mark("title_screen")
+        return menu
+    
+    if StartupProfiler.ENABLED:
+        StartupTimeline.on_interactive.append(StartupProfiler.stop_startup)
+    if args.record_input:
+        InputRecorder.start(args.record_input, args.seed, ProfileManager.read_saved(),
+                            manager.screen.get_size(), Display.quality)
+    elif args.seed is not None:
+        GameClock.seed(args.seed)
+    if args.startup_report:
+        StartupTimeline.on_interactive.append(lambda: print(StartupTimeline.report()))
+    if args.exit_after_startup:
+        StartupTimeline.on_interactive.append(manager.quit)
+    # Images de l'écran titre et sauvegarde lues sur des threads pendant que la fenêtre reste animée
+    jobs = MainMenu.load_jobs(manager.screen) + [ProfileManager.load_job()]
+    manager.run(LoadingScreen(manager.screen, jobs, title_screen, "Pokémon"))
+    ProfileManager.sync()  # La dernière sauvegarde est sur le disque avant de quitter
+    if Metrics.FILE:
+        Metrics.sync()
+    if InputRecorder.stop():
+        print(f"Entrées enregistrées dans {args.record_input}")
+    if args.memory_report:
+        print(AssetManager.memory_report(extra={"textes": manager.screen.cache_bytes()}))
+    if args.trace_latency:
+        print(LatencyTracer.report())
+    if FrameProfiler.ENABLED:
+        print(FrameProfiler.report())
+    if StartupProfiler.ENABLED:
+        print(f"Profils du démarrage et des scènes : {StartupProfiler.finish()}")
+    if FrameProfiler.write_trace():
+        print(f"Trace écrite dans {FrameProfiler.trace_path}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
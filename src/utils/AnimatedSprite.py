@@ -0,0 +1,32 @@
+import math
+
+
+class AnimatedSprite(list):
+    """Frames d'un GIF avec leurs durées respectives
+
+    Reste une liste de surfaces (compatible avec le code existant) et ajoute
+    `frame_at(temps)` qui retourne la frame à afficher en O(1) grâce à une table
+    précalculée au pas du PGCD des durées (10 ms pour la plupart des GIF).
+    """
+
+    DEFAULT_DURATION = 100  # ms, comme les navigateurs pour une durée absente ou nulle
+
+    def __init__(self, frames, durations=None):
+        super().__init__(frames)
+        if not durations:
+            durations = [self.DEFAULT_DURATION] * len(frames)
+        self.durations = [d if d and d > 10 else self.DEFAULT_DURATION for d in durations]
+        self.total_duration = sum(self.durations)
+
+        # Table temps -> index de frame
+        self.step = math.gcd(*self.durations) if self.durations else 1
+        self.frame_table = []
+        for index, duration in enumerate(self.durations):
+            self.frame_table.extend([index] * (duration // self.step))
+
+    def frame_at(self, time, offset=0):
+        """Frame à afficher au temps `time` (ms) de l'horloge d'animation"""
+        if not self.frame_table:
+            return None
+        slot = int((time + offset) % self.total_duration) // self.step
+        return self[self.frame_table[slot]]
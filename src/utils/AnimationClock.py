@@ -0,0 +1,38 @@
+class AnimationClock:
+    """Horloge partagée par tous les sprites animés
+
+    La boucle de jeu l'avance une fois par frame avec `advance(dt)` ; chaque sprite
+    en déduit sa frame courante via `AnimatedSprite.frame_at(AnimationClock.now())`,
+    sans compteur ni timer propre.
+    """
+    time = 0.0      # Temps d'animation écoulé (ms)
+    speed = 1.0
+    paused = False
+
+    @staticmethod
+    def advance(dt):
+        """Fait avancer l'horloge de `dt` millisecondes réelles"""
+        if not AnimationClock.paused:
+            AnimationClock.time += dt * AnimationClock.speed
+
+    @staticmethod
+    def now():
+        return AnimationClock.time
+
+    @staticmethod
+    def pause():
+        AnimationClock.paused = True
+
+    @staticmethod
+    def resume():
+        AnimationClock.paused = False
+
+    @staticmethod
+    def set_speed(speed):
+        AnimationClock.speed = max(0.0, speed)
+
+    @staticmethod
+    def reset():
+        AnimationClock.time = 0.0
+        AnimationClock.speed = 1.0
+        AnimationClock.paused = False
@@ -0,0 +1,238 @@
+import os
+import pygame
+
+from utils.Display import Display
+from utils.LoadJob import LoadJob
+from utils.Log import Log
+from utils.Metrics import Metrics
+
+
+class AssetManager:
+    """Cache partagé des ressources chargées depuis le disque (images, sons, polices, sprites)
+
+    Chaque entrée garde la liste des propriétaires (scènes) qui l'utilisent :
+    `release(owner)` libère ce qui n'est plus utilisé par personne. Une entrée
+    chargée sans propriétaire reste en mémoire jusqu'à la fin du jeu.
+
+    La taille décodée de chaque entrée (pixels des surfaces et des frames,
+    échantillons des sons) est comptée par type. BUDGETS borne chaque type et
+    le total : au dépassement, `over_budget` est levé et le SceneManager
+    libère les scènes en cache qui ne sont pas dans la pile.
+    """
+    PERMANENT = "__permanent__"
+    MB = 1024 * 1024
+    BUDGETS = {"image": 48 * MB, "sprite": 128 * MB, "sound": 96 * MB, "total": 256 * MB}
+
+    cache = {}    # (type, clé) -> ressource
+    owners = {}   # (type, clé) -> ensemble des propriétaires
+    sizes = {}    # (type, clé) -> octets
+    bytes_by_kind = {}
+    total_bytes = 0
+    over_budget = False
+    disk_loads = 0
+    hits = 0
+
+    @staticmethod
+    def get(kind, key, loader, owner=None, measure=True):
+        """Retourne la ressource en cache ou la charge via `loader()` (durée relevée si `measure`)"""
+        entry = (kind, key)
+        owner = owner or AssetManager.PERMANENT
+        if entry in AssetManager.cache:
+            AssetManager.hits += 1
+            Metrics.count(f"assets.{kind}.hits")
+        else:
+            Metrics.count(f"assets.{kind}.misses")
+            if measure:
+                with Metrics.timer(f"assets.{kind}.load_ms") as timer:
+                    value = loader()
+                Metrics.asset(AssetManager.label(kind, key), timer.ms)
+            else:
+                value = loader()
+            if value is None:
+                return None
+            AssetManager.cache[entry] = value
+            AssetManager.account(entry, value)
+            AssetManager.disk_loads += 1
+        AssetManager.owners.setdefault(entry, set()).add(owner)
+        return AssetManager.cache[entry]
+
+    @staticmethod
+    def label(kind, key):
+        """Nom lisible d'une entrée ("image:fond.png 800x600", "font:None 36", "sprite:Pikachu_animated_back")"""
+        name, size = (key[0], key[1]) if isinstance(key, tuple) else (key, None)
+        label = f"{kind}:{os.path.basename(name) if isinstance(name, str) else name}"
+        if isinstance(size, tuple):
+            return f"{label} {size[0]}x{size[1]}"
+        return f"{label} {size}" if isinstance(size, int) else label
+
+    @staticmethod
+    def image(path, size=None, alpha=False, owner=None):
+        """Image convertie (et redimensionnée si `size`) ; l'original est partagé entre tailles"""
+        def load():
+            if size is None:
+                return Display.convert(pygame.image.load(path), alpha=alpha)
+            source = AssetManager.image(path, alpha=alpha, owner=owner)
+            return pygame.transform.scale(source, size)
+        return AssetManager.get("image", (path, tuple(size) if size else None, alpha), load, owner)
+
+    @staticmethod
+    def ensure_mixer():
+        """Ouvre le périphérique audio à la première demande (il n'est pas ouvert au démarrage)"""
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                Log.warning("ressources", "Son indisponible: {}", e)
+        return bool(pygame.mixer.get_init())
+
+    @staticmethod
+    def sound(path, owner=None):
+        AssetManager.ensure_mixer()
+        return AssetManager.get("sound", path, lambda: pygame.mixer.Sound(path), owner)
+
+    @staticmethod
+    def font(path, size, owner=None):
+        """Police TTF, ou police par défaut si le fichier est absent (l'échec est aussi mis en cache)"""
+        def load():
+            if path:
+                try:
+                    return pygame.font.Font(path, size)
+                except Exception as e:
+                    Log.warning("ressources", "Erreur lors du chargement de la police: {}", e)
+            return pygame.font.Font(None, size)
+        return AssetManager.get("font", (path, size), load, owner)
+
+    @staticmethod
+    def job(kind, key, load, convert=None, owner=None, name=None):
+        """LoadJob qui remplit le cache (None si l'entrée est déjà chargée) ; `convert` tourne sur le thread principal"""
+        if (kind, key) in AssetManager.cache:
+            AssetManager.owners.setdefault((kind, key), set()).add(owner or AssetManager.PERMANENT)
+            return None
+
+        def timed_load():
+            # Lecture et décodage sur le thread de travail : c'est cette durée qui est relevée
+            with Metrics.timer(f"assets.{kind}.load_ms") as timer:
+                value = load()
+            Metrics.asset(AssetManager.label(kind, key), timer.ms)
+            return value
+
+        def finalize(value):
+            if value is not None and convert:
+                value = convert(value)
+            return AssetManager.get(kind, key, lambda: value, owner, measure=False)
+        return LoadJob(name or str(key), timed_load, finalize)
+
+    @staticmethod
+    def image_job(path, size=None, alpha=False, owner=None):
+        """Image lue et redimensionnée sur un thread de travail, convertie sur le thread principal"""
+        def load():
+            surface = pygame.image.load(path)
+            return pygame.transform.scale(surface, size) if size else surface
+        return AssetManager.job("image", (path, tuple(size) if size else None, alpha), load,
+                                lambda surface: Display.convert(surface, alpha=alpha), owner, os.path.basename(path))
+
+    @staticmethod
+    def sound_job(path, owner=None):
+        AssetManager.ensure_mixer()
+        return AssetManager.job("sound", path, lambda: pygame.mixer.Sound(path), owner=owner,
+                                name=os.path.basename(path))
+
+    @staticmethod
+    def release(owner):
+        """Retire `owner` de toutes les entrées et libère celles qui n'ont plus de propriétaire"""
+        released = 0
+        for entry, entry_owners in list(AssetManager.owners.items()):
+            entry_owners.discard(owner)
+            if not entry_owners:
+                del AssetManager.owners[entry]
+                value = AssetManager.cache.pop(entry, None)
+                AssetManager.account(entry, None)
+                if isinstance(value, pygame.mixer.Sound):
+                    value.stop()
+                released += 1
+        return released
+
+    @staticmethod
+    def clear():
+        AssetManager.cache.clear()
+        AssetManager.owners.clear()
+        AssetManager.sizes.clear()
+        AssetManager.bytes_by_kind.clear()
+        AssetManager.total_bytes = 0
+        AssetManager.over_budget = False
+
+    @staticmethod
+    def size_of(value):
+        """Octets décodés d'une ressource (surface, frames d'un sprite animé, son) ; 0 si inconnu"""
+        if isinstance(value, pygame.Surface):
+            return value.get_pitch() * value.get_height()
+        if isinstance(value, list):
+            return sum(AssetManager.size_of(item) for item in value)
+        if isinstance(value, pygame.mixer.Sound):
+            mixer = pygame.mixer.get_init()
+            if mixer:
+                frequency, size, channels = mixer
+                return int(value.get_length() * frequency) * channels * (abs(size) // 8)
+        return 0
+
+    @staticmethod
+    def account(entry, value):
+        """Ajoute (ou retire si `value` est None) la taille de l'entrée et vérifie les budgets"""
+        kind = entry[0]
+        size = AssetManager.size_of(value) if value is not None else -AssetManager.sizes.pop(entry, 0)
+        if value is not None:
+            AssetManager.sizes[entry] = size
+        AssetManager.bytes_by_kind[kind] = AssetManager.bytes_by_kind.get(kind, 0) + size
+        AssetManager.total_bytes += size
+        AssetManager.over_budget = bool(AssetManager.exceeded())
+
+    @staticmethod
+    def exceeded():
+        """[(type, octets, budget)] des budgets dépassés ("total" pour l'ensemble)"""
+        used = dict(AssetManager.bytes_by_kind, total=AssetManager.total_bytes)
+        return [(kind, used.get(kind, 0), budget) for kind, budget in AssetManager.BUDGETS.items()
+                if budget is not None and used.get(kind, 0) > budget]
+
+    @staticmethod
+    def bytes_by_owner():
+        """{propriétaire: (octets, dont partagés avec d'autres propriétaires)}"""
+        totals = {}
+        for entry, entry_owners in AssetManager.owners.items():
+            size = AssetManager.sizes.get(entry, 0)
+            for owner in entry_owners:
+                own, shared = totals.get(owner, (0, 0))
+                totals[owner] = (own + size, shared + (size if len(entry_owners) > 1 else 0))
+        return totals
+
+    @staticmethod
+    def memory_report(top=20, extra=None):
+        """Octets par type et par scène, budgets et plus grosses ressources ; `extra` : autres caches {nom: octets}"""
+        mb = AssetManager.MB
+        lines = ["Mémoire des ressources (Mo)", f"{'Type':<12}{'utilisé':>10}{'budget':>10}"]
+        rows = dict(AssetManager.bytes_by_kind, total=AssetManager.total_bytes)
+        for kind, used in sorted(rows.items(), key=lambda item: item[0] == "total"):
+            budget = AssetManager.BUDGETS.get(kind)
+            budget_text = f"{budget / mb:10.1f}" if budget else f"{'-':>10}"
+            alarm = "  DÉPASSÉ" if budget and used > budget else ""
+            lines.append(f"{kind:<12}{used / mb:10.2f}{budget_text}{alarm}")
+        for name, used in (extra or {}).items():
+            lines.append(f"{name:<12}{used / mb:10.2f}{'(hors budget)':>16}")
+        lines += ["", "Par propriétaire (Mo, ressources partagées comptées chez chacun)"]
+        for owner, (used, shared) in sorted(AssetManager.bytes_by_owner().items(), key=lambda item: -item[1][0]):
+            name = "permanent" if owner == AssetManager.PERMANENT else owner
+            lines.append(f"  {name:<22}{used / mb:8.2f}  (partagés {shared / mb:.2f})")
+        lines += ["", f"Plus grosses ressources ({min(top, len(AssetManager.sizes))} sur {len(AssetManager.sizes)})"]
+        for entry, size in sorted(AssetManager.sizes.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"  {size / mb:8.2f}  {AssetManager.label(*entry)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def stats():
+        counts = {}
+        for kind, _ in AssetManager.cache:
+            counts[kind] = counts.get(kind, 0) + 1
+        return {"entries": counts, "disk_loads": AssetManager.disk_loads, "hits": AssetManager.hits}
+
+
+Metrics.sample("assets.entries", lambda: len(AssetManager.cache))
+Metrics.sample("memory.assets_bytes", lambda: dict(AssetManager.bytes_by_kind, total=AssetManager.total_bytes))
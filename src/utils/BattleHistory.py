@@ -0,0 +1,334 @@
+"""
+Historique des combats, pour équilibrer data/trainer_teams.py à partir de vraies parties
+
+Usage (depuis la racine du projet) :
+    python src/utils/BattleHistory.py                  # taux de victoire et dégâts par attaque
+    python src/utils/BattleHistory.py --trainer Olga --side opponent
+"""
+import sys
+import os
+import atexit
+import sqlite3
+import threading
+import time
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.SaveWriter import SaveWriter
+
+
+class BattleLog:
+    """Résumé d'un combat en cours, rempli par l'arène puis confié à BattleHistory.record()
+
+    Ne garde que des tuples d'entiers et de noms : enregistrer une attaque ne
+    coûte presque rien au thread de rendu.
+    """
+    SIDES = {"player": 0, "opponent": 1}
+    RESULTS = {"VICTORY": 1, "DEFEAT": 0, "ABANDON": -1}
+
+    def __init__(self, trainer, player_name, player_team, opponent_team):
+        self.trainer = trainer
+        self.player_name = player_name or ""
+        self.player_team = [pokemon["name"] for pokemon in player_team]
+        self.opponent_team = [pokemon["name"] for pokemon in opponent_team]
+        self.started_at = time.time()
+        self.start = time.monotonic()
+        self.turns = 0
+        self.attacks = []   # (tour, camp, attaquant, attaque, dégâts, K.O.)
+        self.result = None
+        self.duration_ms = 0
+
+    def attack(self, side, attacker, move, damage, ko):
+        self.attacks.append((self.turns, BattleLog.SIDES[side], attacker, move, int(damage), int(bool(ko))))
+
+    def next_turn(self):
+        self.turns += 1
+
+    def finish(self, result):
+        """Fige le résultat ("VICTORY", "DEFEAT" ou "ABANDON") ; ignoré si déjà terminé"""
+        if self.result is not None:
+            return False
+        self.result = result
+        self.duration_ms = int((time.monotonic() - self.start) * 1000)
+        return True
+
+    def kos(self, side):
+        side = BattleLog.SIDES[side]
+        return sum(ko for _, attacker_side, _, _, _, ko in self.attacks if attacker_side == side)
+
+
+class BattleHistory:
+    """Base SQLite des combats joués, organisée pour les agrégations
+
+    Une ligne par combat dans `battles`, une ligne par attaque dans `attacks`.
+    Les noms (dresseurs, Pokémon, attaques) sont stockés une fois dans `names`
+    et référencés par entier : une attaque tient en quelques octets et les
+    index couvrants (dresseur, résultat) et (attaque, camp, dégâts) permettent
+    des agrégations sur des millions de lignes sans lire la table ni créer
+    d'objets Python par ligne. `move_totals` cumule en plus, à chaque combat
+    écrit, les totaux par (dresseur, camp, attaque) : move_damage() lit
+    quelques centaines de lignes quel que soit le nombre de combats.
+
+    Les combats sont écrits par le thread du SaveWriter, comme les sauvegardes.
+    """
+    DB = "battle_history.db"
+    ENABLED = True
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS names (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS battles (
+            id INTEGER PRIMARY KEY,
+            trainer_id INTEGER NOT NULL REFERENCES names(id),
+            player TEXT NOT NULL,
+            result INTEGER NOT NULL,
+            turns INTEGER NOT NULL,
+            duration_ms INTEGER NOT NULL,
+            kos_for INTEGER NOT NULL,
+            kos_against INTEGER NOT NULL,
+            player_team TEXT NOT NULL,
+            opponent_team TEXT NOT NULL,
+            started_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS attacks (
+            battle_id INTEGER NOT NULL REFERENCES battles(id) ON DELETE CASCADE,
+            seq INTEGER NOT NULL,
+            turn INTEGER NOT NULL,
+            side INTEGER NOT NULL,
+            attacker_id INTEGER NOT NULL,
+            move_id INTEGER NOT NULL,
+            damage INTEGER NOT NULL,
+            ko INTEGER NOT NULL,
+            PRIMARY KEY (battle_id, seq)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS move_totals (
+            trainer_id INTEGER NOT NULL,
+            side INTEGER NOT NULL,
+            move_id INTEGER NOT NULL,
+            uses INTEGER NOT NULL,
+            damage INTEGER NOT NULL,
+            max_damage INTEGER NOT NULL,
+            kos INTEGER NOT NULL,
+            PRIMARY KEY (trainer_id, side, move_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS battles_by_trainer ON battles (trainer_id, result, turns, duration_ms);
+        CREATE INDEX IF NOT EXISTS attacks_by_move ON attacks (move_id, side, damage, ko);
+    """
+    INSERT_BATTLE = """
+        INSERT INTO battles (trainer_id, player, result, turns, duration_ms, kos_for, kos_against,
+                             player_team, opponent_team, started_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    INSERT_ATTACK = """
+        INSERT INTO attacks (battle_id, seq, turn, side, attacker_id, move_id, damage, ko)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    ADD_MOVE_TOTALS = """
+        INSERT INTO move_totals (trainer_id, side, move_id, uses, damage, max_damage, kos)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (trainer_id, side, move_id) DO UPDATE SET
+            uses = uses + excluded.uses, damage = damage + excluded.damage,
+            max_damage = MAX(max_damage, excluded.max_damage), kos = kos + excluded.kos
+    """
+    WIN_RATES = """
+        SELECT n.name, b.battles, b.wins, b.losses, b.avg_turns, b.avg_duration_ms
+        FROM (
+            SELECT trainer_id,
+                   COUNT(*) AS battles,
+                   SUM(result = 1) AS wins,
+                   SUM(result = 0) AS losses,
+                   AVG(turns) AS avg_turns,
+                   AVG(duration_ms) AS avg_duration_ms
+            FROM battles
+            GROUP BY trainer_id
+        ) AS b JOIN names AS n ON n.id = b.trainer_id
+        ORDER BY n.name
+    """
+
+    local = threading.local()
+    name_ids = {}     # Cache (base, nom) -> id (thread d'écriture)
+    writer = SaveWriter("BattleHistoryWriter")
+    lock = threading.Lock()
+    recorded = 0
+
+    @staticmethod
+    def connection(path=None):
+        """Connexion propre au thread appelant, schéma créé à la première ouverture"""
+        path = path or BattleHistory.DB
+        connections = getattr(BattleHistory.local, "connections", None)
+        if connections is None:
+            connections = BattleHistory.local.connections = {}
+        db = connections.get(path)
+        if db is None:
+            db = sqlite3.connect(path, timeout=5.0, cached_statements=64)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            with db:
+                db.executescript(BattleHistory.SCHEMA)
+            connections[path] = db
+        return db
+
+    @staticmethod
+    def start(trainer, player_team, opponent_team):
+        """Nouveau BattleLog pour le profil courant (None si l'historique est désactivé)"""
+        if not BattleHistory.ENABLED:
+            return None
+        from utils.ProfileManager import ProfileManager
+        profile = ProfileManager.profile
+        return BattleLog(trainer, profile["trainer_name"] if profile else "", player_team, opponent_team)
+
+    @staticmethod
+    def record(log):
+        """Programme l'écriture d'un combat terminé (ne bloque pas le thread de rendu)"""
+        if log is None or log.result is None:
+            return
+        with BattleHistory.lock:
+            BattleHistory.recorded += 1
+            key = ("battle", BattleHistory.recorded)  # Jamais fusionné avec un autre combat
+        path = BattleHistory.DB
+        BattleHistory.writer.submit_task(key, lambda: BattleHistory.write([log], path))
+
+    @staticmethod
+    def write(logs, path=None):
+        """Insère des combats terminés en une transaction (thread d'écriture, import en masse)"""
+        path = path or BattleHistory.DB
+        db = BattleHistory.connection(path)
+        try:
+            BattleHistory._insert(db, path, logs)
+        except Exception:
+            # Les noms insérés par la transaction annulée n'existent plus
+            BattleHistory.name_ids.clear()
+            raise
+
+    @staticmethod
+    def _insert(db, path, logs):
+        with db:
+            for log in logs:
+                battle_id = db.execute(BattleHistory.INSERT_BATTLE, (
+                    BattleHistory.name_id(db, path, log.trainer), log.player_name,
+                    BattleLog.RESULTS[log.result], log.turns, log.duration_ms,
+                    log.kos("player"), log.kos("opponent"),
+                    ",".join(log.player_team), ",".join(log.opponent_team), log.started_at
+                )).lastrowid
+                db.executemany(BattleHistory.INSERT_ATTACK, [
+                    (battle_id, seq, turn, side, BattleHistory.name_id(db, path, attacker),
+                     BattleHistory.name_id(db, path, move), damage, ko)
+                    for seq, (turn, side, attacker, move, damage, ko) in enumerate(log.attacks)
+                ])
+                totals = {}
+                for _, side, _, move, damage, ko in log.attacks:
+                    uses, damage_sum, max_damage, kos = totals.get((side, move), (0, 0, 0, 0))
+                    totals[(side, move)] = (uses + 1, damage_sum + damage, max(max_damage, damage), kos + ko)
+                trainer_id = BattleHistory.name_id(db, path, log.trainer)
+                db.executemany(BattleHistory.ADD_MOVE_TOTALS, [
+                    (trainer_id, side, BattleHistory.name_id(db, path, move)) + total
+                    for (side, move), total in totals.items()
+                ])
+
+    @staticmethod
+    def name_id(db, path, name):
+        key = (path, name)
+        name_id = BattleHistory.name_ids.get(key)
+        if name_id is None:
+            db.execute("INSERT OR IGNORE INTO names (name) VALUES (?)", (name,))
+            name_id = db.execute("SELECT id FROM names WHERE name = ?", (name,)).fetchone()[0]
+            BattleHistory.name_ids[key] = name_id
+        return name_id
+
+    @staticmethod
+    def sync(timeout=None):
+        """Attend que les combats enregistrés soient écrits"""
+        return BattleHistory.writer.wait(timeout)
+
+    @staticmethod
+    def close(path=None, timeout=None):
+        """Écrit les combats en attente puis ferme les connexions à `path` (thread d'écriture et appelant)
+
+        La dernière connexion fermée intègre le journal WAL : les fichiers -wal et -shm disparaissent.
+        """
+        path = path or BattleHistory.DB
+        BattleHistory.writer.submit_task(("close", path), lambda: BattleHistory.close_local(path))
+        done = BattleHistory.sync(timeout)
+        BattleHistory.close_local(path)
+        return done
+
+    @staticmethod
+    def close_local(path):
+        """Ferme la connexion du thread appelant à `path`, s'il en a une"""
+        db = getattr(BattleHistory.local, "connections", {}).pop(path, None)
+        if db is not None:
+            db.close()
+        for key in [key for key in BattleHistory.name_ids if key[0] == path]:
+            del BattleHistory.name_ids[key]
+
+    @staticmethod
+    def win_rates():
+        """{dresseur: {battles, wins, losses, win_rate, avg_turns, avg_duration_ms}} (victoires du joueur)"""
+        BattleHistory.sync()
+        rates = {}
+        for name, battles, wins, losses, avg_turns, avg_duration in BattleHistory.connection().execute(BattleHistory.WIN_RATES):
+            rates[name] = {
+                "battles": battles,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": wins / battles if battles else 0.0,
+                "avg_turns": avg_turns,
+                "avg_duration_ms": avg_duration
+            }
+        return rates
+
+    @staticmethod
+    def move_damage(side=None, trainer=None):
+        """{attaque: {uses, avg_damage, max_damage, kos}} ; filtres : camp ("player"/"opponent"), dresseur"""
+        BattleHistory.sync()
+        where, params = [], []
+        if side is not None:
+            where.append("t.side = ?")
+            params.append(BattleLog.SIDES[side])
+        if trainer is not None:
+            where.append("t.trainer_id = (SELECT id FROM names WHERE name = ?)")
+            params.append(trainer)
+        query = ("SELECT n.name, m.uses, m.damage, m.max_damage, m.kos FROM ("
+                 "SELECT t.move_id, SUM(t.uses) AS uses, SUM(t.damage) AS damage, "
+                 "MAX(t.max_damage) AS max_damage, SUM(t.kos) AS kos FROM move_totals AS t")
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " GROUP BY t.move_id) AS m JOIN names AS n ON n.id = m.move_id ORDER BY m.damage * 1.0 / m.uses DESC"
+        return {
+            name: {"uses": uses, "avg_damage": damage / uses, "max_damage": max_damage, "kos": kos}
+            for name, uses, damage, max_damage, kos in BattleHistory.connection().execute(query, params)
+        }
+
+    @staticmethod
+    def battle_count():
+        BattleHistory.sync()
+        return BattleHistory.connection().execute("SELECT COUNT(*) FROM battles").fetchone()[0]
+
+
+# Combats terminés juste avant la fermeture du jeu
+atexit.register(BattleHistory.sync)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Statistiques des combats enregistrés")
+    parser.add_argument("--db", default=BattleHistory.DB, help="Base de l'historique")
+    parser.add_argument("--trainer", help="Dégâts des attaques dans les combats contre ce dresseur")
+    parser.add_argument("--side", choices=list(BattleLog.SIDES), help="Attaques du joueur ou de l'adversaire")
+    args = parser.parse_args()
+
+    BattleHistory.DB = args.db
+    print(f"{BattleHistory.battle_count()} combats dans {args.db}\n")
+    print(f"{'Dresseur':<12}{'Combats':>9}{'Victoires':>11}{'Taux':>8}{'Tours':>8}{'Durée (s)':>11}")
+    for name, stats in BattleHistory.win_rates().items():
+        print(f"{name:<12}{stats['battles']:>9}{stats['wins']:>11}{stats['win_rate']:>8.0%}"
+              f"{stats['avg_turns']:>8.1f}{stats['avg_duration_ms'] / 1000:>11.1f}")
+    print(f"\n{'Attaque':<18}{'Utilisations':>14}{'Dégâts moy.':>13}{'Max':>6}{'K.O.':>6}")
+    for name, stats in BattleHistory.move_damage(args.side, args.trainer).items():
+        print(f"{name:<18}{stats['uses']:>14}{stats['avg_damage']:>13.1f}{stats['max_damage']:>6}{stats['kos']:>6}")
+
+
+if __name__ == "__main__":
+    main()
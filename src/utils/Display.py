@@ -0,0 +1,133 @@
+import os
+import pygame
+
+from utils.Renderer import SoftwareRenderer, TextureRenderer
+from utils.Log import Log
+
+
+class Display:
+    """Gestion de la fenêtre : rendu à résolution logique fixe, mise à l'échelle par SDL
+
+    En mode "quality", "balanced" ou "performance", le jeu dessine toujours sur une
+    surface de taille fixe et SDL (pygame.SCALED) l'étire à la taille de la fenêtre :
+    le coût d'un blit plein écran ne dépend plus de la définition du moniteur.
+    Le mode "native" garde l'ancien comportement (fenêtre à la taille du bureau).
+
+    `backend` choisit le renderer : "software" (blits sur la surface d'affichage)
+    ou "texture" (pygame._sdl2, textures SDL2). `render_driver` force un driver
+    SDL ("software" pour tester sans GPU).
+    """
+    QUALITY_PRESETS = {
+        "quality": (1920, 1080),
+        "balanced": (1600, 900),
+        "performance": (1280, 720),
+        "native": None
+    }
+    quality = "quality"
+    BACKENDS = ("software", "texture")
+    backend = "software"
+    render_driver = None
+
+    # Marges de la fenêtre en mode natif (barre de titre, barre des tâches)
+    MARGIN_SIDES = 5
+    MARGIN_TOP = 30
+    MARGIN_BOTTOM = 60
+    MIN_SIZE = (800, 600)
+
+    screen = None        # Renderer utilisé par les scènes
+    is_fullscreen = False
+    windowed_size = None
+
+    @staticmethod
+    def init():
+        """Initialise seulement ce qu'il faut pour l'écran titre (le son est initialisé au premier Sound)"""
+        pygame.display.init()
+        pygame.font.init()
+        pygame.time.wait(0)  # Démarre le timer SDL : get_ticks() resterait à 0 sans pygame.init()
+
+    @staticmethod
+    def create_window(quality=None):
+        """Crée la fenêtre selon le preset de qualité et retourne le renderer de dessin"""
+        if quality:
+            Display.quality = quality
+        logical_size = Display.QUALITY_PRESETS.get(Display.quality)
+
+        if Display.backend == "texture":
+            try:
+                size = logical_size or Display.native_size()
+                Display.windowed_size = size
+                Display.screen = TextureRenderer(size, "Pokémon Game", Display.render_driver)
+                Display.is_fullscreen = False
+                return Display.screen
+            except Exception as e:
+                Log.warning("affichage", "Renderer SDL2 indisponible, retour au rendu logiciel: {}", e)
+                Display.backend = "software"
+
+        if logical_size is None:
+            # Mode natif : la fenêtre occupe presque tout le bureau
+            os.environ['SDL_VIDEO_WINDOW_POS'] = '5,38'
+            Display.windowed_size = Display.native_size()
+            surface = pygame.display.set_mode(Display.windowed_size, pygame.RESIZABLE)
+        else:
+            os.environ.setdefault('SDL_VIDEO_CENTERED', '1')
+            Display.windowed_size = logical_size
+            try:
+                surface = pygame.display.set_mode(logical_size, pygame.SCALED | pygame.RESIZABLE)
+            except pygame.error:
+                # Pas de renderer SDL disponible : surface à la taille logique, sans mise à l'échelle
+                surface = pygame.display.set_mode(logical_size)
+
+        Display.screen = SoftwareRenderer(surface)
+        Display.is_fullscreen = False
+        pygame.display.set_caption("Pokémon Game")
+        return Display.screen
+
+    @staticmethod
+    def native_size():
+        """Taille du bureau moins les marges de fenêtre"""
+        info = pygame.display.Info()
+        return (
+            info.current_w - Display.MARGIN_SIDES * 2,
+            info.current_h - (Display.MARGIN_TOP + Display.MARGIN_BOTTOM)
+        )
+
+    @staticmethod
+    def convert(surface, alpha=False):
+        """convert()/convert_alpha() ; sans objet avec le renderer SDL2 (pas de surface d'affichage)"""
+        if Display.backend == "texture":
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    @staticmethod
+    def is_scaled():
+        return Display.QUALITY_PRESETS.get(Display.quality) is not None
+
+    @staticmethod
+    def toggle_fullscreen():
+        """Bascule plein écran / fenêtré et retourne le renderer de dessin"""
+        Display.is_fullscreen = not Display.is_fullscreen
+        if Display.backend == "texture":
+            if Display.is_fullscreen:
+                Display.screen.window.set_fullscreen(desktop=True)
+            else:
+                Display.screen.window.set_windowed()
+        elif Display.is_scaled():
+            # La taille logique ne change pas : SDL se charge de l'étirement
+            pygame.display.toggle_fullscreen()
+        elif Display.is_fullscreen:
+            Display.screen.set_surface(pygame.display.set_mode((0, 0), pygame.FULLSCREEN))
+        else:
+            Display.screen.set_surface(pygame.display.set_mode(Display.windowed_size, pygame.RESIZABLE))
+        return Display.screen
+
+    @staticmethod
+    def handle_resize(event):
+        """Traite un VIDEORESIZE et retourne le renderer de dessin"""
+        if Display.backend == "texture" or Display.is_scaled() or Display.is_fullscreen:
+            # Avec pygame.SCALED ou une taille logique SDL2, la surface logique reste identique
+            return Display.screen
+        width = max(Display.MIN_SIZE[0], event.w)
+        height = max(Display.MIN_SIZE[1], event.h)
+        Display.windowed_size = (width, height)
+        Display.screen.set_surface(pygame.display.set_mode((width, height), pygame.RESIZABLE))
+        return Display.screen
@@ -0,0 +1,164 @@
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+
+
+class _Span:
+    """Intervalle mesuré (phase de la frame ou zone nommée dans une scène)"""
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        FrameProfiler.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        FrameProfiler.depth -= 1
+        FrameProfiler.add(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Temps de chaque phase de la frame (événements, update, draw, present) et zones nommées
+
+    Dans une scène :
+        with FrameProfiler.span("barres de vie"):
+            ...
+    Désactivé, span() retourne un contexte vide partagé : le coût se limite à
+    un test et un `with`. Activé (--profile ou F8), les frames récentes sont
+    gardées dans un tampon circulaire (graphe en surimpression, F8) et, avec
+    --profile-trace, chaque intervalle est ajouté à une trace Chrome
+    (chrome://tracing, Perfetto) écrite à la sortie du jeu.
+    """
+    ENABLED = False
+    OVERLAY = False
+    HISTORY = 180             # Frames gardées pour le graphe
+    MAX_TRACE_EVENTS = 500000  # Borne la taille de la trace en mémoire
+    PHASES = ("events", "update", "draw", "overlay", "present")
+    COLORS = {
+        "events": (255, 200, 0),
+        "update": (0, 200, 255),
+        "draw": (0, 220, 120),
+        "overlay": (160, 160, 160),
+        "present": (255, 80, 80)
+    }
+
+    NULL_SPAN = nullcontext()
+    frames = deque(maxlen=HISTORY)   # {nom: durée en ms} par frame
+    current = {}
+    depth = 0
+    trace_path = None
+    trace_events = []
+    trace_origin = time.perf_counter_ns()
+    dropped_events = 0
+    font = None
+
+    @staticmethod
+    def enable(trace_path=None, overlay=False):
+        FrameProfiler.ENABLED = True
+        FrameProfiler.OVERLAY = FrameProfiler.OVERLAY or overlay
+        if trace_path:
+            FrameProfiler.trace_path = trace_path
+
+    @staticmethod
+    def toggle_overlay():
+        """F8 : affiche ou masque le graphe (active la mesure au besoin)"""
+        FrameProfiler.OVERLAY = not FrameProfiler.OVERLAY
+        if FrameProfiler.OVERLAY:
+            FrameProfiler.ENABLED = True
+
+    @staticmethod
+    def span(name):
+        """Contexte qui mesure la zone `name` (presque gratuit si le profileur est désactivé)"""
+        if not FrameProfiler.ENABLED:
+            return FrameProfiler.NULL_SPAN
+        return _Span(name)
+
+    @staticmethod
+    def add(name, start_ns, duration_ns):
+        ms = duration_ns / 1e6
+        FrameProfiler.current[name] = FrameProfiler.current.get(name, 0.0) + ms
+        if FrameProfiler.trace_path:
+            if len(FrameProfiler.trace_events) < FrameProfiler.MAX_TRACE_EVENTS:
+                FrameProfiler.trace_events.append((name, start_ns, duration_ns, FrameProfiler.depth))
+            else:
+                FrameProfiler.dropped_events += 1
+
+    @staticmethod
+    def end_frame():
+        """Clôt la frame courante (appelé par le SceneManager après present)"""
+        if FrameProfiler.current:
+            FrameProfiler.frames.append(FrameProfiler.current)
+            FrameProfiler.current = {}
+
+    @staticmethod
+    def summary():
+        """{nom: (moyenne, max)} en ms sur les frames du tampon"""
+        totals = {}
+        for frame in FrameProfiler.frames:
+            for name, ms in frame.items():
+                total, peak = totals.get(name, (0.0, 0.0))
+                totals[name] = (total + ms, max(peak, ms))
+        count = len(FrameProfiler.frames) or 1
+        return {name: (total / count, peak) for name, (total, peak) in totals.items()}
+
+    @staticmethod
+    def write_trace(path=None):
+        """Écrit la trace au format Chrome trace-event (JSON) ; retourne le chemin ou None"""
+        path = path or FrameProfiler.trace_path
+        if not path:
+            return None
+        origin = FrameProfiler.trace_origin
+        events = [
+            {"name": name, "cat": "phase" if name in FrameProfiler.PHASES else "scene", "ph": "X",
+             "ts": (start - origin) / 1000, "dur": duration / 1000, "pid": 1, "tid": 1,
+             "args": {"depth": depth}}
+            for name, start, duration, depth in FrameProfiler.trace_events
+        ]
+        events.insert(0, {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "Boucle du jeu"}})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                       "otherData": {"dropped_events": FrameProfiler.dropped_events}}, f)
+        return path
+
+    @staticmethod
+    def report():
+        lines = [f"Temps par frame (ms, {len(FrameProfiler.frames)} dernières frames)",
+                 f"{'Zone':<24}{'moy.':>8}{'max':>8}"]
+        for name, (mean, peak) in sorted(FrameProfiler.summary().items(), key=lambda item: -item[1][0]):
+            lines.append(f"{name:<24}{mean:>8.2f}{peak:>8.2f}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def draw_overlay(screen):
+        """Graphe empilé des phases par frame (ligne repère à 16,7 ms) et zones les plus coûteuses"""
+        if FrameProfiler.font is None:
+            FrameProfiler.font = pygame.font.Font(None, 22)
+        width, height, scale = 2 * FrameProfiler.HISTORY, 100, 3   # 3 px par ms
+        x0 = screen.get_width() - width - 10
+        y0 = 10
+        screen.fill_alpha((0, 0, 0, 180), pygame.Rect(x0 - 5, y0 - 5, width + 10, height + 150))
+        bottom = y0 + height
+        for i, frame in enumerate(FrameProfiler.frames):
+            y = bottom
+            for phase in FrameProfiler.PHASES:
+                bar = min(y - y0, int(frame.get(phase, 0.0) * scale + 0.5))
+                if bar > 0:
+                    y -= bar
+                    screen.draw_rect(FrameProfiler.COLORS[phase], pygame.Rect(x0 + 2 * i, y, 2, bar))
+        budget_y = bottom - int(1000 / 60 * scale)
+        screen.draw_rect((255, 255, 255), pygame.Rect(x0, budget_y, width, 1))
+
+        # Zones les plus coûteuses ; rendu direct pour ne pas vider le cache de textes du jeu
+        summary = sorted(FrameProfiler.summary().items(), key=lambda item: -item[1][0])[:6]
+        for row, (name, (mean, peak)) in enumerate(summary):
+            color = FrameProfiler.COLORS.get(name, (255, 255, 255))
+            text = FrameProfiler.font.render(f"{name}: {mean:.2f} ms (max {peak:.1f})", True, color)
+            screen.blit(text, (x0, bottom + 8 + 22 * row))
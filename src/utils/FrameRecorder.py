@@ -0,0 +1,142 @@
+import atexit
+import os
+import queue
+import threading
+import time
+import pygame
+
+
+class FrameRecorder:
+    """Enregistre les frames affichées vers une séquence PNG ou un GIF animé
+
+    Le thread de rendu ne fait qu'une copie réduite de l'écran dans un tampon
+    circulaire préalloué ; l'encodage (PIL) se fait dans un thread séparé.
+    Si l'encodeur prend du retard et qu'aucun emplacement n'est libre, la frame
+    est abandonnée plutôt que de bloquer le jeu.
+    """
+    # Configuration globale (renseignée par main.py)
+    OUTPUT_DIR = None
+    FORMAT = "gif"         # "gif" ou "png"
+    SCALE = 0.5            # Réduction appliquée à la capture
+    FPS = 15               # Cadence de capture
+    BUFFER_SIZE = 8        # Nombre d'emplacements du tampon circulaire
+    MAX_GIF_FRAMES = 900   # Un GIF est assemblé en mémoire : on borne sa longueur
+    EXIT_TIMEOUT = 30      # Secondes laissées à l'encodeur pour finir à la sortie du programme
+
+    def __init__(self, screen_size, name, output_dir=None, fmt=None, scale=None, fps=None):
+        self.output_dir = output_dir or FrameRecorder.OUTPUT_DIR or "recordings"
+        self.format = fmt or FrameRecorder.FORMAT
+        scale = scale or FrameRecorder.SCALE
+        self.size = (max(1, int(screen_size[0] * scale)), max(1, int(screen_size[1] * scale)))
+        self.interval = 1000 / (fps or FrameRecorder.FPS)
+        self.name = f"{name}_{time.strftime('%Y%m%d_%H%M%S')}"
+
+        # Tampon circulaire : surfaces préallouées qui circulent entre les deux threads
+        self.free_slots = queue.Queue()
+        for _ in range(FrameRecorder.BUFFER_SIZE):
+            self.free_slots.put(pygame.Surface(self.size))
+        self.pending = queue.Queue()
+
+        self.captured = 0
+        self.dropped = 0
+        self.last_capture = None
+        self.recording = False
+        self.path = None
+        self.encoder = None
+
+    @staticmethod
+    def enabled():
+        return FrameRecorder.OUTPUT_DIR is not None
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.format == "png":
+            self.path = os.path.join(self.output_dir, self.name)
+            os.makedirs(self.path, exist_ok=True)
+        else:
+            self.path = os.path.join(self.output_dir, f"{self.name}.gif")
+        self.recording = True
+        # Thread démon : un plantage pendant un combat enregistré ne bloque pas la sortie ;
+        # finish() termine l'enregistrement à la sortie du programme
+        self.encoder = threading.Thread(target=self._encode_loop, name="FrameRecorder", daemon=True)
+        atexit.register(self.finish)
+        self.encoder.start()
+
+    def wants_frame(self):
+        """La frame en cours serait-elle gardée ? Sinon, inutile de lire l'écran"""
+        if not self.recording:
+            return False
+        now = pygame.time.get_ticks()
+        if self.last_capture is not None and now - self.last_capture < self.interval:
+            return False
+        if (self.format == "gif" and self.captured >= FrameRecorder.MAX_GIF_FRAMES) or self.free_slots.empty():
+            # GIF complet, ou encodeur en retard : on abandonne cette frame
+            self.dropped += 1
+            return False
+        return True
+
+    def capture(self, surface):
+        """Copie réduite de l'écran, sans attente (appelé par le SceneManager si wants_frame())"""
+        try:
+            slot = self.free_slots.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        now = pygame.time.get_ticks()
+        if surface.get_size() == self.size:
+            slot.blit(surface, (0, 0))
+        else:
+            pygame.transform.scale(surface, self.size, slot)
+        self.pending.put((slot, now))
+        self.last_capture = now
+        self.captured += 1
+
+    def stop(self):
+        """Termine l'enregistrement ; l'encodeur finit d'écrire en arrière-plan"""
+        if not self.recording:
+            return None
+        self.recording = False
+        self.pending.put(None)
+        return self.path
+
+    def finish(self, timeout=None):
+        """Arrête l'enregistrement et attend que l'encodeur l'ait écrit (sortie du programme)"""
+        self.stop()
+        if self.encoder:
+            self.encoder.join(FrameRecorder.EXIT_TIMEOUT if timeout is None else timeout)
+
+    def _encode_loop(self):
+        try:
+            self._encode()
+        finally:
+            atexit.unregister(self.finish)
+
+    def _encode(self):
+        from PIL import Image
+
+        gif_frames = []
+        durations = []
+        previous_time = None
+        index = 0
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            slot, timestamp = item
+            data = pygame.image.tobytes(slot, "RGB")
+            self.free_slots.put(slot)  # L'emplacement est libéré dès la copie faite
+
+            image = Image.frombytes("RGB", self.size, data)
+            if self.format == "png":
+                image.save(os.path.join(self.path, f"frame_{index:05d}.png"), compress_level=1)
+            else:
+                gif_frames.append(image.convert("P", palette=Image.ADAPTIVE))
+                if previous_time is not None:
+                    durations.append(max(20, timestamp - previous_time))
+                previous_time = timestamp
+            index += 1
+
+        if gif_frames:
+            durations.append(durations[-1] if durations else int(self.interval))
+            gif_frames[0].save(self.path, save_all=True, append_images=gif_frames[1:],
+                               duration=durations, loop=0, optimize=False)
@@ -0,0 +1,34 @@
+import random
+
+
+class GameClock:
+    """Temps et hasard de la logique du jeu (minuteries des combats, dégâts, coups critiques)
+
+    Le SceneManager avance l'horloge du `dt` de chaque frame : rejouée avec
+    les mêmes `dt` (utils/InputRecorder.py), une session repasse par les mêmes
+    états. `rng` sert au hasard qui change le déroulement du jeu ; le hasard
+    purement visuel (neige, son d'attaque) reste sur le module random.
+    """
+    time = 0     # ms de jeu écoulées
+    rng = random.Random()
+
+    @staticmethod
+    def advance(dt):
+        GameClock.time += dt
+
+    @staticmethod
+    def ticks():
+        """Remplace pygame.time.get_ticks() dans la logique des scènes"""
+        return GameClock.time
+
+    @staticmethod
+    def seed(value):
+        """Rend le hasard du jeu (et celui du module random) reproductible"""
+        GameClock.rng.seed(value)
+        random.seed(value)
+
+    @staticmethod
+    def reset(seed=None):
+        GameClock.time = 0
+        if seed is not None:
+            GameClock.seed(seed)
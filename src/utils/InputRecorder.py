@@ -0,0 +1,143 @@
+import json
+import time
+
+import pygame
+
+from utils.GameClock import GameClock
+from utils.InputState import InputState
+
+
+class InputRecorder:
+    """Enregistre les entrées d'une session pour la rejouer à l'identique (tests de performance)
+
+    Chaque frame où la scène du dessus est interactive est gardée avec son
+    `dt` et ses événements ; les frames des écrans de chargement ne le sont
+    pas (leur nombre dépend des threads de chargement). Rejouée avec les mêmes
+    `dt`, la même graine (GameClock) et le même profil de départ, la session
+    repasse par les mêmes scènes et les mêmes combats.
+    `checkpoints` note la scène du dessus à chaque changement, pour vérifier
+    pendant le rejeu que la session n'a pas divergé.
+
+    Rejeu : python src/utils/replay_session.py session.json
+    """
+    VERSION = 1
+    FIELDS = ("key", "mod", "unicode", "scancode", "button", "pos", "rel", "buttons", "x", "y", "text")
+    # Pas de VIDEORESIZE : il dépend de la fenêtre de la session d'origine
+    TYPES = {pygame.event.event_name(kind): kind for kind in InputState.ALLOWED if kind != pygame.VIDEORESIZE}
+
+    recording = None     # Session en cours d'enregistrement (dict) ou None
+    path = None
+    last_scene = None
+
+    @staticmethod
+    def start(path, seed=None, profile=None, screen_size=None, quality=None):
+        """Commence l'enregistrement (graine tirée au hasard si absente)"""
+        seed = int(time.time() * 1000) % 2 ** 31 if seed is None else seed
+        GameClock.reset(seed)
+        InputRecorder.path = path
+        InputRecorder.last_scene = None
+        InputRecorder.recording = {
+            "version": InputRecorder.VERSION,
+            "seed": seed,
+            "quality": quality,
+            "screen_size": list(screen_size) if screen_size else None,
+            "profile": profile,
+            "frames": [],          # [dt, [événements]]
+            "checkpoints": []      # [index de frame, scène]
+        }
+
+    @staticmethod
+    def capture(manager, dt, events):
+        """Appelé par le SceneManager avant chaque frame"""
+        scene = manager.top
+        if scene is None or not scene.interactive:
+            return
+        recording = InputRecorder.recording
+        name = type(scene).__name__
+        if name != InputRecorder.last_scene:
+            InputRecorder.last_scene = name
+            recording["checkpoints"].append([len(recording["frames"]), name])
+        encoded = [InputRecorder.encode(event) for event in events if event.type in InputRecorder.TYPES.values()]
+        recording["frames"].append([dt, encoded])
+
+    @staticmethod
+    def stop():
+        """Termine l'enregistrement et l'écrit ; retourne le chemin"""
+        recording = InputRecorder.recording
+        if recording is None:
+            return None
+        InputRecorder.recording = None
+        with open(InputRecorder.path, "w", encoding="utf-8") as f:
+            json.dump(recording, f, ensure_ascii=False, separators=(",", ":"))
+        return InputRecorder.path
+
+    @staticmethod
+    def encode(event):
+        encoded = {"type": pygame.event.event_name(event.type)}
+        for field in InputRecorder.FIELDS:
+            if field in event.dict:
+                value = event.dict[field]
+                encoded[field] = list(value) if isinstance(value, tuple) else value
+        return encoded
+
+    @staticmethod
+    def decode(encoded):
+        attributes = {field: tuple(value) if isinstance(value, list) else value
+                      for field, value in encoded.items() if field != "type"}
+        return pygame.event.Event(InputRecorder.TYPES[encoded["type"]], attributes)
+
+    @staticmethod
+    def load(path):
+        with open(path, "r", encoding="utf-8") as f:
+            recording = json.load(f)
+        if recording.get("version") != InputRecorder.VERSION:
+            raise ValueError(f"Version d'enregistrement non prise en charge : {recording.get('version')}")
+        return recording
+
+    @staticmethod
+    def replay(manager, recording, realtime=False, idle_dt=1000 / 60, max_idle_seconds=30):
+        """Rejoue `recording` dans `manager` (pile déjà initialisée) ; retourne les mesures par frame
+
+        Les frames non interactives (chargement) reçoivent `idle_dt`, aucun
+        événement, et durent toujours `idle_dt` : les threads de chargement
+        ne sont pas privés du GIL par une boucle qui tourne à vide.
+        Retourne {"frames": [(scène, ms)], "loading": [ms], "divergences": [...], ...} :
+        les frames de chargement sont à part (leur durée dépend des threads).
+        """
+        GameClock.reset(recording["seed"])
+        frames = recording["frames"]
+        checkpoints = dict((index, name) for index, name in recording["checkpoints"])
+        timings = []
+        loading = []
+        divergences = []
+        index = 0
+        idle_since = None
+        manager.running = True
+        while manager.running and manager.stack and index < len(frames):
+            scene = manager.top
+            name = type(scene).__name__
+            if scene.interactive:
+                expected = checkpoints.get(index)
+                if expected is not None and expected != name:
+                    divergences.append(f"frame {index} : {name} au lieu de {expected}")
+                dt, encoded = frames[index]
+                events = [InputRecorder.decode(event) for event in encoded]
+                index += 1
+                idle_since = None
+            else:
+                dt, events = idle_dt, []
+                idle_since = idle_since or time.perf_counter()
+                if time.perf_counter() - idle_since > max_idle_seconds:
+                    divergences.append(f"frame {index} : {name} bloqué depuis {max_idle_seconds} s")
+                    break
+            pygame.event.pump()
+            start = time.perf_counter()
+            manager.step(dt, events)
+            elapsed = time.perf_counter() - start
+            if scene.interactive:
+                timings.append((name, elapsed * 1000))
+            else:
+                loading.append(elapsed * 1000)
+            if (realtime or not scene.interactive) and elapsed * 1000 < dt:
+                time.sleep(dt / 1000 - elapsed)
+        return {"frames": timings, "loading": loading, "replayed": index, "recorded": len(frames), "divergences": divergences}
@@ -0,0 +1,105 @@
+import pygame
+
+
+class InputState:
+    """Entrées d'une frame, prédigérées par le SceneManager avant de les passer aux scènes
+
+    Seuls les types d'événements utilisés (ALLOWED) entrent dans la file SDL.
+    Les MOUSEMOTION d'une frame sont fusionnés en un seul (dernière position,
+    déplacements cumulés), placé là où se trouvait le dernier : une souris
+    rapide ne déclenche qu'un test de survol par frame au lieu de plusieurs
+    dizaines. Les scènes peuvent aussi lire l'état directement
+    (`self.manager.input`) ou le recevoir dans Scene.handle_input().
+    """
+    ALLOWED = [
+        pygame.QUIT,
+        pygame.VIDEORESIZE,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,  # Remplit event.unicode des KEYDOWN (saisie du nom)
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION
+    ]
+
+    def __init__(self):
+        self.mouse_pos = (0, 0)
+        self.mouse_rel = (0, 0)
+        self.moved = False
+        self.buttons_held = set()
+        self.keys_held = set()
+        self.clicks = []          # (bouton, position) des MOUSEBUTTONDOWN de la frame
+        self.releases = []        # (bouton, position) des MOUSEBUTTONUP de la frame
+        self.keys_pressed = []    # Touches enfoncées pendant la frame, dans l'ordre
+        self.text = ""            # Caractères tapés pendant la frame
+        self.raw_events = 0       # Statistiques de la dernière frame
+        self.merged_motions = 0
+
+    @staticmethod
+    def install(extra=()):
+        """Filtre la file d'événements SDL (après Display.init) ; `extra` : types supplémentaires"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(InputState.ALLOWED + list(extra))
+
+    def pressed(self, key):
+        """La touche a-t-elle été enfoncée pendant cette frame ?"""
+        return key in self.keys_pressed
+
+    def clicked(self, button=1):
+        """Position du premier clic de `button` pendant cette frame, ou None"""
+        for clicked_button, pos in self.clicks:
+            if clicked_button == button:
+                return pos
+        return None
+
+    def collect(self, events):
+        """Met à jour l'état et retourne les événements à distribuer (un seul MOUSEMOTION)"""
+        self.clicks = []
+        self.releases = []
+        self.keys_pressed = []
+        self.text = ""
+        self.moved = False
+        self.raw_events = len(events)
+        self.merged_motions = 0
+
+        digested = []
+        last_motion = None
+        motion_index = 0
+        rel_x = rel_y = 0
+        for event in events:
+            kind = event.type
+            if kind == pygame.MOUSEMOTION:
+                if last_motion is not None:
+                    self.merged_motions += 1
+                last_motion = event
+                motion_index = len(digested)
+                self.mouse_pos = event.pos
+                rel = getattr(event, "rel", (0, 0))
+                rel_x += rel[0]
+                rel_y += rel[1]
+                continue
+            if kind == pygame.MOUSEBUTTONDOWN:
+                self.buttons_held.add(event.button)
+                self.clicks.append((event.button, event.pos))
+                self.mouse_pos = event.pos
+            elif kind == pygame.MOUSEBUTTONUP:
+                self.buttons_held.discard(event.button)
+                self.releases.append((event.button, event.pos))
+                self.mouse_pos = event.pos
+            elif kind == pygame.KEYDOWN:
+                self.keys_held.add(event.key)
+                self.keys_pressed.append(event.key)
+                self.text += getattr(event, "unicode", "")
+            elif kind == pygame.KEYUP:
+                self.keys_held.discard(event.key)
+            digested.append(event)
+
+        if last_motion is not None:
+            self.moved = True
+            self.mouse_rel = (rel_x, rel_y)
+            if self.merged_motions:
+                last_motion = pygame.event.Event(pygame.MOUSEMOTION, dict(last_motion.dict, rel=self.mouse_rel))
+            digested.insert(motion_index, last_motion)
+        else:
+            self.mouse_rel = (0, 0)
+        return digested
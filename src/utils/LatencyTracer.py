@@ -0,0 +1,170 @@
+import time
+import pygame
+
+
+class LatencyHistogram:
+    """Histogramme de latences à seaux fixes (mémoire constante quelle que soit la durée de jeu)"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)   # Dernier seau : au-delà de la dernière borne
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, ms):
+        index = 0
+        while index < len(self.bounds) and ms > self.bounds[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.last = ms
+
+    def percentile(self, pct):
+        """Borne haute du seau qui contient le percentile demandé (au plus le maximum observé)"""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], round(self.max, 1)) if index < len(self.bounds) else round(self.max, 1)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class LatencyTracer:
+    """Mesure le temps entre la sortie d'une entrée de la file et l'affichage de son effet
+
+    Le SceneManager note l'instant où les événements de la frame sont retirés
+    de la file, la scène qui les reçoit, puis la fin du present() qui suit :
+    c'est la première image qui peut montrer le changement d'état. Si la frame
+    s'arrête avant d'être affichée (changement de scène), les entrées attendent
+    la prochaine image. Le temps passé dans la file avant le retrait (jusqu'à
+    une frame complète avec le plafond de FPS) est suivi à part, dans `queue_wait`.
+
+    Histogrammes par (scène, type d'entrée) ; F10 affiche le relevé en direct.
+    """
+    ENABLED = False
+    OVERLAY = False
+    BUCKETS_MS = (1, 2, 4, 8, 12, 16, 20, 25, 33, 50, 67, 100, 200, 500)
+    TRACED = {
+        pygame.KEYDOWN: "clavier",
+        pygame.MOUSEBUTTONDOWN: "clic",
+        pygame.MOUSEBUTTONUP: "relâchement",
+        pygame.MOUSEMOTION: "souris"
+    }
+
+    histograms = {}      # (scène, type) -> LatencyHistogram
+    queue_wait = LatencyHistogram(BUCKETS_MS)
+    pending = []         # (scène, type, retrait) des entrées pas encore affichées
+    pulled_at = 0.0
+    last_pull = None
+    font = None
+
+    @staticmethod
+    def enable(overlay=False):
+        LatencyTracer.ENABLED = True
+        LatencyTracer.OVERLAY = LatencyTracer.OVERLAY or overlay
+
+    @staticmethod
+    def toggle_overlay():
+        """F10 : affiche ou masque le relevé (active la mesure au besoin)"""
+        LatencyTracer.OVERLAY = not LatencyTracer.OVERLAY
+        if LatencyTracer.OVERLAY:
+            LatencyTracer.ENABLED = True
+
+    @staticmethod
+    def pulled(now=None):
+        """Début de frame : les événements viennent d'être retirés de la file"""
+        now = time.perf_counter() if now is None else now
+        LatencyTracer.pulled_at = now
+        if LatencyTracer.last_pull is not None:
+            # Borne haute de l'attente d'une entrée arrivée juste après le retrait précédent
+            LatencyTracer.queue_wait.add((now - LatencyTracer.last_pull) * 1000)
+        LatencyTracer.last_pull = now
+
+    @staticmethod
+    def handled(scene, event):
+        """Une entrée vient d'être distribuée à `scene`"""
+        kind = LatencyTracer.TRACED.get(event.type)
+        if kind is None or scene is None:
+            return
+        LatencyTracer.pending.append((type(scene).__name__, kind, LatencyTracer.pulled_at))
+
+    @staticmethod
+    def presented(now=None):
+        """Fin du present() : toutes les entrées en attente sont visibles"""
+        if not LatencyTracer.pending:
+            return
+        now = time.perf_counter() if now is None else now
+        for scene, kind, pulled_at in LatencyTracer.pending:
+            key = (scene, kind)
+            histogram = LatencyTracer.histograms.get(key)
+            if histogram is None:
+                histogram = LatencyTracer.histograms[key] = LatencyHistogram(LatencyTracer.BUCKETS_MS)
+            histogram.add((now - pulled_at) * 1000)
+        LatencyTracer.pending = []
+
+    @staticmethod
+    def reset():
+        LatencyTracer.histograms = {}
+        LatencyTracer.queue_wait = LatencyHistogram(LatencyTracer.BUCKETS_MS)
+        LatencyTracer.pending = []
+        LatencyTracer.last_pull = None
+
+    @staticmethod
+    def to_dict():
+        """Résultats sérialisables (benchmark, comparaison avant / après)"""
+        def summary(histogram):
+            return {
+                "count": histogram.count,
+                "mean_ms": round(histogram.mean, 2),
+                "p50_ms": histogram.percentile(50),
+                "p95_ms": histogram.percentile(95),
+                "max_ms": round(histogram.max, 2),
+                "buckets": dict(zip([f"<={b}" for b in histogram.bounds] + ["more"], histogram.counts))
+            }
+        return {
+            "queue_wait": summary(LatencyTracer.queue_wait),
+            "inputs": {f"{scene}/{kind}": summary(histogram)
+                       for (scene, kind), histogram in sorted(LatencyTracer.histograms.items())}
+        }
+
+    @staticmethod
+    def report():
+        lines = ["Latence entrée -> affichage (ms, depuis la sortie de la file)",
+                 f"{'Scène':<20}{'Entrée':<13}{'N':>6}{'moy.':>8}{'p50':>7}{'p95':>7}{'max':>8}"]
+        for (scene, kind), histogram in sorted(LatencyTracer.histograms.items()):
+            lines.append(f"{scene:<20}{kind:<13}{histogram.count:>6}{histogram.mean:>8.1f}"
+                         f"{histogram.percentile(50):>7}{histogram.percentile(95):>7}{histogram.max:>8.1f}")
+        wait = LatencyTracer.queue_wait
+        lines.append(f"Attente possible dans la file (intervalle entre frames) : "
+                     f"moy. {wait.mean:.1f}, p95 {wait.percentile(95)}, max {wait.max:.1f}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def draw_overlay(screen, scene):
+        """Relevé en direct pour la scène courante, en haut à gauche"""
+        if LatencyTracer.font is None:
+            LatencyTracer.font = pygame.font.Font(None, 24)
+        name = type(scene).__name__
+        rows = [f"Latence {name} (ms)"]
+        for (scene_name, kind), histogram in sorted(LatencyTracer.histograms.items()):
+            if scene_name == name:
+                rows.append(f"{kind}: {histogram.last:.1f}  p50 {histogram.percentile(50)}  "
+                            f"p95 {histogram.percentile(95)}  max {histogram.max:.0f}")
+        rows.append(f"file: p95 {LatencyTracer.queue_wait.percentile(95)}")
+        # Rendu direct : des valeurs qui changent à chaque frame videraient le cache de textes du jeu
+        texts = [LatencyTracer.font.render(row, True, (255, 255, 255)) for row in rows]
+        width = max(text.get_width() for text in texts) + 20
+        screen.fill_alpha((0, 0, 0, 180), pygame.Rect(5, 5, width, 22 * len(texts) + 10))
+        for i, text in enumerate(texts):
+            screen.blit(text, (15, 10 + 22 * i))
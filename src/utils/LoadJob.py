@@ -0,0 +1,20 @@
+class LoadJob:
+    """Chargement en deux temps pour l'écran de chargement
+
+    `load()` tourne sur un thread de travail (lecture disque, décodage) et ne
+    doit pas toucher à l'affichage ; `finalize(résultat)` tourne ensuite sur le
+    thread principal (convert(), mise en cache). `weight` pondère la progression.
+    """
+
+    def __init__(self, name, load, finalize=None, weight=1):
+        self.name = name
+        self.load = load
+        self.finalize = finalize
+        self.weight = weight
+        self.result = None
+        self.error = None
+
+    def complete(self, value):
+        """Étape du thread principal ; garde le résultat final dans `result`"""
+        self.result = self.finalize(value) if self.finalize else value
+        return self.result
@@ -0,0 +1,154 @@
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+
+class Log:
+    """Journal à niveaux et catégories, à la place des print() de débogage
+
+        Log.debug("combat", "Dégâts de {}: {}", move["name"], damage)
+        Log.debug("menu", lambda: f"Noms connus: {POKEMON_NAMES_FR}")  # Construit seulement si utilisé
+
+    Le message n'est formaté que s'il est affiché ou gardé pour un rapport :
+    un appel sous le seuil s'arrête à une comparaison d'entiers. Les messages à
+    partir de RING_LEVEL sont gardés, déjà formatés, dans un tampon circulaire
+    (RING_SIZE dernières entrées) écrit dans CRASH_FILE si le jeu plante : le
+    tampon ne retient aucun objet du jeu et montre l'état au moment du message.
+    La console n'affiche que LEVEL et plus, réglable par catégorie.
+    """
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error"}
+
+    LEVEL = INFO              # Console
+    CATEGORY_LEVELS = {}      # Console, par catégorie ("combat": Log.DEBUG...)
+    RING_LEVEL = INFO         # Tampon pour les rapports de plantage (DEBUG : chaque appel est formaté)
+    RING_SIZE = 1000
+    CRASH_FILE = "crash_log.txt"
+
+    ring = deque(maxlen=RING_SIZE)
+    threshold = INFO          # Plus petit niveau utile (console, catégories ou tampon)
+    lock = threading.Lock()
+
+    @staticmethod
+    def level_from_name(name):
+        for level, level_name in Log.NAMES.items():
+            if level_name == name.lower():
+                return level
+        raise ValueError(f"Niveau de journal inconnu : {name}")
+
+    @staticmethod
+    def configure(level=None, categories=None, ring_level=None, ring_size=None):
+        """Change les niveaux (console, par catégorie, tampon) et recalcule le seuil"""
+        if level is not None:
+            Log.LEVEL = level
+        if categories:
+            Log.CATEGORY_LEVELS.update(categories)
+        if ring_level is not None:
+            Log.RING_LEVEL = ring_level
+        if ring_size is not None and ring_size != Log.ring.maxlen:
+            Log.RING_SIZE = ring_size
+            Log.ring = deque(Log.ring, maxlen=ring_size)
+        Log.threshold = min([Log.LEVEL, Log.RING_LEVEL] + list(Log.CATEGORY_LEVELS.values()))
+
+    @staticmethod
+    def debug(category, message, *args):
+        if Log.DEBUG >= Log.threshold:
+            Log.log(Log.DEBUG, category, message, args)
+
+    @staticmethod
+    def info(category, message, *args):
+        if Log.INFO >= Log.threshold:
+            Log.log(Log.INFO, category, message, args)
+
+    @staticmethod
+    def warning(category, message, *args):
+        if Log.WARNING >= Log.threshold:
+            Log.log(Log.WARNING, category, message, args)
+
+    @staticmethod
+    def error(category, message, *args):
+        if Log.ERROR >= Log.threshold:
+            Log.log(Log.ERROR, category, message, args)
+
+    @staticmethod
+    def enabled(level, category):
+        """Le message serait-il affiché ? (pour éviter de préparer des arguments coûteux)"""
+        return level >= Log.CATEGORY_LEVELS.get(category, Log.LEVEL)
+
+    @staticmethod
+    def log(level, category, message, args=()):
+        text = None
+        if level >= Log.RING_LEVEL:
+            # Texte seulement : des arguments gardés tels quels retiendraient des objets vivants
+            # (une exception garde même sa pile, et avec elle les scènes de ses frames)
+            text = Log.format_message(message, args)
+            Log.ring.append((time.time(), level, category, text))
+        if level >= Log.CATEGORY_LEVELS.get(category, Log.LEVEL):
+            if text is None:
+                text = Log.format_message(message, args)
+            line = Log.format_line(level, category, text)
+            with Log.lock:
+                sys.stdout.write(line + "\n")
+
+    @staticmethod
+    def format_message(message, args):
+        try:
+            if callable(message):
+                return str(message())
+            return message.format(*args) if args else message
+        except Exception as e:
+            return f"{message!r} {args!r} (formatage impossible : {e})"
+
+    @staticmethod
+    def format_line(level, category, text):
+        return f"[{Log.NAMES.get(level, level)}] {category}: {text}"
+
+    @staticmethod
+    def recent(count=None):
+        """Dernières entrées du tampon, formatées"""
+        entries = list(Log.ring)[-count:] if count else list(Log.ring)
+        return [f"{time.strftime('%H:%M:%S', time.localtime(stamp))}.{int(stamp % 1 * 1000):03d} "
+                f"{Log.format_line(level, category, text)}"
+                for stamp, level, category, text in entries]
+
+    @staticmethod
+    def dump(path=None, exc_info=None):
+        """Écrit le tampon (et l'exception éventuelle) dans un fichier ; retourne son chemin"""
+        path = path or Log.CRASH_FILE
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Journal du {time.strftime('%Y-%m-%d %H:%M:%S')} ({len(Log.ring)} dernières entrées)\n\n")
+            f.write("\n".join(Log.recent()) + "\n")
+            if exc_info:
+                f.write("\n" + "".join(traceback.format_exception(*exc_info)))
+        return path
+
+    @staticmethod
+    def install_crash_dump(path=None):
+        """Vide le tampon dans un fichier à toute exception non rattrapée (thread principal ou autre)"""
+        if path:
+            Log.CRASH_FILE = path
+        previous_hook = sys.excepthook
+        previous_thread_hook = threading.excepthook
+
+        def crash_dump(exc_info):
+            try:
+                print(f"Journal de plantage écrit dans {Log.dump(exc_info=exc_info)}", file=sys.stderr)
+            except OSError:
+                pass
+
+        def excepthook(exc_type, exc, tb):
+            if not issubclass(exc_type, KeyboardInterrupt):
+                crash_dump((exc_type, exc, tb))
+            previous_hook(exc_type, exc, tb)
+
+        def thread_excepthook(args):
+            crash_dump((args.exc_type, args.exc_value, args.exc_traceback))
+            previous_thread_hook(args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = thread_excepthook
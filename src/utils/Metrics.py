@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+
+import pygame
+
+from utils.LatencyTracer import LatencyHistogram
+from utils.SaveWriter import SaveWriter
+
+
+class _Timer:
+    """Durée d'un bloc, ajoutée à l'histogramme `name` (en ms)"""
+    __slots__ = ("name", "start", "ms")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+        self.ms = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.ms = (time.perf_counter() - self.start) * 1000
+        Metrics.observe(self.name, self.ms)
+        return False
+
+
+class Metrics:
+    """Registre des mesures du jeu : compteurs, jauges et histogrammes
+
+        Metrics.count("battle.damage_calcs")
+        Metrics.gauge("scenes.stack", len(self.stack))
+        with Metrics.timer("profile.read_ms"):
+            ...
+
+    Les compteurs ne font que croître ; les instantanés en déduisent un débit
+    par seconde depuis l'instantané précédent. `sample(name, fonction)`
+    enregistre une jauge lue seulement au moment de l'instantané. Les
+    histogrammes ont des seaux fixes (mémoire constante). Utilisable depuis
+    les threads de chargement et d'écriture.
+
+    Avec FILE (--metrics), un instantané JSON est écrit toutes les INTERVAL
+    secondes (écriture atomique sur un thread dédié) : un kiosque sans
+    débogueur se surveille en lisant ce fichier. F7 affiche la même page à l'écran.
+    """
+    FILE = None
+    INTERVAL = 10.0
+    OVERLAY = False
+    OVERLAY_REFRESH = 0.5     # Secondes entre deux rendus de la page (texte coûteux)
+    BUCKETS_MS = (0.1, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000, 5000)
+
+    counters = {}
+    gauges = {}
+    samplers = {}             # Jauges calculées à la demande : nom -> fonction
+    histograms = {}
+    assets = {}               # Ressource -> durée du dernier chargement (ms)
+    lock = threading.Lock()
+    started = time.time()
+    started_monotonic = time.monotonic()
+    baselines = {}            # Lecteur ("file", "page") -> (instant, compteurs) du dernier instantané
+    last_dump = time.monotonic()
+    writer = SaveWriter("MetricsWriter")
+    page = None               # (instant, surfaces) de la page affichée
+    font = None
+
+    @staticmethod
+    def count(name, amount=1):
+        with Metrics.lock:
+            Metrics.counters[name] = Metrics.counters.get(name, 0) + amount
+
+    @staticmethod
+    def gauge(name, value):
+        with Metrics.lock:
+            Metrics.gauges[name] = value
+
+    @staticmethod
+    def sample(name, function):
+        """Jauge lue à chaque instantané (taille d'un cache, nombre de scènes...)"""
+        Metrics.samplers[name] = function
+
+    @staticmethod
+    def observe(name, ms):
+        with Metrics.lock:
+            histogram = Metrics.histograms.get(name)
+            if histogram is None:
+                histogram = Metrics.histograms[name] = LatencyHistogram(Metrics.BUCKETS_MS)
+            histogram.add(ms)
+
+    @staticmethod
+    def asset(name, ms):
+        """Durée de chargement d'une ressource : histogramme "assets.load_ms" et relevé par ressource"""
+        Metrics.observe("assets.load_ms", ms)
+        with Metrics.lock:
+            Metrics.assets[name] = round(ms, 2)
+
+    @staticmethod
+    def timer(name):
+        """Contexte qui mesure le bloc ; la durée reste lisible dans `.ms` après le bloc"""
+        return _Timer(name)
+
+    @staticmethod
+    def reset():
+        with Metrics.lock:
+            Metrics.counters = {}
+            Metrics.gauges = {}
+            Metrics.histograms = {}
+            Metrics.assets = {}
+            Metrics.baselines = {}
+        Metrics.started_monotonic = time.monotonic()
+
+    @staticmethod
+    def snapshot(reader="file"):
+        """Instantané sérialisable ; les débits sont calculés depuis l'instantané précédent de `reader`"""
+        now = time.monotonic()
+        with Metrics.lock:
+            counters = dict(Metrics.counters)
+            histograms = {name: {
+                "count": histogram.count,
+                "mean_ms": round(histogram.mean, 3),
+                "p50_ms": histogram.percentile(50),
+                "p95_ms": histogram.percentile(95),
+                "max_ms": round(histogram.max, 3)
+            } for name, histogram in Metrics.histograms.items()}
+            assets = dict(Metrics.assets)
+            gauges = dict(Metrics.gauges)
+        for name, function in Metrics.samplers.items():
+            try:
+                gauges[name] = function()
+            except Exception as e:
+                gauges[name] = f"erreur : {e}"
+        since, previous = Metrics.baselines.get(reader, (Metrics.started_monotonic, {}))
+        elapsed = max(now - since, 1e-6)
+        rates = {name: round((value - previous.get(name, 0)) / elapsed, 2)
+                 for name, value in counters.items()}
+        Metrics.baselines[reader] = (now, counters)
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "uptime_s": round(time.time() - Metrics.started, 1),
+            "interval_s": round(elapsed, 2),
+            "counters": dict(sorted(counters.items())),
+            "rates_per_s": dict(sorted(rates.items())),
+            "gauges": dict(sorted(gauges.items())),
+            "histograms": dict(sorted(histograms.items())),
+            "assets_load_ms": dict(sorted(assets.items(), key=lambda item: -item[1]))
+        }
+
+    @staticmethod
+    def dump(path=None):
+        """Programme l'écriture d'un instantané dans `path` (FILE par défaut) ; retourne le chemin ou None"""
+        path = path or Metrics.FILE
+        if not path:
+            return None
+        Metrics.last_dump = time.monotonic()
+        Metrics.writer.submit(path, json.dumps(Metrics.snapshot(), indent=1, ensure_ascii=False))
+        return path
+
+    @staticmethod
+    def dump_if_due():
+        """Appelé à chaque frame : un instantané toutes les INTERVAL secondes si FILE est défini"""
+        if Metrics.FILE and time.monotonic() - Metrics.last_dump >= Metrics.INTERVAL:
+            Metrics.dump()
+
+    @staticmethod
+    def sync(timeout=None):
+        """Dernier instantané puis attente de l'écriture (sortie du jeu)"""
+        Metrics.dump()
+        return Metrics.writer.wait(timeout)
+
+    @staticmethod
+    def toggle_overlay():
+        Metrics.OVERLAY = not Metrics.OVERLAY
+        Metrics.page = None
+
+    @staticmethod
+    def page_rows():
+        """Lignes de la page de débogage"""
+        snapshot = Metrics.snapshot("page")
+        rows = [f"Mesures ({snapshot['uptime_s']:.0f} s)"]
+        for name, value in snapshot["counters"].items():
+            rows.append(f"{name}: {value}  ({snapshot['rates_per_s'][name]:g}/s)")
+        for name, value in snapshot["gauges"].items():
+            rows.append(f"{name} = {value:.2f}" if isinstance(value, float) else f"{name} = {value}")
+        for name, summary in snapshot["histograms"].items():
+            rows.append(f"{name}: n {summary['count']}  moy. {summary['mean_ms']:.2f}  "
+                        f"p95 {summary['p95_ms']}  max {summary['max_ms']:.1f}")
+        for name, ms in list(snapshot["assets_load_ms"].items())[:5]:
+            rows.append(f"lent : {name} {ms:.1f} ms")
+        return rows
+
+    @staticmethod
+    def draw_overlay(screen):
+        """Page F7, en bas à gauche ; rendue au plus toutes les OVERLAY_REFRESH secondes"""
+        now = time.monotonic()
+        if Metrics.page is None or now - Metrics.page[0] >= Metrics.OVERLAY_REFRESH:
+            if Metrics.font is None:
+                Metrics.font = pygame.font.Font(None, 20)
+            # Rendu direct : ces textes changent sans cesse et videraient le cache de textes du jeu
+            rows = Metrics.page_rows()
+            max_rows = max(1, (screen.get_height() - 20) // 18)
+            Metrics.page = (now, [Metrics.font.render(row, True, (255, 255, 255)) for row in rows[:max_rows]])
+        texts = Metrics.page[1]
+        width = max(text.get_width() for text in texts) + 20
+        height = 18 * len(texts) + 10
+        top = screen.get_height() - height - 5
+        screen.fill_alpha((0, 0, 0, 180), pygame.Rect(5, top, width, height))
+        for i, text in enumerate(texts):
+            screen.blit(text, (15, top + 5 + 18 * i))
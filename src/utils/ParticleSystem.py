@@ -0,0 +1,114 @@
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """Système de particules vectorisé : toutes les données vivent dans des tableaux NumPy"""
+
+    def __init__(self, capacity, colors, sizes=(2, 4, 6), alpha_levels=4, glow=False,
+                 gravity=(0.0, 0.0), blend=0, seed=None):
+        self.capacity = capacity
+        self.gravity = np.array(gravity, dtype=np.float32)
+        self.blend = blend
+        self.rng = np.random.default_rng(seed)
+
+        # Données des particules (seules les `count` premières lignes sont vivantes)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)      # Temps restant (s)
+        self.max_life = np.ones(capacity, dtype=np.float32)   # Durée de vie initiale (s)
+        self.kind = np.zeros(capacity, dtype=np.int32)        # Index couleur/taille
+        self.count = 0
+        self._spawn_debt = 0.0
+
+        # Sprites pré-rendus : un par (couleur, taille, niveau d'opacité)
+        self.alpha_levels = alpha_levels
+        self.kinds = len(colors) * len(sizes)
+        self.sprites = []
+        half_sizes = []
+        for color in colors:
+            for size in sizes:
+                for level in range(alpha_levels):
+                    alpha = int(255 * (level + 1) / alpha_levels)
+                    self.sprites.append(self._render_sprite(color, size, alpha, glow))
+                    half_sizes.append(self.sprites[-1].get_width() // 2)
+        self.half_sizes = np.array(half_sizes, dtype=np.float32)
+
+    @staticmethod
+    def _render_sprite(color, size, alpha, glow):
+        """Dessine une particule une fois pour toutes"""
+        radius = size * 2 if glow else size
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        if glow:
+            # Halo dégradé : cercles concentriques de plus en plus opaques
+            for r in range(radius, 0, -1):
+                a = int(alpha * (1 - r / radius) ** 1.5)
+                pygame.draw.circle(sprite, (*color[:3], a), (radius, radius), r)
+        else:
+            pygame.draw.circle(sprite, (*color[:3], alpha), (radius, radius), radius)
+        return sprite
+
+    def emit(self, n, x, y, spread=(0, 0), velocity=((-20, 20), (-20, 20)), life=(1.0, 2.0)):
+        """Ajoute `n` particules autour de (x, y) (vitesses en pixels/s, durée de vie en s)"""
+        n = min(int(n), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        rng = self.rng
+        self.pos[start:end, 0] = x + rng.uniform(-spread[0], spread[0], n) if spread[0] else x
+        self.pos[start:end, 1] = y + rng.uniform(-spread[1], spread[1], n) if spread[1] else y
+        self.vel[start:end, 0] = rng.uniform(velocity[0][0], velocity[0][1], n)
+        self.vel[start:end, 1] = rng.uniform(velocity[1][0], velocity[1][1], n)
+        lifetimes = rng.uniform(life[0], life[1], n)
+        self.life[start:end] = lifetimes
+        self.max_life[start:end] = lifetimes
+        self.kind[start:end] = rng.integers(0, self.kinds, n)
+        self.count = end
+        return n
+
+    def emit_rate(self, rate, dt, *args, **kwargs):
+        """Émission continue de `rate` particules par seconde"""
+        self._spawn_debt += rate * dt
+        n = int(self._spawn_debt)
+        self._spawn_debt -= n
+        return self.emit(n, *args, **kwargs) if n else 0
+
+    def update(self, dt):
+        """Avance toutes les particules de `dt` secondes et supprime les mortes en bloc"""
+        count = self.count
+        if not count:
+            return
+        vel = self.vel[:count]
+        if self.gravity.any():
+            vel += self.gravity * dt
+        self.pos[:count] += vel * dt
+        self.life[:count] -= dt
+
+        alive = self.life[:count] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != count:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.kind):
+                array[:alive_count] = array[:count][alive]
+            self.count = alive_count
+
+    def clear(self):
+        self.count = 0
+        self._spawn_debt = 0.0
+
+    def draw(self, surface):
+        """Blit de toutes les particules vivantes en un seul appel"""
+        count = self.count
+        if not count:
+            return
+        # Niveau d'opacité selon la vie restante (fondu en fin de vie)
+        fraction = self.life[:count] / self.max_life[:count]
+        levels = np.minimum((fraction * self.alpha_levels).astype(np.int32), self.alpha_levels - 1)
+        sprite_index = self.kind[:count] * self.alpha_levels + levels
+        top_left = (self.pos[:count] - self.half_sizes[sprite_index, None]).astype(np.int32)
+
+        sprites = self.sprites
+        batch = zip(map(sprites.__getitem__, sprite_index.tolist()), top_left.tolist())
+        if hasattr(surface, "fblits"):
+            surface.fblits(batch, self.blend)
+        else:
+            surface.blits([(sprite, pos, None, self.blend) for sprite, pos in batch], doreturn=False)
@@ -1,32 +1,226 @@
-import json
-import os
+import atexit
+import time
+from utils.LoadJob import LoadJob
+from utils.SaveWriter import SaveWriter
+from utils.Log import Log
+from utils.Metrics import Metrics
+from utils.ProfileStore import JsonProfileStore, JournalProfileStore, SqliteProfileStore
 
 class ProfileManager:
+    """Profil du joueur, gardé en mémoire et réécrit sur le disque quand il a changé
+
+    `load_profile()` retourne le profil en cache (O(1)) ; la sauvegarde n'est
+    relue que si elle a été modifiée hors du jeu (vérifié au plus toutes les
+    CHECK_INTERVAL secondes). `save_profile()` met à jour le cache et le marque
+    modifié ; `flush()` confie une copie au SaveWriter (thread d'écriture,
+    fichier temporaire puis renommage). Les sauvegardes rapprochées sont
+    regroupées : flush après DEBOUNCE secondes sans nouvelle sauvegarde, au plus
+    tard FLUSH_INTERVAL secondes après la première, et toujours à la sortie du jeu.
+
+    BACKEND choisit le stockage (utils/ProfileStore.py) : "json" (un seul
+    profil dans SAVE_FILE), "journal" (SAVE_FILE + changements ajoutés à
+    SAVE_JOURNAL, compacté régulièrement) ou "sqlite" (plusieurs profils et
+    classements dans SAVE_DB, avec import de SAVE_FILE au premier lancement).
+    """
+    BACKENDS = ("json", "journal", "sqlite")
+    BACKEND = "json"
     SAVE_FILE = "save_data.json"
+    SAVE_JOURNAL = "save_data.journal"
+    SAVE_DB = "save_data.db"
+    CHECK_INTERVAL = 1.0
+    DEBOUNCE = 0.5
+    FLUSH_INTERVAL = 2.0
+    
+    profile = None        # Profil en mémoire (None : pas de sauvegarde)
+    loaded = False        # Le cache correspond-il au stockage courant ?
+    loaded_store = None
+    file_stamp = None     # Version de la sauvegarde lue ou écrite en dernier
+    stamp_stale = False   # Une écriture du jeu vient de se terminer
+    last_check = 0.0
+    dirty = False
+    dirty_since = 0.0
+    last_save = 0.0
+    writer = SaveWriter("ProfileWriter")
+    stores = {}
     
     @staticmethod
-    def save_profile(data):
+    def store():
+        """Backend de stockage pour la configuration courante (créé une fois par chemin)"""
+        if ProfileManager.BACKEND == "sqlite":
+            key = ("sqlite", ProfileManager.SAVE_DB)
+            factory = lambda: SqliteProfileStore(ProfileManager.SAVE_DB, ProfileManager.SAVE_FILE)
+        elif ProfileManager.BACKEND == "journal":
+            key = ("journal", ProfileManager.SAVE_FILE, ProfileManager.SAVE_JOURNAL)
+            factory = lambda: JournalProfileStore(ProfileManager.SAVE_FILE, ProfileManager.SAVE_JOURNAL)
+        else:
+            key = ("json", ProfileManager.SAVE_FILE)
+            factory = lambda: JsonProfileStore(ProfileManager.SAVE_FILE)
+        if key not in ProfileManager.stores:
+            ProfileManager.stores[key] = factory()
+        return ProfileManager.stores[key]
+    
+    @staticmethod
+    def read_saved():
+        """Lit la sauvegarde courante ; utilisable depuis un thread"""
+        Metrics.count("profile.disk_reads")
         try:
-            with open(ProfileManager.SAVE_FILE, 'w') as f:
-                json.dump(data, f)
-            return True
+            with Metrics.timer("profile.read_ms"):
+                return ProfileManager.store().read()
         except Exception as e:
-            print(f"Erreur lors de la sauvegarde: {e}")
-            return False
+            Log.error("sauvegarde", "Erreur lors du chargement: {}", e)
+            return None
+    
+    @staticmethod
+    def adopt(profile):
+        """Remplace le cache par un profil lu dans la sauvegarde"""
+        ProfileManager.profile = profile
+        ProfileManager.loaded = True
+        ProfileManager.loaded_store = ProfileManager.store()
+        ProfileManager.file_stamp = ProfileManager.loaded_store.stamp()
+        ProfileManager.last_check = time.monotonic()
+        ProfileManager.dirty = False
+        return ProfileManager.profile
+    
+    @staticmethod
+    def load_job():
+        """LoadJob qui lit la sauvegarde sur un thread de travail (écran de chargement)"""
+        return LoadJob("Profil", ProfileManager.read_saved, ProfileManager.adopt)
+    
+    @staticmethod
+    def save_profile(data):
+        """Met à jour le profil en mémoire ; l'écriture sur le disque est différée (flush)"""
+        Metrics.count("profile.saves")
+        now = time.monotonic()
+        if not ProfileManager.dirty:
+            ProfileManager.dirty_since = now
+        ProfileManager.last_save = now
+        ProfileManager.profile = data
+        ProfileManager.loaded = True
+        ProfileManager.loaded_store = ProfileManager.store()
+        ProfileManager.dirty = True
+        return True
     
     @staticmethod
     def load_profile():
-        try:
-            if os.path.exists(ProfileManager.SAVE_FILE):
-                with open(ProfileManager.SAVE_FILE, 'r') as f:
-                    return json.load(f)
+        Metrics.count("profile.loads")
+        if not ProfileManager.loaded or ProfileManager.loaded_store is not ProfileManager.store():
+            return ProfileManager.adopt(ProfileManager.read_saved())
+        
+        now = time.monotonic()
+        # Pendant une écriture du jeu, la sauvegarde change : ce n'est pas une modification extérieure
+        if now - ProfileManager.last_check >= ProfileManager.CHECK_INTERVAL and ProfileManager.writer.idle():
+            ProfileManager.last_check = now
+            stamp = ProfileManager.loaded_store.stamp()
+            if ProfileManager.stamp_stale:
+                ProfileManager.stamp_stale = False
+                ProfileManager.file_stamp = stamp
+            elif stamp != ProfileManager.file_stamp:
+                if ProfileManager.dirty:
+                    # Les changements du jeu seront écrits par-dessus au prochain flush
+                    Log.warning("sauvegarde", "Sauvegarde modifiée hors du jeu : les changements en cours sont conservés")
+                    ProfileManager.file_stamp = stamp
+                else:
+                    return ProfileManager.adopt(ProfileManager.read_saved())
+        return ProfileManager.profile
+    
+    @staticmethod
+    def switch_profile(trainer_name):
+        """Change de dresseur (stockage multi-profils) ; retourne son profil ou None"""
+        store = ProfileManager.store()
+        current = ProfileManager.profile
+        if ProfileManager.loaded and ProfileManager.loaded_store is store and current \
+                and current["trainer_name"] == trainer_name:
+            # Dresseur déjà actif : le cache est plus récent que la base
+            return current
+        # La base doit contenir les changements du dresseur quitté avant d'être relue
+        ProfileManager.sync()
+        profile = store.switch(trainer_name)
+        if profile is None:
             return None
+        task = store.prepare_switch(trainer_name)
+        if task:
+            ProfileManager.writer.submit_task(*task)
+        return ProfileManager.adopt(profile)
+    
+    @staticmethod
+    def profile_count():
+        return ProfileManager.store().count()
+    
+    @staticmethod
+    def profile_exists(trainer_name):
+        """Un dresseur porte-t-il déjà ce nom ? (profil en mémoire compris)"""
+        ProfileManager.sync()
+        return ProfileManager.store().exists(trainer_name)
+    
+    @staticmethod
+    def leaderboard(by="badges", limit=10, after=None):
+        """Page du classement [(nom, badges, score, id)] ; `after` = dernière ligne de la page précédente"""
+        # Les badges et le score du dresseur actif doivent être sur le disque avant la requête
+        ProfileManager.sync()
+        return ProfileManager.store().leaderboard(by, limit, after)
+    
+    @staticmethod
+    def flush():
+        """Programme l'écriture du profil s'il a changé (sans attendre le disque)"""
+        if not ProfileManager.dirty:
+            return True
+        try:
+            # Copié ici : le thread d'écriture ne voit jamais un profil en cours de modification
+            key, task = ProfileManager.loaded_store.prepare_write(ProfileManager.profile)
         except Exception as e:
-            print(f"Erreur lors du chargement: {e}")
-            return None
+            Log.error("sauvegarde", "Erreur lors de la sauvegarde: {}", e)
+            return False
+        ProfileManager.dirty = False
+        ProfileManager.writer.submit_task(key, ProfileManager._timed(task), ProfileManager._written)
+        return True
+    
+    @staticmethod
+    def _timed(task):
+        def timed_task():
+            with Metrics.timer("profile.write_ms"):
+                task()
+            Metrics.count("profile.disk_writes")
+        return timed_task
+    
+    @staticmethod
+    def _written(ok):
+        """Fin d'écriture (thread d'écriture) : la version écrite deviendra la référence"""
+        if ok:
+            ProfileManager.stamp_stale = True
+            return
+        Metrics.count("profile.write_errors")
+        if not ProfileManager.dirty:
+            # Nouvel essai au prochain flush
+            ProfileManager.dirty = True
+            ProfileManager.dirty_since = time.monotonic()
+    
+    @staticmethod
+    def flush_if_due():
+        """Flush regroupé, appelé à chaque frame"""
+        if not ProfileManager.dirty:
+            return
+        now = time.monotonic()
+        if (now - ProfileManager.last_save >= ProfileManager.DEBOUNCE
+                or now - ProfileManager.dirty_since >= ProfileManager.FLUSH_INTERVAL):
+            ProfileManager.flush()
+    
+    @staticmethod
+    def sync(timeout=None):
+        """flush() puis attend que la sauvegarde soit sur le disque (sortie du jeu)"""
+        ProfileManager.flush()
+        return ProfileManager.writer.wait(timeout)
+    
+    @staticmethod
+    def invalidate():
+        """Oublie le cache : le prochain load_profile() relit le fichier"""
+        ProfileManager.sync()
+        ProfileManager.loaded = False
             
     @staticmethod
     def create_new_profile(trainer_name):
+        """Nouveau profil vide ; False (sauvegarde intacte) si le dresseur existe déjà"""
+        if ProfileManager.profile_exists(trainer_name):
+            return False
         data = {
             "trainer_name": trainer_name,
             "pokedex": {},
@@ -70,4 +264,9 @@ class ProfileManager:
         profile = ProfileManager.load_profile()
         if profile:
             return all(profile["defeated_trainers"][t] for t in ["Olga", "Aldo", "Agatha", "Peter"])
-        return False 
\ No newline at end of file
+        return False
+
+
+# Dernière écriture à la fermeture du jeu, y compris après une exception
+atexit.register(ProfileManager.sync)
+Metrics.sample("profile.writes_merged", lambda: ProfileManager.writer.merged)
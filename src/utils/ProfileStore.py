@@ -0,0 +1,438 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from utils.SaveWriter import SaveWriter
+from utils.Log import Log
+
+
+class JsonProfileStore:
+    """Un seul profil dans un fichier JSON (format historique de save_data.json)"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def stamp(self):
+        """Marqueur de version : change quand le fichier est modifié"""
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def prepare_write(self, profile):
+        """(clé, tâche) pour le SaveWriter ; le profil est sérialisé ici, sur le thread principal"""
+        text = json.dumps(profile)
+        return self.path, lambda: SaveWriter.write_atomic(self.path, text)
+
+    def count(self):
+        return 1 if os.path.exists(self.path) else 0
+
+    def exists(self, trainer_name):
+        return self.switch(trainer_name) is not None
+
+    def leaderboard(self, by="badges", limit=10, after=None):
+        profile = self.read() if after is None else None
+        if not profile:
+            return []
+        return [(profile["trainer_name"], profile.get("badges", 0), profile.get("score", 0), 1)]
+
+    def switch(self, trainer_name):
+        profile = self.read()
+        return profile if profile and profile["trainer_name"] == trainer_name else None
+
+    def prepare_switch(self, trainer_name):
+        return None
+
+
+class JournalProfileStore(JsonProfileStore):
+    """Instantané JSON (`path`, même format que save_data.json) + journal des changements
+
+    Chaque sauvegarde ajoute au journal (`journal_path`, une ligne JSON par
+    changement) la différence avec l'état précédent : un badge gagné coûte une
+    ligne de quelques dizaines d'octets au lieu de réécrire tout le document.
+    Au chargement, le journal est rejoué sur l'instantané ; passé COMPACT_BYTES,
+    le profil complet est réécrit dans l'instantané et le journal vidé, ce qui
+    borne le temps de chargement. La première ligne du journal porte l'empreinte
+    (CRC32) de son instantané : après un arrêt entre l'écriture de l'instantané
+    et la remise à zéro du journal, l'ancien journal est simplement ignoré.
+
+    Enregistrements : ["base", crc], ["set", chemin, valeur], ["del", chemin],
+    ["perm", chemin, ordre] (liste réordonnée) et ["reset", profil].
+    """
+    COMPACT_BYTES = 64 * 1024
+
+    def __init__(self, path, journal_path):
+        super().__init__(path)
+        self.journal_path = journal_path
+        self.lock = threading.Lock()     # Tampon et état de référence (thread principal / écriture)
+        self.io_lock = threading.Lock()  # Fichiers (lecture / vidage du tampon)
+        self.last = None                 # Dernier état confié au journal
+        self.lines = []                  # Lignes pas encore écrites
+        self.snapshot = None             # Instantané en attente (compaction)
+        self.journal_bytes = 0
+        self.torn = False                # Dernière ligne du journal incomplète (arrêt brutal)
+
+    def stamp(self):
+        stamps = []
+        for path in (self.path, self.journal_path):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def read(self):
+        """Instantané + journal + écritures encore en attente"""
+        with self.io_lock:
+            snapshot = JournalProfileStore.read_bytes(self.path)
+            data = JournalProfileStore.read_bytes(self.journal_path)
+            with self.lock:
+                if self.snapshot is not None:
+                    snapshot, data = self.snapshot.encode(), b""
+                profile = json.loads(snapshot) if snapshot else None
+                lines = data.splitlines()
+                if lines and not JournalProfileStore.matches(lines[0], snapshot):
+                    # Journal d'un autre instantané (arrêt pendant une compaction, sauvegarde
+                    # réécrite par le format "json") : l'instantané fait foi
+                    Log.warning("sauvegarde", "Journal {} ignoré : il ne correspond pas à {}", self.journal_path, self.path)
+                    lines = []
+                    self.journal_bytes = JournalProfileStore.COMPACT_BYTES
+                else:
+                    self.journal_bytes = len(data)
+                self.torn = bool(data) and not data.endswith(b"\n")
+                self.journal_bytes += sum(len(line) for line in self.lines)
+                for line in lines[1:] + [line.encode() for line in self.lines]:
+                    try:
+                        profile = JournalProfileStore.apply(profile, json.loads(line))
+                    except (ValueError, LookupError, TypeError):
+                        # Ligne coupée par un arrêt brutal : ce changement n'avait pas été confirmé
+                        continue
+                self.last = json.loads(json.dumps(profile)) if profile is not None else None
+        return profile
+
+    def prepare_write(self, profile):
+        """Calcule les changements sur le thread principal ; la tâche les ajoute au journal"""
+        with self.lock:
+            if self.journal_bytes >= JournalProfileStore.COMPACT_BYTES:
+                # Compaction : le profil complet remplace instantané et journal
+                self.snapshot = json.dumps(profile)
+                self.lines = []
+                self.journal_bytes = 0
+                self.last = json.loads(self.snapshot)
+            else:
+                records = []
+                if self.last is None or self.last.get("trainer_name") != profile.get("trainer_name"):
+                    records.append(["reset", profile])
+                else:
+                    JournalProfileStore.diff(self.last, profile, [], records)
+                for record in records:
+                    line = json.dumps(record, separators=(",", ":")) + "\n"
+                    self.lines.append(line)
+                    self.journal_bytes += len(line)
+                    # Copie indépendante du profil du jeu, qui continue d'être modifié
+                    self.last = JournalProfileStore.apply(self.last, json.loads(line))
+        return self.journal_path, self._drain
+
+    def _drain(self):
+        """Thread d'écriture : instantané éventuel puis ajout des lignes en attente"""
+        with self.io_lock:
+            with self.lock:
+                snapshot, lines = self.snapshot, self.lines
+                self.snapshot, self.lines = None, []
+            if snapshot is not None:
+                SaveWriter.write_atomic(self.path, snapshot)
+                SaveWriter.write_atomic(self.journal_path, JournalProfileStore.header(snapshot.encode()))
+                self.torn = False
+            if lines:
+                if not os.path.exists(self.journal_path):
+                    lines.insert(0, JournalProfileStore.header(JournalProfileStore.read_bytes(self.path)))
+                elif self.torn:
+                    lines.insert(0, "\n")
+                self.torn = False
+                with open(self.journal_path, 'a') as f:
+                    f.write("".join(lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    @staticmethod
+    def read_bytes(path):
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return b""
+
+    @staticmethod
+    def header(snapshot):
+        """Première ligne du journal : empreinte de l'instantané auquel il s'applique"""
+        return json.dumps(["base", zlib.crc32(snapshot)]) + "\n"
+
+    @staticmethod
+    def matches(first_line, snapshot):
+        try:
+            return json.loads(first_line) == ["base", zlib.crc32(snapshot)]
+        except ValueError:
+            return False
+
+    @staticmethod
+    def diff(old, new, path, records):
+        """Ajoute à `records` les changements qui transforment `old` en `new`"""
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key, value in new.items():
+                if key in old:
+                    JournalProfileStore.diff(old[key], value, path + [key], records)
+                else:
+                    records.append(["set", path + [key], value])
+            for key in old:
+                if key not in new:
+                    records.append(["del", path + [key]])
+        elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+            if old == new:
+                return
+            order = JournalProfileStore.permutation(old, new)
+            if order is not None:
+                # Équipe réordonnée : une ligne au lieu de réécrire chaque Pokémon
+                records.append(["perm", path, order])
+                return
+            for index, (before, after) in enumerate(zip(old, new)):
+                JournalProfileStore.diff(before, after, path + [index], records)
+        elif old != new or type(old) is not type(new):
+            records.append(["set", path, new])
+
+    @staticmethod
+    def permutation(old, new):
+        """Indices tels que new[i] == old[ordre[i]], ou None si `new` n'est pas un réordonnancement"""
+        remaining = list(range(len(old)))
+        order = []
+        for item in new:
+            for position, index in enumerate(remaining):
+                if old[index] == item:
+                    order.append(remaining.pop(position))
+                    break
+            else:
+                return None
+        return order
+
+    @staticmethod
+    def apply(profile, record):
+        """Applique un enregistrement du journal ; retourne le profil (remplacé par "reset")"""
+        op, path = record[0], record[1]
+        if op == "reset":
+            return path
+        if profile is None:
+            return None
+        if not path:
+            return record[2] if op == "set" else profile
+        parent = profile
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        if op == "set":
+            parent[key] = record[2]
+        elif op == "del":
+            parent.pop(key, None)
+        elif op == "perm":
+            items = parent[key]
+            parent[key] = [items[index] for index in record[2]]
+        return profile
+
+
+class SqliteProfileStore:
+    """Plusieurs profils dans une base SQLite (bornes partagées, classements)
+
+    Tables `profiles`, `team_members` et `defeated_trainers` ; les classements
+    utilisent des index (badges, score) et une pagination par curseur, ce qui
+    reste rapide avec 100 000 profils. Mode WAL : le thread d'écriture et les
+    lectures du thread principal ne se bloquent pas. Chaque thread a sa propre
+    connexion, les requêtes paramétrées sont gardées préparées par sqlite3.
+    Au premier lancement, un save_data.json existant est importé.
+    """
+    SCHEMA_VERSION = 1
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS profiles (
+            id INTEGER PRIMARY KEY,
+            trainer_name TEXT NOT NULL UNIQUE,
+            badges INTEGER NOT NULL DEFAULT 0,
+            score INTEGER NOT NULL DEFAULT 0,
+            pokedex TEXT NOT NULL DEFAULT '{}',
+            extra TEXT NOT NULL DEFAULT '{}',
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS team_members (
+            profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+            slot INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (profile_id, slot)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS defeated_trainers (
+            profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+            trainer TEXT NOT NULL,
+            defeated INTEGER NOT NULL,
+            PRIMARY KEY (profile_id, trainer)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS profiles_by_badges ON profiles (badges DESC, score DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS profiles_by_score ON profiles (score DESC, badges DESC, id DESC);
+    """
+    # Colonnes du profil ; le reste du dictionnaire est gardé tel quel dans `extra`
+    COLUMNS = ("trainer_name", "badges", "score", "pokedex", "current_team", "defeated_trainers")
+    LEADERBOARDS = {
+        "badges": ("badges", "score"),
+        "score": ("score", "badges")
+    }
+
+    SELECT_CURRENT = "SELECT value FROM meta WHERE key = 'current_trainer'"
+    SET_CURRENT = "INSERT OR REPLACE INTO meta (key, value) VALUES ('current_trainer', ?)"
+    SELECT_PROFILE = "SELECT id, trainer_name, badges, score, pokedex, extra FROM profiles WHERE trainer_name = ?"
+    SELECT_TEAM = "SELECT data FROM team_members WHERE profile_id = ? ORDER BY slot"
+    SELECT_DEFEATED = "SELECT trainer, defeated FROM defeated_trainers WHERE profile_id = ?"
+    UPSERT_PROFILE = """
+        INSERT INTO profiles (trainer_name, badges, score, pokedex, extra, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (trainer_name) DO UPDATE SET
+            badges = excluded.badges, score = excluded.score, pokedex = excluded.pokedex,
+            extra = excluded.extra, updated_at = excluded.updated_at
+    """
+    SELECT_ID = "SELECT id FROM profiles WHERE trainer_name = ?"
+    DELETE_TEAM = "DELETE FROM team_members WHERE profile_id = ?"
+    INSERT_TEAM = "INSERT INTO team_members (profile_id, slot, name, data) VALUES (?, ?, ?, ?)"
+    UPSERT_DEFEATED = "INSERT OR REPLACE INTO defeated_trainers (profile_id, trainer, defeated) VALUES (?, ?, ?)"
+    COUNT = "SELECT COUNT(*) FROM profiles"
+
+    def __init__(self, path, json_path=None):
+        self.path = path
+        self.local = threading.local()
+        db = self.connection()
+        with db:
+            db.executescript(SqliteProfileStore.SCHEMA)
+            db.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                       (str(SqliteProfileStore.SCHEMA_VERSION),))
+        if json_path and self.count() == 0:
+            self.migrate_json(json_path)
+
+    def connection(self):
+        """Connexion propre au thread appelant (sqlite3 refuse le partage entre threads)"""
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0, cached_statements=64)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA foreign_keys=ON")
+            self.local.db = db
+        return db
+
+    def migrate_json(self, json_path):
+        """Importe l'ancien save_data.json (le fichier est laissé en place)"""
+        profile = JsonProfileStore(json_path).read() if os.path.exists(json_path) else None
+        if not profile:
+            return False
+        db = self.connection()
+        with db:
+            self._write(db, profile)
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)", (json_path,))
+        Log.info("sauvegarde", "Profil {} importé depuis {}", profile['trainer_name'], json_path)
+        return True
+
+    def stamp(self):
+        """data_version change dès qu'une autre connexion (autre processus, thread d'écriture) valide"""
+        return self.connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def read(self):
+        row = self.connection().execute(SqliteProfileStore.SELECT_CURRENT).fetchone()
+        return self.switch(row[0]) if row else None
+
+    def switch(self, trainer_name):
+        """Profil complet de `trainer_name` (None s'il n'existe pas)"""
+        db = self.connection()
+        row = db.execute(SqliteProfileStore.SELECT_PROFILE, (trainer_name,)).fetchone()
+        if row is None:
+            return None
+        profile_id, name, badges, score, pokedex, extra = row
+        profile = json.loads(extra)
+        profile.update({
+            "trainer_name": name,
+            "pokedex": json.loads(pokedex),
+            "score": score,
+            "defeated_trainers": {trainer: bool(defeated) for trainer, defeated
+                                  in db.execute(SqliteProfileStore.SELECT_DEFEATED, (profile_id,))},
+            "current_team": [json.loads(data) for data, in db.execute(SqliteProfileStore.SELECT_TEAM, (profile_id,))],
+            "badges": badges
+        })
+        return profile
+
+    def prepare_write(self, profile):
+        """(clé, tâche) pour le SaveWriter ; le profil est copié (JSON) sur le thread principal"""
+        snapshot = json.loads(json.dumps(profile))
+        key = (self.path, snapshot["trainer_name"])
+
+        def task():
+            db = self.connection()
+            with db:
+                self._write(db, snapshot)
+        return key, task
+
+    def prepare_switch(self, trainer_name):
+        """Tâche qui enregistre le profil courant (pour le prochain lancement)"""
+        def task():
+            db = self.connection()
+            with db:
+                db.execute(SqliteProfileStore.SET_CURRENT, (trainer_name,))
+        return (self.path, "current"), task
+
+    def _write(self, db, profile):
+        """Une transaction : profil, équipe et dresseurs battus ; le profil écrit devient le profil courant"""
+        name = profile["trainer_name"]
+        extra = {key: value for key, value in profile.items() if key not in SqliteProfileStore.COLUMNS}
+        db.execute(SqliteProfileStore.UPSERT_PROFILE, (
+            name, profile.get("badges", 0), profile.get("score", 0),
+            json.dumps(profile.get("pokedex", {})), json.dumps(extra), time.time()
+        ))
+        profile_id = db.execute(SqliteProfileStore.SELECT_ID, (name,)).fetchone()[0]
+        db.execute(SqliteProfileStore.DELETE_TEAM, (profile_id,))
+        db.executemany(SqliteProfileStore.INSERT_TEAM, [
+            (profile_id, slot, pokemon.get("name", ""), json.dumps(pokemon))
+            for slot, pokemon in enumerate(profile.get("current_team", []))
+        ])
+        db.executemany(SqliteProfileStore.UPSERT_DEFEATED, [
+            (profile_id, trainer, int(bool(defeated)))
+            for trainer, defeated in profile.get("defeated_trainers", {}).items()
+        ])
+        db.execute(SqliteProfileStore.SET_CURRENT, (name,))
+
+    def count(self):
+        return self.connection().execute(SqliteProfileStore.COUNT).fetchone()[0]
+
+    def exists(self, trainer_name):
+        """Un profil porte-t-il déjà ce nom ? (lecture d'index, sans charger le profil)"""
+        return self.connection().execute(SqliteProfileStore.SELECT_ID, (trainer_name,)).fetchone() is not None
+
+    def leaderboard(self, by="badges", limit=10, after=None):
+        """Classement : [(nom, badges, score, id)], page suivante via `after` = dernière ligne reçue
+
+        Pagination par curseur (pas d'OFFSET) : chaque page est une lecture
+        d'index de `limit` lignes, quelle que soit sa position dans le classement.
+        """
+        first, second = SqliteProfileStore.LEADERBOARDS[by]
+        query = "SELECT trainer_name, badges, score, id FROM profiles"
+        params = ()
+        if after is not None:
+            row = {"badges": after[1], "score": after[2]}
+            query += f" WHERE ({first}, {second}, id) < (?, ?, ?)"
+            params = (row[first], row[second], after[3])
+        query += f" ORDER BY {first} DESC, {second} DESC, id DESC LIMIT ?"
+        return self.connection().execute(query, params + (limit,)).fetchall()
@@ -0,0 +1,300 @@
+import weakref
+from collections import OrderedDict
+import pygame
+
+
+class BoundedCache(OrderedDict):
+    """Dictionnaire LRU de taille bornée (textes rendus, primitives pré-dessinées)"""
+
+    def __init__(self, max_entries):
+        super().__init__()
+        self.max_entries = max_entries
+
+    def fetch(self, key, build):
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self[key] = value
+            if len(self) > self.max_entries:
+                self.popitem(last=False)
+        else:
+            self.move_to_end(key)
+        return value
+
+
+class Renderer:
+    """Interface de dessin commune aux deux backends
+
+    Les scènes reçoivent un renderer à la place de la surface d'affichage. Il
+    expose le sous-ensemble de l'API Surface qu'elles utilisent (blit, fill,
+    get_size...) plus des primitives (draw_rect, draw_line...) : le même code
+    dessine en logiciel ou via des textures SDL2.
+    """
+    backend = None
+    TEXT_CACHE_SIZE = 512
+    PRIMITIVE_CACHE_SIZE = 256
+
+    def __init__(self, size):
+        self.size = tuple(size)
+        self.text_cache = BoundedCache(Renderer.TEXT_CACHE_SIZE)
+        self.primitive_cache = BoundedCache(Renderer.PRIMITIVE_CACHE_SIZE)
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def text(self, font, string, color, antialias=True):
+        """Rendu de texte mis en cache : le même libellé n'est rastérisé qu'une fois"""
+        key = (font, string, tuple(color), antialias)
+        return self.text_cache.fetch(key, lambda: font.render(string, antialias, color))
+
+    def primitive(self, kind, color, size, width=0, border_radius=0):
+        """Forme pré-dessinée sur une surface transparente (rectangles arrondis, cercles)"""
+        key = (kind, tuple(color), size, width, border_radius)
+
+        def build():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if kind == "rect":
+                pygame.draw.rect(surface, color, surface.get_rect(), width, border_radius=border_radius)
+            else:
+                radius = size[0] // 2
+                pygame.draw.circle(surface, color, (radius, radius), radius, width)
+            return surface
+        return self.primitive_cache.fetch(key, build)
+
+    def blits(self, sequence, doreturn=True):
+        rects = [self.blit(*item) for item in sequence]
+        return rects if doreturn else None
+
+    def fblits(self, sequence, special_flags=0):
+        for source, dest in sequence:
+            self.blit(source, dest, None, special_flags)
+
+    def stats(self):
+        return {"backend": self.backend, "text_entries": len(self.text_cache),
+                "primitive_entries": len(self.primitive_cache)}
+
+    def cache_bytes(self):
+        """Octets des surfaces gardées dans les caches de textes et de primitives"""
+        return sum(surface.get_pitch() * surface.get_height()
+                   for cache in (self.text_cache, self.primitive_cache) for surface in cache.values())
+
+
+class SoftwareRenderer(Renderer):
+    """Backend logiciel : blits sur la surface d'affichage pygame (comportement d'origine)"""
+    backend = "software"
+
+    def __init__(self, surface):
+        super().__init__(surface.get_size())
+        self.surface = surface
+
+    def set_surface(self, surface):
+        """Nouvelle surface d'affichage après un set_mode (plein écran, redimensionnement)"""
+        self.surface = surface
+        self.size = surface.get_size()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, sequence, doreturn=True):
+        return self.surface.blits(sequence, doreturn)
+
+    def fblits(self, sequence, special_flags=0):
+        if hasattr(self.surface, "fblits"):
+            self.surface.fblits(sequence, special_flags)
+        else:
+            self.surface.blits([(source, dest, None, special_flags) for source, dest in sequence], doreturn=False)
+
+    def blit_scaled(self, source, rect):
+        rect = pygame.Rect(rect)
+        if source.get_size() != rect.size:
+            source = pygame.transform.scale(source, rect.size)
+        return self.surface.blit(source, rect)
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, rect)
+
+    def fill_alpha(self, color, rect=None):
+        """Remplissage semi-transparent (couleur RGBA)"""
+        rect = pygame.Rect(rect) if rect else self.get_rect()
+        key = ("fill", tuple(color), rect.size)
+
+        def build():
+            surface = pygame.Surface(rect.size)
+            surface.fill(color[:3])
+            surface.set_alpha(color[3])
+            return surface
+        return self.surface.blit(self.primitive_cache.fetch(key, build), rect)
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        return pygame.draw.rect(self.surface, color, rect, width, border_radius=border_radius)
+
+    def draw_line(self, color, start, end, width=1):
+        return pygame.draw.line(self.surface, color, start, end, width)
+
+    def draw_circle(self, color, center, radius, width=0):
+        return pygame.draw.circle(self.surface, color, center, radius, width)
+
+    def present(self):
+        pygame.display.flip()
+
+    def capture(self):
+        """Surface de la dernière frame présentée (pour l'enregistrement)"""
+        return self.surface
+
+
+class TextureRenderer(Renderer):
+    """Backend SDL2 (pygame._sdl2.video) : chaque surface est envoyée une fois en texture
+
+    Les sprites, fonds et textes mis en cache restent en mémoire vidéo ; le
+    compositing plein écran est fait par le renderer SDL (GPU si disponible,
+    sinon le driver "software" de SDL, utilisable sans carte graphique).
+    Une surface modifiée après son premier affichage doit être passée à
+    `invalidate()` pour être renvoyée.
+    """
+    backend = "texture"
+
+    # Modes de mélange SDL équivalents aux special_flags de Surface.blit
+    BLEND_NONE = 0
+    BLEND_ALPHA = 1
+    BLEND_ADD = 2
+    BLEND_MOD = 4
+    SPECIAL_FLAGS = {
+        pygame.BLEND_ADD: BLEND_ADD,
+        pygame.BLEND_RGB_ADD: BLEND_ADD,
+        pygame.BLEND_MULT: BLEND_MOD,
+        pygame.BLEND_RGB_MULT: BLEND_MOD
+    }
+
+    def __init__(self, size, title="", driver=None, vsync=False):
+        super().__init__(size)
+        from pygame._sdl2.video import Window, Renderer as SDLRenderer, Texture, get_drivers
+
+        self.Texture = Texture
+        self.window = Window(title, size, resizable=True)
+        drivers = [info.name for info in get_drivers()]
+        index = drivers.index(driver) if driver in drivers else -1
+        try:
+            self.renderer = SDLRenderer(self.window, index=index, vsync=vsync)
+        except Exception:  # pygame._sdl2 lève sa propre classe d'erreur
+            # Pas d'accélération disponible : renderer logiciel de SDL
+            index = drivers.index("software") if "software" in drivers else -1
+            self.renderer = SDLRenderer(self.window, index=index, accelerated=0)
+        self.driver = drivers[index] if index >= 0 else "default"
+        # La taille logique est fixe, SDL étire l'image à la taille de la fenêtre
+        self.renderer.logical_size = self.size
+        self.textures = weakref.WeakKeyDictionary()  # surface -> (texture, mode par défaut)
+
+    def texture(self, surface):
+        entry = self.textures.get(surface)
+        if entry is None:
+            texture = self.Texture.from_surface(self.renderer, surface)
+            entry = (texture, texture.blend_mode)
+            self.textures[surface] = entry
+        return entry
+
+    def invalidate(self, surface):
+        """Force le renvoi d'une surface modifiée depuis son dernier affichage"""
+        self.textures.pop(surface, None)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        texture, default_mode = self.texture(source)
+        mode = self.SPECIAL_FLAGS.get(special_flags, default_mode)
+        if texture.blend_mode != mode:
+            texture.blend_mode = mode
+        alpha = source.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+
+        width, height = area[2:] if area else source.get_size()
+        x, y = dest[:2]
+        dstrect = pygame.Rect(x, y, width, height)
+        texture.draw(srcrect=area, dstrect=dstrect)
+        return dstrect
+
+    def blit_scaled(self, source, rect):
+        """Blit étiré : la mise à l'échelle est faite par le renderer, sans copie CPU"""
+        texture, default_mode = self.texture(source)
+        if texture.blend_mode != default_mode:
+            texture.blend_mode = default_mode
+        rect = pygame.Rect(rect)
+        texture.draw(dstrect=rect)
+        return rect
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = tuple(color[:3]) + (255,)
+        if rect is None:
+            self.renderer.clear()
+            return self.get_rect()
+        rect = pygame.Rect(rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def fill_alpha(self, color, rect=None):
+        rect = pygame.Rect(rect) if rect else self.get_rect()
+        self.renderer.draw_blend_mode = self.BLEND_ALPHA
+        self.renderer.draw_color = tuple(color)
+        self.renderer.fill_rect(rect)
+        self.renderer.draw_blend_mode = self.BLEND_NONE
+        return rect
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return rect
+        if border_radius > 0:
+            # Les coins arrondis n'existent pas côté SDL : forme pré-dessinée puis envoyée en texture
+            return self.blit(self.primitive("rect", color, rect.size, width, border_radius), rect.topleft)
+        self.renderer.draw_color = tuple(color[:3]) + (255,)
+        if width <= 0:
+            self.renderer.fill_rect(rect)
+        else:
+            for i in range(min(width, (min(rect.size) + 1) // 2)):
+                self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+        return rect
+
+    def draw_line(self, color, start, end, width=1):
+        self.renderer.draw_color = tuple(color[:3]) + (255,)
+        (x1, y1), (x2, y2) = start, end
+        if width <= 1:
+            self.renderer.draw_line(start, end)
+        elif x1 == x2 or y1 == y2:
+            # Ligne horizontale ou verticale épaisse : un simple rectangle
+            offset = width // 2
+            self.renderer.fill_rect(pygame.Rect(min(x1, x2) - (offset if x1 == x2 else 0),
+                                                min(y1, y2) - (offset if y1 == y2 else 0),
+                                                abs(x2 - x1) or width, abs(y2 - y1) or width))
+        else:
+            # Ligne oblique épaisse : traits parallèles décalés (comme pygame.draw.line)
+            steep = abs(y2 - y1) > abs(x2 - x1)
+            for i in range(width):
+                offset = i - width // 2
+                dx, dy = (offset, 0) if steep else (0, offset)
+                self.renderer.draw_line((x1 + dx, y1 + dy), (x2 + dx, y2 + dy))
+        return pygame.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + width, abs(y2 - y1) + width)
+
+    def draw_circle(self, color, center, radius, width=0):
+        radius = int(radius)
+        size = (radius * 2, radius * 2)
+        return self.blit(self.primitive("circle", color, size, width), (center[0] - radius, center[1] - radius))
+
+    def present(self):
+        self.renderer.present()
+
+    def capture(self):
+        return self.renderer.to_surface()
+
+    def stats(self):
+        stats = super().stats()
+        stats.update(driver=self.driver, textures=len(self.textures))
+        return stats
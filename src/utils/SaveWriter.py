@@ -0,0 +1,100 @@
+import os
+import tempfile
+import threading
+
+from utils.Log import Log
+
+
+class SaveWriter:
+    """Écrit des fichiers sur un thread dédié, sans jamais bloquer le thread de rendu
+
+    Une seule écriture en attente par clé (chemin) : une nouvelle demande remplace
+    celle qui n'a pas encore été écrite (écritures rapprochées fusionnées).
+    `submit()` passe par un fichier temporaire, fsync puis os.replace : un arrêt
+    brutal laisse l'ancienne version ou la nouvelle, jamais un mélange.
+    `submit_task()` exécute une écriture quelconque (transaction SQLite...).
+    """
+
+    def __init__(self, name="SaveWriter"):
+        self.name = name
+        self.condition = threading.Condition()
+        self.pending = {}    # clé -> (tâche, callback(ok))
+        self.busy = False
+        self.thread = None
+        self.writes = 0
+        self.merged = 0
+        self.errors = 0
+
+    def submit(self, path, text, done=None):
+        """Programme l'écriture de `text` dans `path` ; `done(ok)` est appelé depuis le thread d'écriture"""
+        self.submit_task(path, lambda: SaveWriter.write_atomic(path, text), done)
+
+    def submit_task(self, key, task, done=None):
+        """Programme `task()` sur le thread d'écriture (remplace la tâche en attente pour `key`)"""
+        with self.condition:
+            if key in self.pending:
+                self.merged += 1
+            self.pending[key] = (task, done)
+            if self.thread is None:
+                # Thread démon : la sortie du jeu attend explicitement la fin des écritures (wait)
+                self.thread = threading.Thread(target=self._write_loop, name=self.name, daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def idle(self):
+        with self.condition:
+            return not self.pending and not self.busy
+
+    def wait(self, timeout=None):
+        """Attend que toutes les écritures demandées soient sur le disque"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+    def _write_loop(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+                key = next(iter(self.pending))  # Ordre des demandes
+                task, done = self.pending.pop(key)
+                self.busy = True
+            ok = False
+            try:
+                task()
+                ok = True
+            except Exception as e:  # OSError, erreur SQLite...
+                Log.error("sauvegarde", "Erreur lors de la sauvegarde ({}): {}", key, e)
+            finally:
+                if done:
+                    done(ok)
+                with self.condition:
+                    self.busy = False
+                    self.writes += ok
+                    self.errors += not ok
+                    self.condition.notify_all()
+
+    @staticmethod
+    def write_atomic(path, text):
+        """Fichier temporaire dans le même dossier, fsync, puis remplacement atomique"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        try:
+            # Rendre le renommage lui-même durable (sans effet sous Windows)
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
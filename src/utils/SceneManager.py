@@ -0,0 +1,290 @@
+from collections import OrderedDict
+import pygame
+
+from utils.AnimationClock import AnimationClock
+from utils.GameClock import GameClock
+from utils.InputRecorder import InputRecorder
+from utils.AssetManager import AssetManager
+from utils.Display import Display
+from utils.InputState import InputState
+from utils.Log import Log
+from utils.LatencyTracer import LatencyTracer
+from utils.FrameProfiler import FrameProfiler
+from utils.Metrics import Metrics
+from utils.ProfileManager import ProfileManager
+from utils.StartupTimeline import StartupTimeline
+from utils.StartupProfiler import StartupProfiler
+
+
+class Scene:
+    """Scène de base : le SceneManager appelle ces méthodes, la scène ne boucle jamais elle-même"""
+    interactive = True  # False pour les scènes d'attente (écran de chargement)
+    recorder = None     # FrameRecorder actif : le SceneManager lui passe les frames affichées
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__init__" in cls.__dict__:
+            # Constructeurs mesurés avec --profile-startup (appel direct sinon)
+            cls.__init__ = StartupProfiler.wrap_constructor(cls.__init__, cls.__name__)
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.manager = None
+
+    @property
+    def asset_owner(self):
+        """Nom sous lequel la scène enregistre ses ressources dans l'AssetManager"""
+        return type(self).__name__
+
+    def reset(self):
+        """Remet l'état à zéro quand l'instance en cache est réutilisée (les ressources restent chargées)"""
+
+    def on_release(self):
+        """La scène est évincée du cache : libérer ses ressources lourdes"""
+        AssetManager.release(self.asset_owner)
+
+    def on_enter(self):
+        """La scène entre dans la pile (push ou replace)"""
+
+    def on_exit(self):
+        """La scène quitte la pile (pop, replace ou fin du jeu)"""
+
+    def on_suspend(self):
+        """Une autre scène vient d'être empilée au-dessus"""
+
+    def on_resume(self, result):
+        """La scène du dessus a été retirée ; `result` est la valeur passée à pop()"""
+
+    def on_resize(self):
+        """La taille logique de l'écran a changé"""
+
+    def handle_event(self, event):
+        pass
+
+    def handle_input(self, input_state):
+        """Une fois par frame, après les événements : état des entrées (InputState) de la frame"""
+
+    def update(self, dt):
+        """Avance la scène de `dt` millisecondes"""
+
+    def draw(self):
+        pass
+
+
+class SceneManager:
+    """Pile de scènes pilotée par une seule boucle d'événements
+
+    push() suspend la scène courante, pop(result) la reprend avec un résultat,
+    replace() échange la scène du dessus. Les instances sont réutilisées via
+    `scene(key, factory)` plutôt que reconstruites à chaque transition ; ce
+    cache est borné (LRU) et une scène évincée reçoit on_release().
+    """
+    FPS = 60
+    CACHE_SIZE = 6
+    MESSAGE_DURATION = 2000
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.stack = []
+        self.scenes = OrderedDict()    # Instances réutilisables, par clé (ordre LRU)
+        self.running = False
+        self.clock = pygame.time.Clock()
+        self.message = None
+        self.message_time = 0
+        self.message_font = None
+        self.input = InputState()
+        Metrics.sample("scenes.stack", lambda: [type(scene).__name__ for scene in self.stack])
+        Metrics.sample("scenes.cached", lambda: len(self.scenes))
+        Metrics.sample("memory.render_cache_bytes", lambda: self.screen.cache_bytes())
+        self.memory_alarm = None       # Budgets dépassés déjà signalés
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def scene(self, key, factory):
+        """Retourne l'instance associée à `key` (état remis à zéro), créée par `factory()` si absente"""
+        instance = self.scenes.get(key)
+        if instance is None:
+            instance = factory()
+            self.scenes[key] = instance
+            self.evict()
+        else:
+            self.scenes.move_to_end(key)
+            if instance not in self.stack:
+                instance.reset()
+        return instance
+
+    def evict(self):
+        """Évince les scènes les moins récemment utilisées au-delà de CACHE_SIZE (sauf celles de la pile)"""
+        for key in list(self.scenes):
+            if len(self.scenes) <= SceneManager.CACHE_SIZE:
+                break
+            if self.scenes[key] not in self.stack:
+                self.forget(key)
+
+    def forget(self, key):
+        """Retire une instance du cache et libère ses ressources"""
+        instance = self.scenes.pop(key, None)
+        if instance is not None:
+            instance.on_release()
+
+    def enforce_memory_budget(self):
+        """Budgets de l'AssetManager dépassés : libère les scènes en cache hors de la pile (LRU d'abord)"""
+        for key in list(self.scenes):
+            if not AssetManager.over_budget:
+                break
+            if self.scenes[key] not in self.stack:
+                Log.info("memoire", "Budget dépassé : scène {} libérée", key)
+                Metrics.count("memory.scene_evictions")
+                self.forget(key)
+        exceeded = AssetManager.exceeded()
+        alarm = tuple(kind for kind, _, _ in exceeded) or None
+        if alarm and alarm != self.memory_alarm:
+            # Ce qui reste est utilisé par la pile de scènes (ou permanent)
+            for kind, used, budget in exceeded:
+                Log.warning("memoire", "Budget {} dépassé : {:.1f} Mo pour {:.1f} Mo", kind,
+                            used / AssetManager.MB, budget / AssetManager.MB)
+        self.memory_alarm = alarm
+
+    def push(self, scene):
+        if self.top:
+            self.top.on_suspend()
+        scene.manager = self
+        self.stack.append(scene)
+        scene.on_enter()
+
+    def pop(self, result=None):
+        scene = self.stack.pop()
+        scene.on_exit()
+        if self.top:
+            self.top.on_resume(result)
+        else:
+            self.running = False
+        return scene
+
+    def replace(self, scene):
+        if self.stack:
+            self.stack.pop().on_exit()
+        self.push(scene)
+
+    def quit(self):
+        """Vide la pile (chaque scène reçoit on_exit) et arrête la boucle"""
+        while self.stack:
+            self.stack.pop().on_exit()
+        self.running = False
+        ProfileManager.flush()
+
+    def show_message(self, text, duration=None):
+        """Message temporaire affiché par-dessus la scène courante"""
+        self.message = text
+        self.message_time = (duration or SceneManager.MESSAGE_DURATION)
+
+    def toggle_fullscreen(self):
+        self.screen = Display.toggle_fullscreen()
+        self.resize()
+
+    def resize(self):
+        for scene in self.stack:
+            scene.on_resize()
+
+    def handle_event(self, event):
+        """Événements globaux ; retourne True si l'événement est consommé"""
+        if event.type == pygame.QUIT:
+            self.quit()
+        elif event.type == pygame.VIDEORESIZE:
+            self.screen = Display.handle_resize(event)
+            self.resize()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self.toggle_fullscreen()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+            LatencyTracer.toggle_overlay()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F8:
+            FrameProfiler.toggle_overlay()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F7:
+            Metrics.toggle_overlay()
+        else:
+            return False
+        return True
+
+    def draw_message(self):
+        if self.message_font is None:
+            self.message_font = pygame.font.Font(None, 48)
+        text = self.screen.text(self.message_font, self.message, (255, 255, 255))
+        rect = text.get_rect(center=(self.screen.get_width()//2, self.screen.get_height() - 80))
+        self.screen.fill_alpha((0, 0, 0, 200), rect.inflate(40, 20))
+        self.screen.blit(text, rect)
+
+    def step(self, dt, events):
+        """Une frame : événements, mise à jour et dessin de la scène du dessus"""
+        if InputRecorder.recording is not None:
+            InputRecorder.capture(self, dt, events)
+        self.frame(dt, events)
+        if FrameProfiler.ENABLED:
+            FrameProfiler.end_frame()
+
+    def frame(self, dt, events):
+        AnimationClock.advance(dt)
+        GameClock.advance(dt)
+        tracing = LatencyTracer.ENABLED
+        if tracing:
+            LatencyTracer.pulled()
+        with FrameProfiler.span("events"):
+            for event in self.input.collect(events):
+                if not self.handle_event(event) and self.top:
+                    # La scène du dessus peut changer pendant la boucle (push/pop)
+                    if tracing:
+                        LatencyTracer.handled(self.top, event)
+                    self.top.handle_event(event)
+                if not self.running:
+                    return
+
+            scene = self.top
+            scene.handle_input(self.input)
+            if self.top is not scene:
+                return
+        with FrameProfiler.span("update"):
+            scene.update(dt)
+        if self.top is not scene:
+            return
+        with FrameProfiler.span("draw"):
+            scene.draw()
+            if self.message:
+                self.message_time -= dt
+                if self.message_time > 0:
+                    self.draw_message()
+                else:
+                    self.message = None
+        if LatencyTracer.OVERLAY or FrameProfiler.OVERLAY or Metrics.OVERLAY:
+            with FrameProfiler.span("overlay"):
+                if LatencyTracer.OVERLAY:
+                    LatencyTracer.draw_overlay(self.screen, scene)
+                if FrameProfiler.OVERLAY:
+                    FrameProfiler.draw_overlay(self.screen)
+                if Metrics.OVERLAY:
+                    Metrics.draw_overlay(self.screen)
+        with FrameProfiler.span("present"):
+            recorder = scene.recorder
+            if recorder and recorder.wants_frame():
+                # Frame complète (message et overlays compris), lue avant present() : le tampon
+                # du backend texture n'est plus lisible après, et sa lecture coûte une copie GPU
+                recorder.capture(self.screen.capture())
+            self.screen.present()
+        Metrics.count("frames.rendered")
+        Metrics.observe("frames.dt_ms", dt)
+        if tracing:
+            LatencyTracer.presented()
+        if StartupTimeline.interactive_ms is None and scene.interactive:
+            StartupTimeline.interactive()
+        if AssetManager.over_budget or self.memory_alarm:
+            self.enforce_memory_budget()
+        ProfileManager.flush_if_due()
+        Metrics.dump_if_due()
+
+    def run(self, scene):
+        self.running = True
+        InputState.install()
+        self.push(scene)
+        while self.running and self.stack:
+            dt = self.clock.tick(SceneManager.FPS)
+            self.step(dt, pygame.event.get())
@@ -1,58 +1,98 @@
 import pygame
 import os
-from PIL import Image
+from utils.AnimatedSprite import AnimatedSprite
+from utils.Display import Display
+from utils.AssetManager import AssetManager
+from utils.Log import Log
+from utils.Metrics import Metrics
 
 class SpriteManager:
-    def __init__(self):
+    def __init__(self, owner=None):
         # Chemins des dossiers de sprites
         self.STATIC_FOLDER = os.path.join("src", "assets", "sprites", "static")
         self.ANIMATED_FOLDER = os.path.join("src", "assets", "sprites", "animated")
         
-        # Cache en mémoire
+        # Cache en mémoire : les sprites sont partagés entre scènes via l'AssetManager,
+        # `owner` indique quelle scène les utilise (libérés avec elle)
+        self.owner = owner
         self.sprite_cache = {}
     
     def get_sprite(self, pokemon_name, animated=False, is_back=False):
         """Point d'entrée unique pour obtenir un sprite"""
-        cache_key = f"{pokemon_name}_{'animated' if animated else 'static'}_{'back' if is_back else 'front'}"
+        cache_key = self.cache_key(pokemon_name, animated, is_back)
         
         # Vérifier le cache en mémoire
         if cache_key in self.sprite_cache:
+            Metrics.count("sprites.cache_hits")
             return self.sprite_cache[cache_key]
         
-        # Obtenir l'ID du Pokémon
-        pokemon_id = self.get_pokemon_id(pokemon_name)
-        
-        # Construire le chemin du fichier
-        if animated:
-            # Utiliser le bon format de nom de fichier pour les GIFs
-            path = os.path.join(self.ANIMATED_FOLDER, f"{pokemon_id}_{'back' if is_back else 'front'}.gif")
-            print(f"Chargement du sprite: {path}")  # Debug
-            sprite = self._load_animated_sprite(path)
-        else:
-            # Pour les sprites statiques
-            path = os.path.join(self.STATIC_FOLDER, f"{pokemon_id}_{'back' if is_back else 'front'}.png")
-            sprite = self._load_static_sprite(path)
-        
+        Metrics.count("sprites.cache_misses")
+        sprite = AssetManager.get("sprite", cache_key,
+                                  lambda: self._load_sprite(pokemon_name, animated, is_back), self.owner)
         if sprite:
             self.sprite_cache[cache_key] = sprite
         
         return sprite
     
+    @staticmethod
+    def cache_key(pokemon_name, animated=False, is_back=False):
+        return f"{pokemon_name}_{'animated' if animated else 'static'}_{'back' if is_back else 'front'}"
+    
+    def sprite_path(self, pokemon_name, animated=False, is_back=False):
+        """Chemin du fichier de sprite (GIF animé ou PNG statique)"""
+        pokemon_id = self.get_pokemon_id(pokemon_name)
+        if animated:
+            return os.path.join(self.ANIMATED_FOLDER, f"{pokemon_id}_{'back' if is_back else 'front'}.gif")
+        return os.path.join(self.STATIC_FOLDER, f"{pokemon_id}_{'back' if is_back else 'front'}.png")
+    
+    def _load_sprite(self, pokemon_name, animated, is_back):
+        """Charge un sprite depuis le disque"""
+        return self._convert_sprite(self._decode_sprite(pokemon_name, animated, is_back))
+    
+    def _decode_sprite(self, pokemon_name, animated, is_back):
+        """Lecture et décodage, sans convert() : utilisable depuis un thread de travail"""
+        path = self.sprite_path(pokemon_name, animated, is_back)
+        if animated:
+            Log.debug("sprites", "Chargement du sprite: {}", path)
+            return self._load_animated_sprite(path)
+        return self._load_static_sprite(path)
+    
+    def _convert_sprite(self, sprite):
+        """Conversion au format de l'écran (thread principal) ; les frames des GIF restent telles quelles"""
+        if sprite is None or isinstance(sprite, AnimatedSprite):
+            return sprite
+        return Display.convert(sprite, alpha=True)
+    
+    def sprite_job(self, pokemon_name, animated=False, is_back=False):
+        """LoadJob pour l'écran de chargement (None si le sprite est déjà en cache)"""
+        cache_key = self.cache_key(pokemon_name, animated, is_back)
+        return AssetManager.job("sprite", cache_key,
+                                lambda: self._decode_sprite(pokemon_name, animated, is_back),
+                                self._convert_sprite, self.owner, pokemon_name)
+    
+    def release(self):
+        """Oublie les sprites de cette instance ; l'AssetManager libère ceux que plus personne n'utilise"""
+        self.sprite_cache.clear()
+        if self.owner:
+            AssetManager.release(self.owner)
+    
     def _load_static_sprite(self, path):
         """Charge un sprite statique"""
         try:
-            sprite = pygame.image.load(path).convert_alpha()
+            sprite = pygame.image.load(path)
             return pygame.transform.scale(sprite, (sprite.get_width() * 3, sprite.get_height() * 3))
         except Exception as e:
-            print(f"Erreur lors du chargement du sprite statique: {e}")
+            Log.error("sprites", "Erreur lors du chargement du sprite statique: {}", e)
             return None
     
     def _load_animated_sprite(self, path):
-        """Charge un sprite animé depuis un GIF"""
+        """Charge un sprite animé depuis un GIF, avec la durée propre à chaque frame"""
         try:
             # Ouvrir le GIF
+            from PIL import Image  # Importé au premier GIF (PIL est lent à charger)
             gif = Image.open(path)
             frames = []
+            durations = []
             
             # Extraire chaque frame
             for frame_index in range(gif.n_frames):
@@ -66,11 +106,12 @@ class SpriteManager:
                 # Redimensionner si nécessaire
                 frame_surface = pygame.transform.scale(frame_surface, (200, 200))
                 frames.append(frame_surface)
+                durations.append(gif.info.get("duration", 0))
             
-            return frames
+            return AnimatedSprite(frames, durations)
             
         except Exception as e:
-            print(f"Erreur lors du chargement du sprite animé: {e}")
+            Log.error("sprites", "Erreur lors du chargement du sprite animé: {}", e)
             return None
     
     def get_pokemon_id(self, name):
@@ -135,5 +176,5 @@ class SpriteManager:
             sprite = pygame.image.load(path)
             return pygame.transform.scale(sprite, (200, 300))  # Ajuster la taille selon besoin
         except:
-            print(f"Erreur: Impossible de charger le sprite du dresseur {trainer_name}")
+            Log.error("sprites", "Impossible de charger le sprite du dresseur {}", trainer_name)
             return None 
\ No newline at end of file
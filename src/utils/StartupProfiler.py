@@ -0,0 +1,238 @@
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+
+
+class _StackSampler:
+    """Relève la pile du thread principal toutes les `interval` secondes (piles complètes, imports compris)
+
+    Chaque pile est pondérée par le temps écoulé depuis le relevé précédent (µs).
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.target = threading.get_ident()
+        self.stacks = {}
+        self.running = True
+        self.switch_interval = sys.getswitchinterval()
+        # Le thread principal rend la main plus souvent : l'échantillonneur garde son rythme
+        sys.setswitchinterval(min(self.switch_interval, interval / 2))
+        self.thread = threading.Thread(target=self._run, name="StartupSampler", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        last = time.perf_counter()
+        while self.running:
+            time.sleep(self.interval)
+            # Poids en µs : temps réel écoulé depuis le relevé précédent (le réveil peut tarder)
+            now = time.perf_counter()
+            weight = int((now - last) * 1e6)
+            last = now
+            frame = sys._current_frames().get(self.target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(StartupProfiler.label((code.co_filename, code.co_firstlineno, code.co_name)))
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + weight
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+        return self.stacks
+
+
+class StartupProfiler:
+    """cProfile du démarrage (jusqu'à la première frame interactive) et des constructeurs de scènes
+
+    Avec --profile-startup DOSSIER, le profileur démarre avant les imports de
+    main.py et s'arrête quand l'écran titre répond (StartupTimeline). Chaque
+    constructeur de scène (MainMenu, PokemonSelection, OlgaArena...) est aussi
+    profilé à part, cumulé par classe, avec la durée de la première
+    construction (à froid : rien en cache) et des suivantes (à chaud).
+
+    Pour chaque profil, le dossier reçoit un rapport trié (`.txt`) et des piles
+    repliées (`.folded`, pour flamegraph.pl, speedscope ou inferno). Au
+    démarrage, elles viennent d'un échantillonnage de la pile toutes les
+    SAMPLE_INTERVAL secondes : cProfile perd les appelants des imports
+    lancés depuis le module principal. Pour les scènes, elles sont
+    reconstruites depuis le graphe d'appels de cProfile. Poids en µs.
+    Les chargements faits sur les threads de l'écran de chargement
+    n'apparaissent pas dans cProfile : le rapport reprend les durées par
+    ressource relevées par Metrics.
+    """
+    ENABLED = False
+    OUTPUT_DIR = None
+    TOP = 40                  # Lignes par tri dans les rapports
+    MIN_FOLDED_US = 20        # Branches plus courtes ignorées dans les piles repliées
+    SAMPLE_INTERVAL = 0.001
+
+    startup = None            # Profileur du démarrage (None une fois arrêté)
+    sampler = None
+    startup_ms = None
+    scenes = {}               # Classe -> {"profile", "durations", "profiled"}
+    active = False            # Un constructeur est en cours de profilage (constructeurs imbriqués)
+
+    @staticmethod
+    def start_from_argv(argv):
+        """Démarre le profil dès l'import de main.py si --profile-startup est présent"""
+        for i, arg in enumerate(argv):
+            if arg == "--profile-startup" and i + 1 < len(argv):
+                StartupProfiler.start(argv[i + 1])
+            elif arg.startswith("--profile-startup="):
+                StartupProfiler.start(arg.partition("=")[2])
+
+    @staticmethod
+    def start(output_dir):
+        if StartupProfiler.ENABLED:
+            return
+        StartupProfiler.ENABLED = True
+        StartupProfiler.OUTPUT_DIR = output_dir
+        StartupProfiler.sampler = _StackSampler(StartupProfiler.SAMPLE_INTERVAL)
+        StartupProfiler.startup = cProfile.Profile()
+        StartupProfiler.startup.enable()
+
+    @staticmethod
+    def stop_startup():
+        """Première frame interactive : arrête le profil du démarrage et écrit ses fichiers"""
+        profile = StartupProfiler.startup
+        if profile is None:
+            return None
+        profile.disable()
+        stacks = StartupProfiler.sampler.stop()
+        StartupProfiler.startup = StartupProfiler.sampler = None
+        from utils.StartupTimeline import StartupTimeline
+        StartupProfiler.startup_ms = StartupTimeline.interactive_ms
+        header = [f"Démarrage jusqu'à la première frame interactive : {StartupTimeline.interactive_ms or 0:.0f} ms "
+                  f"(durées gonflées par cProfile)", "", StartupTimeline.report(),
+                  f"Piles repliées : {sum(stacks.values()) / 1000:.0f} ms échantillonnées, "
+                  f"un relevé toutes les {StartupProfiler.SAMPLE_INTERVAL * 1000:g} ms"]
+        return StartupProfiler.write("startup", profile, header + StartupProfiler.asset_lines(), stacks)
+
+    @staticmethod
+    def wrap_constructor(init, name):
+        """Enveloppe `__init__` d'une scène : profilé si le mode est actif, appel direct sinon"""
+        @functools.wraps(init)
+        def profiled_init(self, *args, **kwargs):
+            if not StartupProfiler.ENABLED or StartupProfiler.active:
+                return init(self, *args, **kwargs)
+            entry = StartupProfiler.scenes.setdefault(name, {"profile": cProfile.Profile(), "durations": [],
+                                                             "profiled": 0})
+            # Pendant le démarrage, le profil du démarrage couvre déjà le constructeur :
+            # un second cProfile le remplacerait (un seul profileur actif par thread)
+            profile = entry["profile"] if StartupProfiler.startup is None else None
+            StartupProfiler.active = True
+            start = time.perf_counter()
+            if profile:
+                entry["profiled"] += 1
+                profile.enable()
+            try:
+                return init(self, *args, **kwargs)
+            finally:
+                if profile:
+                    profile.disable()
+                entry["durations"].append((time.perf_counter() - start) * 1000)
+                StartupProfiler.active = False
+        return profiled_init
+
+    @staticmethod
+    def finish():
+        """Fin du jeu : écrit les profils des scènes et le résumé ; retourne le chemin du résumé"""
+        if not StartupProfiler.ENABLED:
+            return None
+        StartupProfiler.stop_startup()
+        lines = ["Constructeurs de scènes (ms, durées gonflées par cProfile)",
+                 f"{'Scène':<20}{'N':>4}{'à froid':>10}{'à chaud':>10}"]
+        for name, entry in sorted(StartupProfiler.scenes.items()):
+            durations = entry["durations"]
+            warm = durations[1:]
+            warm_text = f"{sum(warm) / len(warm):10.1f}" if warm else f"{'-':>10}"
+            lines.append(f"{name:<20}{len(durations):>4}{durations[0]:10.1f}{warm_text}")
+            # Une scène construite seulement pendant le démarrage est dans le profil du démarrage
+            if entry["profiled"]:
+                StartupProfiler.write(f"scene_{name}", entry["profile"],
+                                      [f"{name}.__init__ : {entry['profiled']} constructions profilées"])
+        if StartupProfiler.startup_ms is not None:
+            lines.insert(0, f"Démarrage interactif : {StartupProfiler.startup_ms:.0f} ms\n")
+        path = os.path.join(StartupProfiler.OUTPUT_DIR, "summary.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    @staticmethod
+    def write(name, profile, header=(), stacks=None):
+        """Écrit `name`.txt (tris cumulé et propre) et `name`.folded (`stacks` ou graphe de cProfile)"""
+        os.makedirs(StartupProfiler.OUTPUT_DIR, exist_ok=True)
+        stats = pstats.Stats(profile)
+        text = io.StringIO()
+        text.write("\n".join(header) + "\n\n")
+        stats.stream = text
+        stats.sort_stats("cumulative").print_stats(StartupProfiler.TOP)
+        stats.sort_stats("tottime").print_stats(StartupProfiler.TOP)
+        path = os.path.join(StartupProfiler.OUTPUT_DIR, f"{name}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text.getvalue())
+        with open(os.path.join(StartupProfiler.OUTPUT_DIR, f"{name}.folded"), "w", encoding="utf-8") as f:
+            for stack, weight in sorted((stacks or StartupProfiler.folded(stats.stats)).items()):
+                f.write(f"{stack} {weight}\n")
+        return path
+
+    @staticmethod
+    def label(func):
+        filename, line, name = func
+        if filename == "~":
+            return name.replace(";", ",")
+        return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ",")
+
+    @staticmethod
+    def folded(stats):
+        """Piles repliées {"a;b;c": µs propres} depuis le graphe appelant -> appelé de cProfile
+
+        cProfile ne garde que les arcs, pas les piles complètes : le temps d'une
+        fonction est réparti entre ses chemins au prorata des arcs qui y mènent.
+        """
+        children = {}
+        roots = []
+        for func, (_, _, _, cumulative, callers) in stats.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, []).append((func, edge[3]))
+            # Appels depuis un cadre non profilé (celui qui a démarré le profileur) : sans appelant
+            orphan = cumulative - sum(edge[3] for caller, edge in callers.items() if caller != func)
+            if cumulative and orphan * 1e6 >= StartupProfiler.MIN_FOLDED_US:
+                roots.append((func, orphan / cumulative))
+        stacks = {}
+
+        def walk(func, path, share):
+            own = stats[func][2]
+            path = path + (func,)
+            own_us = int(own * share * 1e6)
+            if own_us:
+                key = ";".join(StartupProfiler.label(f) for f in path)
+                stacks[key] = stacks.get(key, 0) + own_us
+            for child, edge_time in children.get(func, ()):
+                child_time = edge_time * share
+                if child in path or child_time * 1e6 < StartupProfiler.MIN_FOLDED_US:
+                    continue
+                walk(child, path, child_time / stats[child][3] if stats[child][3] else 0.0)
+
+        for root, share in roots:
+            walk(root, (), share)
+        return stacks
+
+    @staticmethod
+    def asset_lines(top=15):
+        """Ressources les plus lentes à charger (Metrics, tous threads confondus)"""
+        from utils.Metrics import Metrics
+        slowest = sorted(Metrics.assets.items(), key=lambda item: -item[1])[:top]
+        if not slowest:
+            return []
+        return ["", "Ressources les plus lentes (ms, lecture et décodage, threads de chargement compris)"] + \
+               [f"  {ms:8.1f}  {name}" for name, ms in slowest]
@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+
+
+class StartupTimeline:
+    """Jalons du démarrage, en ms depuis l'import de ce module (premier import de main.py)
+
+    `interactive()` est appelé par le SceneManager après la première frame
+    présentée : c'est le moment où l'écran titre répond aux entrées, comparé
+    à BUDGET_MS. `import_time_report()` relance le jeu sous `-X importtime`
+    et résume les modules les plus coûteux.
+    """
+    BUDGET_MS = 1500
+    IMPORT_LINE = r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)"
+
+    origin = time.perf_counter()
+    marks = []           # (nom, ms depuis l'origine)
+    interactive_ms = None
+    on_interactive = []  # Fonctions appelées une fois l'écran titre interactif
+
+    @staticmethod
+    def elapsed():
+        return (time.perf_counter() - StartupTimeline.origin) * 1000
+
+    @staticmethod
+    def mark(name):
+        StartupTimeline.marks.append((name, StartupTimeline.elapsed()))
+
+    @staticmethod
+    def interactive():
+        """Première frame présentée : dernier jalon, puis les callbacks (une seule fois)"""
+        if StartupTimeline.interactive_ms is not None:
+            return
+        StartupTimeline.mark("interactive")
+        StartupTimeline.interactive_ms = StartupTimeline.marks[-1][1]
+        for callback in StartupTimeline.on_interactive:
+            callback()
+
+    @staticmethod
+    def within_budget():
+        return (StartupTimeline.interactive_ms is not None
+                and StartupTimeline.interactive_ms <= StartupTimeline.BUDGET_MS)
+
+    @staticmethod
+    def report():
+        """Tableau des jalons avec la durée de chaque étape"""
+        lines = ["Démarrage (ms)          total     étape"]
+        previous = 0.0
+        for name, ms in StartupTimeline.marks:
+            lines.append(f"  {name:<20} {ms:8.1f}  {ms - previous:8.1f}")
+            previous = ms
+        if StartupTimeline.interactive_ms is not None:
+            verdict = "OK" if StartupTimeline.within_budget() else "DÉPASSÉ"
+            lines.append(f"Interactif en {StartupTimeline.interactive_ms:.0f} ms "
+                         f"(budget {StartupTimeline.BUDGET_MS} ms) : {verdict}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def parse_import_time(stderr):
+        """Lignes `-X importtime` -> liste de (module, self_us, cumulé_us, profondeur)"""
+        import re
+        pattern = re.compile(StartupTimeline.IMPORT_LINE)
+        modules = []
+        for line in stderr.splitlines():
+            match = pattern.match(line)
+            if match:
+                self_us, cumulative_us, indent, name = match.groups()
+                modules.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+        return modules
+
+    @staticmethod
+    def import_time_report(script, args=(), top=25):
+        """Relance `script` sous -X importtime jusqu'à l'écran titre et résume les imports"""
+        import subprocess
+        command = [sys.executable, "-X", "importtime", script, *args, "--exit-after-startup"]
+        result = subprocess.run(command, stderr=subprocess.PIPE, text=True, env=os.environ.copy())
+        modules = StartupTimeline.parse_import_time(result.stderr)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                print(line, file=sys.stderr)
+
+        total_ms = sum(self_us for _, self_us, _, _ in modules) / 1000
+        roots = sorted((m for m in modules if m[3] == 0), key=lambda m: m[2], reverse=True)
+        heaviest = sorted(modules, key=lambda m: m[1], reverse=True)
+        lines = [f"{len(modules)} modules importés avant l'écran titre, {total_ms:.1f} ms au total",
+                 "", "Imports de premier niveau (cumulé ms):"]
+        lines += [f"  {cumulative / 1000:8.1f}  {name}" for name, _, cumulative, _ in roots[:top]]
+        lines += ["", "Modules les plus lents (propre ms):"]
+        lines += [f"  {self_us / 1000:8.1f}  {name}" for name, self_us, _, _ in heaviest[:top]]
+        return "\n".join(lines)
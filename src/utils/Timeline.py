@@ -0,0 +1,129 @@
+import math
+
+
+# Fonctions d'easing : t va de 0 à 1
+def linear(t):
+    return t
+
+def ease_in_quad(t):
+    return t * t
+
+def ease_out_quad(t):
+    return t * (2 - t)
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+def ease_out_back(t):
+    c1 = 1.70158
+    return 1 + (c1 + 1) * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+def ease_in_out_sine(t):
+    return -(math.cos(math.pi * t) - 1) / 2
+
+EASINGS = {
+    "linear": linear,
+    "ease_in_quad": ease_in_quad,
+    "ease_out_quad": ease_out_quad,
+    "ease_in_out_quad": ease_in_out_quad,
+    "ease_out_back": ease_out_back,
+    "ease_in_out_sine": ease_in_out_sine
+}
+
+
+def lerp(start, end, t):
+    """Interpolation d'un nombre ou d'un tuple de nombres (positions, couleurs...)"""
+    if isinstance(start, (tuple, list)):
+        return tuple(a + (b - a) * t for a, b in zip(start, end))
+    return start + (end - start) * t
+
+
+class Tween:
+    """Interpolation d'une valeur entre `start` et `end`, appliquée via `setter`"""
+
+    def __init__(self, at, duration, start, end, setter, easing=linear):
+        self.at = at
+        self.duration = duration
+        self.start = start
+        self.end = end
+        self.setter = setter
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.done = False
+
+    def apply(self, time):
+        if self.duration <= 0:
+            t = 1.0
+        else:
+            t = min(1.0, max(0.0, (time - self.at) / self.duration))
+        self.setter(lerp(self.start, self.end, self.easing(t)))
+        if t >= 1.0:
+            self.done = True
+
+
+class Timeline:
+    """Suite de tweens et de callbacks positionnés dans le temps (en millisecondes)
+
+    La timeline avance avec le dt de la boucle (`update(dt)`), pas au nombre de
+    frames : une animation dure le même temps à 30 ou 144 FPS. `time_scale`
+    accélère (>1) ou ralentit (<1) la lecture, `skip()` saute directement à la fin.
+    """
+
+    def __init__(self, time_scale=1.0):
+        self.time = 0.0
+        self.time_scale = time_scale
+        self.cursor = 0.0   # Fin du dernier élément ajouté (pour enchaîner)
+        self.tweens = []
+        self.callbacks = []  # (instant, ordre d'ajout, callback)
+        self.next_callback = 0
+
+    @property
+    def duration(self):
+        ends = [tween.at + tween.duration for tween in self.tweens]
+        ends.extend(at for at, _, _ in self.callbacks)
+        return max(ends, default=0.0)
+
+    @property
+    def finished(self):
+        return self.time >= self.duration and self.next_callback >= len(self.callbacks)
+
+    def tween(self, duration, start, end, setter, easing=linear, at=None):
+        """Ajoute un tween ; par défaut il démarre à la fin de l'élément précédent"""
+        at = self.cursor if at is None else at
+        self.tweens.append(Tween(at, duration, start, end, setter, easing))
+        self.cursor = at + duration
+        return self
+
+    def wait(self, duration):
+        """Décale le curseur sans rien animer"""
+        self.cursor += duration
+        return self
+
+    def call(self, callback, at=None):
+        """Ajoute un callback déclenché une seule fois quand la timeline atteint `at`"""
+        at = self.cursor if at is None else at
+        self.callbacks.append((at, len(self.callbacks), callback))
+        self.callbacks.sort(key=lambda item: (item[0], item[1]))
+        self.cursor = max(self.cursor, at)
+        return self
+
+    def update(self, dt):
+        """Avance de `dt` millisecondes ; retourne True quand tout est terminé"""
+        self.seek(self.time + dt * self.time_scale)
+        return self.finished
+
+    def skip(self):
+        """Termine immédiatement : valeurs finales appliquées, callbacks restants appelés"""
+        self.seek(self.duration)
+
+    def seek(self, time):
+        self.time = time
+        for tween in self.tweens:
+            if not tween.done and time >= tween.at:
+                tween.apply(time)
+        # Les callbacks sont appelés dans l'ordre chronologique, chacun une seule fois
+        while self.next_callback < len(self.callbacks):
+            at, _, callback = self.callbacks[self.next_callback]
+            if at > time:
+                break
+            self.next_callback += 1
+            callback()
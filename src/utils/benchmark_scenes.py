@@ -0,0 +1,244 @@
+"""
+Benchmark de rendu sans affichage pour chaque scène du jeu
+
+Usage (depuis la racine du projet) :
+    python src/utils/benchmark_scenes.py --frames 300 --output bench.json
+    python src/utils/benchmark_scenes.py --save-baseline bench_baseline.json
+    python src/utils/benchmark_scenes.py --baseline bench_baseline.json
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import json
+import math
+import platform
+import time
+import tracemalloc
+
+from utils.headless import (init_headless, make_synthetic_profile, make_synthetic_team,
+                            remove_temporary_save_file, use_temporary_save_file)
+
+init_headless()
+
+import pygame
+
+# Pas de temps simulé pour les scènes animées par l'horloge de boucle (60 FPS)
+FRAME_MS = 1000 / 60
+
+
+def percentile(sorted_values, pct):
+    """Percentile au rang le plus proche sur une liste déjà triée"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+def surface_bytes(value):
+    """Taille approximative en octets d'une surface ou d'une liste de frames"""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, (list, tuple)):
+        return sum(surface_bytes(v) for v in value)
+    return 0
+
+
+def cache_stats(scene):
+    """Statistiques du cache de sprites de la scène, si elle en possède un"""
+    sprite_manager = getattr(scene, "sprite_manager", None)
+    if sprite_manager is None:
+        return {}
+    cache = sprite_manager.sprite_cache
+    return {
+        "sprite_entries": len(cache),
+        "sprite_bytes": sum(surface_bytes(v) for v in cache.values())
+    }
+
+
+def build_scenes(main_menu, profile):
+    """Retourne la liste (nom, constructeur, fonction de rendu d'une frame)"""
+    from gui.menu.game_menu import GameMenu
+    from gui.menu.pokemon_selection import PokemonSelection
+    from gui.menu.team_order import TeamOrderMenu
+    from gui.menu.league_selection import LeagueSelection
+    from gui.battle.arena_scenes.olga_arena import OlgaArena
+    from utils.SpriteManager import SpriteManager
+    from utils.AnimationClock import AnimationClock
+
+    screen = main_menu.screen
+    team_names = [pokemon["name"] for pokemon in profile["current_team"]]
+
+    def arena(state):
+        def build():
+            scene = OlgaArena(screen, make_synthetic_team())
+            if state == "BATTLE":
+                scene.battle_state = "BATTLE"
+            elif state == "END":
+                scene.battle_state = "END"
+                scene.battle_result = "VICTORY"
+            return scene
+        return build
+
+    def render(scene):
+        # Même séquence qu'une frame du SceneManager
+        AnimationClock.advance(FRAME_MS)
+        scene.update(FRAME_MS)
+        scene.draw()
+        screen.present()
+
+    return [
+        ("MainMenu", lambda: main_menu, render),
+        ("GameMenu", lambda: GameMenu(screen, SpriteManager(), profile), render),
+        ("PokemonSelection", lambda: PokemonSelection(screen), render),
+        ("TeamOrderMenu", lambda: TeamOrderMenu(screen, team_names), render),
+        ("LeagueSelection", lambda: LeagueSelection(screen), render),
+        ("OlgaArena.intro", arena("INTRO"), render),
+        ("OlgaArena.battle", arena("BATTLE"), render),
+        ("OlgaArena.end", arena("END"), render),
+    ]
+
+
+def run_scene(build, render, frames, warmup, alloc_frames):
+    """Construit une scène, rend `frames` frames et mesure temps et allocations"""
+    start = time.perf_counter()
+    scene = build()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    for _ in range(warmup):
+        pygame.event.pump()
+        render(scene)
+
+    # Passe de mesure du temps, sans tracemalloc qui fausserait les chiffres
+    timings = []
+    for _ in range(frames):
+        pygame.event.pump()
+        start = time.perf_counter()
+        render(scene)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Passe séparée pour les allocations Python (les pixels SDL n'y apparaissent pas)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base_size, _ = tracemalloc.get_traced_memory()
+    for _ in range(alloc_frames):
+        pygame.event.pump()
+        render(scene)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+
+    timings.sort()
+    return {
+        "frames": frames,
+        "build_ms": round(build_ms, 3),
+        "mean_ms": round(sum(timings) / len(timings), 3),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "max_ms": round(timings[-1], 3),
+        "alloc": {
+            "frames": alloc_frames,
+            "peak_kib": round((peak - base_size) / 1024, 2),
+            "net_kib": round(sum(stat.size_diff for stat in diff) / 1024, 2),
+            "net_blocks": sum(stat.count_diff for stat in diff)
+        },
+        "cache": cache_stats(scene)
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Compare p50/p95/p99 à la baseline (écart minimum de 0.5 ms) et liste les régressions"""
+    regressions = []
+    for name, current in results["scenes"].items():
+        reference = baseline.get("scenes", {}).get(name)
+        if not reference:
+            continue
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            limit = reference[key] * (1 + tolerance)
+            current[f"{key}_baseline"] = reference[key]
+            if current[key] > limit and current[key] - reference[key] > 0.5:
+                regressions.append(f"{name}: {key} {current[key]:.2f} ms > {reference[key]:.2f} ms (+{tolerance:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de rendu des scènes (SDL dummy)")
+    parser.add_argument("--frames", type=int, default=300, help="frames mesurées par scène")
+    parser.add_argument("--warmup", type=int, default=10, help="frames ignorées avant la mesure")
+    parser.add_argument("--alloc-frames", type=int, default=30, help="frames suivies par tracemalloc")
+    parser.add_argument("--scenes", nargs="*", help="limiter à certaines scènes (ex: OlgaArena.battle)")
+    parser.add_argument("--output", help="fichier JSON de sortie (stdout par défaut)")
+    parser.add_argument("--baseline", help="baseline JSON à comparer")
+    parser.add_argument("--save-baseline", help="écrire les résultats comme nouvelle baseline")
+    parser.add_argument("--quality", default="quality", help="preset de résolution logique (voir utils/Display.py)")
+    parser.add_argument("--renderer", choices=["software", "texture"], default="software",
+                        help="backend de rendu (voir utils/Renderer.py)")
+    parser.add_argument("--render-driver", help="driver SDL du backend texture (ex: software)")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="marge de régression tolérée (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    team = make_synthetic_team()
+    profile = make_synthetic_profile(team=team)
+    save_path = use_temporary_save_file(profile)
+
+    # Les scènes affichent encore des messages de debug : on les envoie sur stderr
+    # pour garder un JSON propre sur stdout
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            from gui.menu.main_menu import MainMenu
+            from utils.Display import Display
+            Display.quality = args.quality
+            Display.backend = args.renderer
+            Display.render_driver = args.render_driver
+            main_menu = MainMenu()
+
+            results = {
+                "meta": {
+                    "python": platform.python_version(),
+                    "pygame": pygame.version.ver,
+                    "sdl": ".".join(str(v) for v in pygame.get_sdl_version()),
+                    "video_driver": pygame.display.get_driver(),
+                    "quality": args.quality,
+                    "renderer": main_menu.screen.stats(),
+                    "resolution": list(main_menu.screen.get_size()),
+                    "frames": args.frames
+                },
+                "scenes": {}
+            }
+
+            for name, build, render in build_scenes(main_menu, profile):
+                if args.scenes and name not in args.scenes:
+                    continue
+                results["scenes"][name] = run_scene(build, render, args.frames, args.warmup, args.alloc_frames)
+    finally:
+        pygame.quit()
+        remove_temporary_save_file(save_path)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(output)
+
+    for regression in regressions:
+        print(f"RÉGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
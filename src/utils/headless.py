@@ -0,0 +1,82 @@
+import os
+import copy
+import tempfile
+
+
+def init_headless():
+    """Configure SDL sans fenêtre ni carte son (à appeler avant d'importer pygame)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+
+def make_synthetic_team(size=6):
+    """Construit une équipe complète au format de TeamOrderMenu.save_team"""
+    from data.pokemon_data import SPECIES_DATA, POKEMON_NAMES_FR
+
+    team = []
+    for english_name, data in list(SPECIES_DATA.items())[:size]:
+        team.append({
+            "name": POKEMON_NAMES_FR.get(english_name, data["name"]),
+            "types": list(data["types"]),
+            "level": data["level"],
+            "max_hp": data["max_hp"],
+            "current_hp": data["max_hp"],
+            "attack": data["attack"],
+            "defense": data["defense"],
+            "special_attack": data["special_attack"],
+            "special_defense": data["special_defense"],
+            "speed": data["speed"],
+            "moves": [
+                {"name": move, "type": "normal", "category": "physical",
+                 "power": 40, "pp": 30, "max_pp": 30}
+                for move in data["moves"]
+            ]
+        })
+    return team
+
+
+def make_synthetic_profile(trainer_name="Bench", team=None):
+    """Profil complet, identique à celui créé par ProfileManager.create_new_profile"""
+    return {
+        "trainer_name": trainer_name,
+        "pokedex": {},
+        "score": 0,
+        "defeated_trainers": {
+            "Olga": False,
+            "Aldo": False,
+            "Agatha": False,
+            "Peter": False,
+            "Blue": False
+        },
+        "current_team": copy.deepcopy(team) if team is not None else make_synthetic_team(),
+        "badges": 0
+    }
+
+
+def use_temporary_save_file(profile=None):
+    """Redirige ProfileManager (et l'historique des combats) vers des fichiers temporaires
+    pour ne pas écraser la vraie sauvegarde"""
+    from utils.ProfileManager import ProfileManager
+    from utils.BattleHistory import BattleHistory
+
+    fd, path = tempfile.mkstemp(prefix="pokemon_save_", suffix=".json")
+    os.close(fd)
+    ProfileManager.invalidate()
+    ProfileManager.SAVE_FILE = path
+    BattleHistory.DB = path[:-len(".json")] + "_battles.db"
+    ProfileManager.save_profile(profile if profile is not None else make_synthetic_profile())
+    ProfileManager.sync()
+    return path
+
+
+def remove_temporary_save_file(path):
+    """Supprime la sauvegarde temporaire et l'historique des combats, une fois leurs écritures finies"""
+    from utils.ProfileManager import ProfileManager
+    from utils.BattleHistory import BattleHistory
+
+    ProfileManager.sync()
+    BattleHistory.close()
+    for file in (path, BattleHistory.DB, BattleHistory.DB + "-wal", BattleHistory.DB + "-shm"):
+        if os.path.exists(file):
+            os.remove(file)
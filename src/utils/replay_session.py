@@ -0,0 +1,143 @@
+"""
+Rejeu sans affichage d'une session enregistrée avec `main.py --record-input`
+
+Usage (depuis la racine du projet) :
+    python src/main.py --record-input session.json
+    python src/utils/replay_session.py session.json --output replay.json
+    python src/utils/replay_session.py session.json --save-baseline replay_baseline.json
+    python src/utils/replay_session.py session.json --baseline replay_baseline.json
+    python src/utils/replay_session.py session.json --realtime
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import json
+import platform
+
+from utils.headless import init_headless, remove_temporary_save_file, use_temporary_save_file
+
+init_headless()
+
+import pygame
+
+from utils.benchmark_scenes import compare_to_baseline, percentile
+
+
+def frame_stats(timings):
+    """Statistiques des durées de frame (ms) d'une scène"""
+    timings = sorted(timings)
+    return {
+        "frames": len(timings),
+        "mean_ms": round(sum(timings) / len(timings), 3),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "max_ms": round(timings[-1], 3)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejeu d'une session enregistrée (SDL dummy)")
+    parser.add_argument("recording", help="fichier écrit par main.py --record-input")
+    parser.add_argument("--realtime", action="store_true",
+                        help="respecter la durée des frames enregistrées (par défaut : au plus vite)")
+    parser.add_argument("--output", help="fichier JSON de sortie (stdout par défaut)")
+    parser.add_argument("--baseline", help="baseline JSON à comparer")
+    parser.add_argument("--save-baseline", help="écrire les résultats comme nouvelle baseline")
+    parser.add_argument("--quality", help="preset de résolution (par défaut : celui de l'enregistrement)")
+    parser.add_argument("--renderer", choices=["software", "texture"], default="software",
+                        help="backend de rendu (voir utils/Renderer.py)")
+    parser.add_argument("--render-driver", help="driver SDL du backend texture (ex: software)")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="marge de régression tolérée (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    from utils.InputRecorder import InputRecorder
+    from utils.ProfileManager import ProfileManager
+    recording = InputRecorder.load(args.recording)
+
+    # Même sauvegarde de départ que la session enregistrée, dans des fichiers temporaires
+    save_path = use_temporary_save_file(recording["profile"])
+    if recording["profile"] is None:
+        os.remove(save_path)
+        ProfileManager.invalidate()
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            from gui.menu.main_menu import MainMenu
+            from gui.menu.loading_screen import LoadingScreen
+            from utils.Display import Display
+            from utils.SceneManager import SceneManager
+            Display.quality = args.quality or recording["quality"] or Display.quality
+            Display.backend = args.renderer
+            Display.render_driver = args.render_driver
+            Display.init()
+            manager = SceneManager(Display.create_window())
+            jobs = MainMenu.load_jobs(manager.screen) + [ProfileManager.load_job()]
+            manager.push(LoadingScreen(manager.screen, jobs, lambda: MainMenu(manager.screen), "Pokémon"))
+            replay = InputRecorder.replay(manager, recording, args.realtime)
+
+        by_scene = {}
+        for name, ms in replay["frames"]:
+            by_scene.setdefault(name, []).append(ms)
+        all_frames = [ms for _, ms in replay["frames"]]
+        screen_size = list(manager.screen.get_size())
+        results = {
+            "meta": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "video_driver": pygame.display.get_driver(),
+                "recording": os.path.basename(args.recording),
+                "seed": recording["seed"],
+                "quality": Display.quality,
+                "renderer": manager.screen.stats(),
+                "resolution": screen_size,
+                "recorded_resolution": recording["screen_size"],
+                "realtime": args.realtime
+            },
+            "replay": {
+                "recorded_frames": replay["recorded"],
+                "replayed_frames": replay["replayed"],
+                "total_frames": len(all_frames),
+                "loading_frames": len(replay["loading"]),
+                "divergences": replay["divergences"]
+            },
+            # Frames rejouées seulement ; celles des écrans de chargement ne sont pas comparées
+            "total": frame_stats(all_frames) if all_frames else {},
+            "loading": frame_stats(replay["loading"]) if replay["loading"] else {},
+            "scenes": {name: frame_stats(timings) for name, timings in by_scene.items()}
+        }
+        if recording["screen_size"] and recording["screen_size"] != screen_size:
+            results["replay"]["divergences"].append(
+                f"résolution {screen_size} différente de l'enregistrement {recording['screen_size']}")
+    finally:
+        pygame.quit()
+        remove_temporary_save_file(save_path)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(output)
+
+    for divergence in results["replay"]["divergences"]:
+        print(f"DIVERGENCE {divergence}", file=sys.stderr)
+    for regression in regressions:
+        print(f"RÉGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions or results["replay"]["divergences"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Test d'endurance sans affichage : parcourt les scènes en boucle et surveille la mémoire
+
+Un cycle rejoue le parcours d'un joueur avec de vrais événements : menu du jeu
+-> sélection des Pokémon (6 clics) -> ordre de l'équipe -> mode combat ->
+arène d'Olga -> abandon -> retour au menu du jeu. Toutes les --snapshot-every
+cycles : instantané tracemalloc (mémoire Python par ligne d'allocation) et RSS
+(mémoire du processus, pixels SDL compris). La croissance par cycle est la
+pente (moindres carrés) de la seconde moitié des instantanés pris après
+l'échauffement ; les lignes d'allocation dont la taille croît le plus sont
+rapportées.
+
+Par défaut, les scènes restent dans le cache du SceneManager comme dans le jeu ;
+--no-cache les libère à chaque cycle pour reconstruire SpriteManager, sons et
+sprites à chaque visite (chemin des évictions par budget mémoire).
+
+Usage (depuis la racine du projet) :
+    python src/utils/soak_scenes.py --cycles 2000 --output soak.json
+    python src/utils/soak_scenes.py --cycles 500 --no-cache --traceback 8
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import time
+import tracemalloc
+
+from utils.headless import (init_headless, make_synthetic_profile, remove_temporary_save_file,
+                            use_temporary_save_file)
+
+init_headless()
+
+import pygame
+
+FRAME_MS = 1000 / 60
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_bytes():
+    """Mémoire résidente du processus (Linux) ; ailleurs le pic via resource, ou None"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def slope(points):
+    """Pente (moindres carrés) d'une liste de (cycle, valeur)"""
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def site_label(frame):
+    filename = frame.filename
+    if filename.startswith(PROJECT_DIR):
+        filename = os.path.relpath(filename, PROJECT_DIR)
+    return f"{filename}:{frame.lineno}"
+
+
+class SceneFlow:
+    """Pilote le SceneManager comme un joueur (clics et touches), écrans de chargement compris"""
+
+    def __init__(self, manager, frames_per_scene, max_idle_seconds=30):
+        self.manager = manager
+        self.frames_per_scene = frames_per_scene
+        self.max_idle_seconds = max_idle_seconds
+        self.frames = 0
+
+    def step(self, *events):
+        self.manager.step(FRAME_MS, list(events))
+        self.frames += 1
+        # Les threads de chargement ont besoin du GIL : on attend sans tourner à vide
+        idle_since = time.perf_counter()
+        while self.manager.top is not None and not self.manager.top.interactive:
+            if time.perf_counter() - idle_since > self.max_idle_seconds:
+                raise RuntimeError(f"{type(self.manager.top).__name__} bloqué depuis {self.max_idle_seconds} s")
+            time.sleep(0.002)
+            pygame.event.pump()
+            self.manager.step(FRAME_MS, [])
+            self.frames += 1
+
+    def expect(self, name):
+        """Vérifie la scène du dessus, y reste `frames_per_scene` frames et la retourne"""
+        scene = self.manager.top
+        if type(scene).__name__ != name:
+            raise RuntimeError(f"{name} attendu, {type(scene).__name__} à l'écran")
+        for _ in range(self.frames_per_scene):
+            pygame.event.pump()
+            self.step()
+        return scene
+
+    def click(self, pos):
+        self.step(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+    def key(self, key):
+        self.step(pygame.event.Event(pygame.KEYDOWN, key=key, unicode="", mod=0))
+
+    def choose(self, menu, option):
+        """Clique sur une option de MainMenu ou GameMenu"""
+        self.click(menu.option_rect(menu.options.index(option)).center)
+
+    def enter(self):
+        """Écran titre -> menu du jeu (charge la sauvegarde)"""
+        self.choose(self.expect("MainMenu"), "Charger Partie")
+        self.expect("GameMenu")
+
+    def cycle(self):
+        game_menu = self.expect("GameMenu")
+        self.choose(game_menu, "Pokémon")
+        selection = self.expect("PokemonSelection")
+        width = selection.current_width // 4
+        for i in range(6):
+            self.click(((i % 4) * width + 70, (i // 4) * 200 + 120 + selection.scroll_y))
+        self.click(selection.confirm_button.center)
+        team_order = self.expect("TeamOrderMenu")
+        self.click(team_order.confirm_button.center)
+        self.choose(self.expect("GameMenu"), "Mode Combat")
+        league = self.expect("LeagueSelection")
+        self.click(league.trainer_rects[0].center)
+        self.expect("OlgaArena")
+        self.key(pygame.K_ESCAPE)
+        self.expect("LeagueSelection")
+        self.key(pygame.K_ESCAPE)
+
+    def release_cached(self):
+        """--no-cache : libère les scènes en cache hors de la pile"""
+        for key in list(self.manager.scenes):
+            if self.manager.scenes[key] not in self.manager.stack:
+                self.manager.forget(key)
+
+
+class SiteHistory:
+    """Taille par site d'allocation au fil des instantanés
+
+    Seuls les sites dont la taille diffère du premier instantané sont suivis :
+    la mémoire du harnais reste stable, sans quoi elle fausserait le RSS.
+    """
+
+    def __init__(self, group_by):
+        self.group_by = group_by
+        self.cycles = []
+        self.baseline = None      # Site -> (octets, blocs) au premier instantané
+        self.changed = {}         # Site -> {cycle: (octets, blocs)}
+
+    def add(self, cycle, snapshot):
+        sites = {}
+        for stat in snapshot.statistics(self.group_by):
+            # Clés texte (pas de références aux objets de tracemalloc), de l'appel le plus récent au plus ancien
+            key = " <- ".join(site_label(frame) for frame in reversed(stat.traceback))
+            sites[key] = (stat.size, stat.count)
+        self.cycles.append(cycle)
+        if self.baseline is None:
+            self.baseline = sites
+            return
+        for key, value in sites.items():
+            if value != self.baseline.get(key):
+                self.changed.setdefault(key, {})[cycle] = value
+
+    def growing(self, top):
+        """Sites qui croissent dans au moins la moitié des intervalles, par pente décroissante
+
+        Un site qui a grossi une fois puis s'est stabilisé (cache rempli) n'est pas rapporté.
+        """
+        results = []
+        last_cycle = self.cycles[-1]
+        for key, values in self.changed.items():
+            start_size, start_count = self.baseline.get(key, (0, 0))
+            size, count = values.get(last_cycle, (0, 0))
+            if size <= start_size:
+                continue
+            series = [(cycle, values.get(cycle, (start_size, 0))[0]) for cycle in self.cycles]
+            rises = sum(1 for (_, a), (_, b) in zip(series, series[1:]) if b > a)
+            if rises * 2 < len(series) - 1:
+                continue
+            stack = key.split(" <- ")
+            results.append({
+                "site": stack[0],
+                "traceback": stack if len(stack) > 1 else None,
+                "bytes_per_cycle": round(slope(series), 1),
+                "size_diff_kib": round((size - start_size) / 1024, 2),
+                "count_diff": count - start_count,
+                "rising_intervals": f"{rises}/{len(series) - 1}"
+            })
+        results.sort(key=lambda site: -site["bytes_per_cycle"])
+        return [site for site in results if site["bytes_per_cycle"] > 0][:top]
+
+
+def take_snapshot(cycle, manager, history, started):
+    """Mesures globales du cycle ; les tailles par site vont dans `history`"""
+    from utils.AssetManager import AssetManager
+    gc.collect()
+    rss = rss_bytes()
+    measures = {
+        "cycle": cycle,
+        "time_s": round(time.perf_counter() - started, 1),
+        "traced_kib": None,
+        "rss_kib": round(rss / 1024, 1) if rss is not None else None,
+        "gc_objects": len(gc.get_objects()),
+        "assets_kib": round(AssetManager.total_bytes / 1024, 1),
+        "render_cache_kib": round(manager.screen.cache_bytes() / 1024, 1),
+        "scenes_cached": len(manager.scenes)
+    }
+    # Sans les allocations du harnais lui-même
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>")
+    ])
+    measures["traced_kib"] = round(sum(trace.size for trace in snapshot.traces) / 1024, 1)
+    history.add(cycle, snapshot)
+    return measures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test d'endurance mémoire du parcours des scènes (SDL dummy)")
+    parser.add_argument("--cycles", type=int, default=2000, help="cycles du parcours des scènes")
+    parser.add_argument("--warmup", type=int, default=100,
+                        help="cycles ignorés avant la première mesure (caches bornés et tampon de Log remplis)")
+    parser.add_argument("--snapshot-every", type=int, default=100, help="cycles entre deux instantanés")
+    parser.add_argument("--frames", type=int, default=2, help="frames rendues à chaque visite d'une scène")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="libérer les scènes à chaque cycle (reconstruction à chaque visite)")
+    parser.add_argument("--traceback", type=int, default=1,
+                        help="profondeur des piles tracemalloc (1 = regroupement par ligne)")
+    parser.add_argument("--top", type=int, default=15, help="sites d'allocation rapportés")
+    parser.add_argument("--max-growth-kib", type=float, default=1.0,
+                        help="croissance Python tolérée par cycle (Kio, tracemalloc)")
+    parser.add_argument("--max-rss-growth-kib", type=float, default=16.0,
+                        help="croissance RSS tolérée par cycle (Kio)")
+    parser.add_argument("--output", help="fichier JSON de sortie (stdout par défaut)")
+    parser.add_argument("--quality", default="quality", help="preset de résolution logique (voir utils/Display.py)")
+    parser.add_argument("--renderer", choices=["software", "texture"], default="software",
+                        help="backend de rendu (voir utils/Renderer.py)")
+    args = parser.parse_args(argv)
+    if args.snapshot_every < 1 or (args.cycles - args.warmup) // args.snapshot_every < 2:
+        parser.error("il faut au moins 3 instantanés après l'échauffement (--cycles, --warmup, --snapshot-every)")
+
+    save_path = use_temporary_save_file(make_synthetic_profile())
+    history = SiteHistory("traceback" if args.traceback > 1 else "lineno")
+    snapshots = []
+    tracemalloc.start(args.traceback)
+    started = time.perf_counter()
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            from gui.menu.main_menu import MainMenu
+            from utils.Display import Display
+            from utils.SceneManager import SceneManager
+            Display.quality = args.quality
+            Display.backend = args.renderer
+            main_menu = MainMenu()
+            manager = SceneManager(main_menu.screen)
+            manager.running = True
+            manager.push(main_menu)
+            flow = SceneFlow(manager, args.frames)
+            flow.enter()
+
+            for cycle in range(1, args.cycles + 1):
+                flow.cycle()
+                if args.no_cache:
+                    flow.release_cached()
+                if cycle >= args.warmup and (cycle - args.warmup) % args.snapshot_every == 0:
+                    measures = take_snapshot(cycle, manager, history, started)
+                    snapshots.append(measures)
+                    print(f"cycle {cycle}/{args.cycles} : Python {measures['traced_kib']:.0f} Kio, "
+                          f"RSS {measures['rss_kib'] or 0:.0f} Kio, {measures['gc_objects']} objets",
+                          file=sys.stderr)
+            resolution = list(manager.screen.get_size())
+            renderer = manager.screen.stats()
+    finally:
+        tracemalloc.stop()
+        pygame.quit()
+        remove_temporary_save_file(save_path)
+
+    # Pente sur la seconde moitié des instantanés : le RSS monte encore un peu après l'échauffement
+    # (arènes de l'allocateur) puis se stabilise, alors qu'une fuite continue d'un cycle à l'autre
+    window = snapshots[len(snapshots) // 2:]
+
+    def growth_of(field):
+        return round(slope([(s["cycle"], s[field]) for s in window]), 3)
+
+    growth = {
+        "from_cycle": window[0]["cycle"],
+        "traced_kib_per_cycle": growth_of("traced_kib"),
+        "rss_kib_per_cycle": growth_of("rss_kib") if window[0]["rss_kib"] is not None else None,
+        "gc_objects_per_cycle": growth_of("gc_objects"),
+        "assets_kib_per_cycle": growth_of("assets_kib")
+    }
+    failures = []
+    if growth["traced_kib_per_cycle"] > args.max_growth_kib:
+        failures.append(f"mémoire Python : +{growth['traced_kib_per_cycle']:.2f} Kio/cycle "
+                        f"> {args.max_growth_kib:g} Kio")
+    if growth["rss_kib_per_cycle"] is not None and growth["rss_kib_per_cycle"] > args.max_rss_growth_kib:
+        failures.append(f"RSS : +{growth['rss_kib_per_cycle']:.2f} Kio/cycle > {args.max_rss_growth_kib:g} Kio")
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "quality": args.quality,
+            "renderer": renderer,
+            "resolution": resolution,
+            "cycles": args.cycles,
+            "warmup": args.warmup,
+            "frames_per_scene": args.frames,
+            "cache": not args.no_cache,
+            "frames": flow.frames,
+            "duration_s": round(time.perf_counter() - started, 1)
+        },
+        "growth": growth,
+        "sites": history.growing(args.top),
+        "snapshots": snapshots,
+        "failures": failures
+    }
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    for failure in failures:
+        print(f"FUITE {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
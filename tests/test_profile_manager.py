@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pytest
+
+from utils.ProfileManager import ProfileManager
+
+
+@pytest.fixture
+def sqlite_profiles(tmp_path, monkeypatch):
+    """ProfileManager sur une base SQLite temporaire, cache vide"""
+    ProfileManager.sync()
+    monkeypatch.setattr(ProfileManager, "BACKEND", "sqlite")
+    monkeypatch.setattr(ProfileManager, "SAVE_DB", str(tmp_path / "save_data.db"))
+    monkeypatch.setattr(ProfileManager, "SAVE_FILE", str(tmp_path / "save_data.json"))
+    monkeypatch.setattr(ProfileManager, "loaded", False)
+    monkeypatch.setattr(ProfileManager, "profile", None)
+    yield ProfileManager
+    ProfileManager.sync()
+
+
+def win_badges(count):
+    for trainer in ["Olga", "Aldo", "Agatha", "Peter"][:count]:
+        ProfileManager.update_defeated_trainer(trainer)
+
+
+def test_new_game_keeps_existing_trainer(sqlite_profiles):
+    assert ProfileManager.create_new_profile("Sacha")
+    win_badges(4)
+    ProfileManager.sync()
+
+    assert not ProfileManager.create_new_profile("Sacha")
+
+    ProfileManager.invalidate()
+    profile = ProfileManager.store().switch("Sacha")
+    assert profile["badges"] == 4
+    assert profile["defeated_trainers"] == {
+        "Olga": True, "Aldo": True, "Agatha": True, "Peter": True, "Blue": False
+    }
+    assert ProfileManager.leaderboard()[0][:2] == ("Sacha", 4)
+
+
+def test_switch_and_leaderboard_see_pending_changes(sqlite_profiles):
+    ProfileManager.create_new_profile("Pierre")
+    ProfileManager.create_new_profile("Sacha")
+    win_badges(2)
+
+    # Changements encore en mémoire : ni le classement ni le changement de dresseur ne les perdent
+    assert ProfileManager.leaderboard()[0][:2] == ("Sacha", 2)
+    assert ProfileManager.switch_profile("Sacha")["badges"] == 2
+    ProfileManager.update_defeated_trainer("Agatha")
+    assert ProfileManager.switch_profile("Pierre")["badges"] == 0
+    assert ProfileManager.switch_profile("Sacha")["badges"] == 3